@@ -25,6 +25,7 @@ HITSTUN   = C["hitstun_ms"]
 FRICTION  = C["horizontal_friction"]
 
 STAGE     = Rect(*C["stage_rect"])
+STAGE_TOP, STAGE_LEFT, STAGE_RIGHT = STAGE.top, STAGE.left, STAGE.right
 PW, PH    = C["player_width"], C["player_height"]
 FACE      = C["face_size"]
 
@@ -43,6 +44,9 @@ def lerp(a, b, t):
 def lerp_col(lo, hi, t):
     return [round(lerp(lo[i], hi[i], t)) for i in range(3)]
 
+# damage bar colour for every whole damage value up to the 200% cap
+BAR_LUT = tuple(tuple(lerp_col(BAR_LO, BAR_HI, i / 200.0)) for i in range(201))
+
 # ------------------------------------------------------------- PLAYER CLASS
 class Player:
     def __init__(self, x, y, body_c, face_c, keys):
@@ -62,16 +66,20 @@ class Player:
         self.last_atk    = -ATK_CD
         self.hitstun_end = 0
 
+        self.dmg_txt     = None       # rendered damage label, keyed by dmg_txt_val
+        self.dmg_txt_val = None
+        self.prev_rect   = Rect(0, 0, 0, 0)   # screen area drawn last frame
+
     # ------------------------------------------------ INPUT
-    def handle_input(self, k, now):
+    def handle_input(self, held, now):
         if now < self.hitstun_end:
-            self.prev_jump = k[self.keys["jump"]]
+            self.prev_jump = self.keys["jump"] in held
             return
 
         input_x = 0
-        if k[self.keys["left"]]:
+        if self.keys["left"] in held:
             input_x, self.facing = -1, -1
-        if k[self.keys["right"]]:
+        if self.keys["right"] in held:
             input_x, self.facing =  1,  1
 
         if self.on_ground:
@@ -81,7 +89,7 @@ class Player:
             self.vel.x += (target - self.vel.x) * AIR_CTR
 
         # Jump on key-down only
-        jump_now = k[self.keys["jump"]]
+        jump_now = self.keys["jump"] in held
         if jump_now and not self.prev_jump and self.on_ground:
             self.vel.y = JUMP_VEL
             self.on_ground = False
@@ -89,24 +97,29 @@ class Player:
 
     # ------------------------------------------------ PHYSICS
     def physics(self):
-        self.vel.x *= FRICTION
-        self.vel.y += GRAVITY
-        self.pos   += self.vel
+        vel, pos, r = self.vel, self.pos, self.rect
+        vx = vel.x * FRICTION
+        vy = vel.y + GRAVITY
+        px = pos.x + vx
+        py = pos.y + vy
 
         # ------- FIX: update rect *before* collision test -------
-        self.rect.topleft = self.pos
+        r.topleft = (px, py)
 
         # stage collision (inclusive edges)
-        if (self.rect.bottom >= STAGE.top and
-            STAGE.left <= self.rect.centerx <= STAGE.right):
+        if (r.bottom >= STAGE_TOP and
+            STAGE_LEFT <= r.centerx <= STAGE_RIGHT):
             # clamp to floor
-            self.rect.bottom = STAGE.top
-            self.pos.y = self.rect.top
-            self.vel.y = 0
+            r.bottom = STAGE_TOP
+            py = r.top
+            vy = 0
             self.on_ground = True
         else:
             self.on_ground = False
 
+        vel.update(vx, vy)
+        pos.update(px, py)
+
     # ------------------------------------------------ ATTACKS
     def pressed_attack(self, now):
         if now - self.last_atk >= ATK_CD:
@@ -133,12 +146,14 @@ class Player:
     # ------------------------------------------------ DRAW
     def draw(self, surf, now, font):
         # capsule body
-        pygame.draw.rect(surf, self.body_c,
-                         (self.rect.x, self.rect.y + FACE, PW, PH - 2*FACE))
-        pygame.draw.circle(surf, self.body_c,
-                           (self.rect.centerx, self.rect.y + FACE), FACE)
-        pygame.draw.circle(surf, self.body_c,
-                           (self.rect.centerx, self.rect.bottom - FACE), FACE)
+        drawn = [
+            pygame.draw.rect(surf, self.body_c,
+                             (self.rect.x, self.rect.y + FACE, PW, PH - 2*FACE)),
+            pygame.draw.circle(surf, self.body_c,
+                               (self.rect.centerx, self.rect.y + FACE), FACE),
+            pygame.draw.circle(surf, self.body_c,
+                               (self.rect.centerx, self.rect.bottom - FACE), FACE),
+        ]
 
         # face indicator
         eye = (self.rect.centerx + self.facing * (FACE // 2),
@@ -147,22 +162,30 @@ class Player:
 
         # attack flash
         if self.attacking(now):
-            pygame.draw.rect(surf, COL["attack_flash"], self.hitbox(), 2)
-
-        # damage UI
-        dmg_txt = font.render(f"{self.damage}%", True, COL["text"])
-        surf.blit(dmg_txt,
-                  dmg_txt.get_rect(center=(self.rect.centerx,
-                                           self.rect.y - 28)))
+            drawn.append(pygame.draw.rect(surf, COL["attack_flash"],
+                                          self.hitbox(), 2))
+
+        # damage UI (label only re-rendered when damage changes)
+        if self.dmg_txt_val != self.damage:
+            self.dmg_txt     = font.render(f"{self.damage}%", True, COL["text"])
+            self.dmg_txt_val = self.damage
+        dmg_txt = self.dmg_txt
+        drawn.append(surf.blit(dmg_txt,
+                               dmg_txt.get_rect(center=(self.rect.centerx,
+                                                        self.rect.y - 28))))
 
         t = min(self.damage / 200.0, 1.0)
-        bar_col = lerp_col(BAR_LO, BAR_HI, t)
+        bar_col = BAR_LUT[min(int(self.damage), 200)]
         pygame.draw.rect(surf, bar_col,
                          (self.rect.centerx - BAR_W // 2, self.rect.y - 18,
                           BAR_W * t, BAR_H))
-        pygame.draw.rect(surf, COL["text"],
-                         (self.rect.centerx - BAR_W // 2, self.rect.y - 18,
-                          BAR_W, BAR_H), 1)
+        drawn.append(pygame.draw.rect(surf, COL["text"],
+                                      (self.rect.centerx - BAR_W // 2,
+                                       self.rect.y - 18, BAR_W, BAR_H), 1))
+
+        # remember the covered area so the next frame can erase it
+        self.prev_rect = drawn[0].unionall(drawn[1:])
+        return self.prev_rect
 
 # ------------------------------------------------------------- MAIN LOOP
 def main():
@@ -186,11 +209,18 @@ def main():
         dict(left=pygame.K_LEFT, right=pygame.K_RIGHT,
              jump=pygame.K_UP, attack=pygame.K_RCTRL))
 
+    # static backdrop, drawn once; later frames only patch sprite areas
+    background = pygame.Surface((SCR_W, SCR_H)).convert()
+    background.fill(COL["bg"])
+    pygame.draw.rect(background, COL["stage"], STAGE)
+    screen.blit(background, (0, 0))
+    pygame.display.flip()
+
     winner = None
+    held   = set()                # keys currently down, kept by KEYDOWN/KEYUP
     while True:
         dt  = clock.tick(FPS)
         now = pygame.time.get_ticks()
-        keys = pygame.key.get_pressed()
 
         for ev in pygame.event.get():
             if ev.type == pygame.QUIT:
@@ -199,14 +229,19 @@ def main():
             if ev.type == pygame.KEYDOWN and winner:
                 main()  # restart
                 return
+            if ev.type == pygame.KEYUP:
+                held.discard(ev.key)
+            if ev.type == pygame.WINDOWFOCUSLOST:
+                held.clear()      # KEYUPs are not delivered while unfocused
             if ev.type == pygame.KEYDOWN:
+                held.add(ev.key)
                 if ev.key == p1.keys["attack"]:
                     p1.pressed_attack(now)
                 if ev.key == p2.keys["attack"]:
                     p2.pressed_attack(now)
 
         if not winner:
-            p1.handle_input(keys, now);  p2.handle_input(keys, now)
+            p1.handle_input(held, now);  p2.handle_input(held, now)
             p1.physics();                p2.physics()
 
             if p1.attacking(now) and p1.hitbox().colliderect(p2.rect):
@@ -217,19 +252,22 @@ def main():
             if p1.rect.top > SCR_H: winner = "BLUE WINS!"
             elif p2.rect.top > SCR_H: winner = "RED WINS!"
 
-        # draw
-        screen.fill(COL["bg"])
-        pygame.draw.rect(screen, COL["stage"], STAGE)
+        # draw: restore the background under last frame's sprites, redraw
+        # them and push only the old + new areas to the display
+        dirty = [p1.prev_rect, p2.prev_rect]
+        for r in dirty:
+            screen.blit(background, r, r)
 
-        p1.draw(screen, now, font_small)
-        p2.draw(screen, now, font_small)
+        dirty.append(p1.draw(screen, now, font_small))
+        dirty.append(p2.draw(screen, now, font_small))
 
         if winner:
             txt = font_big.render(
                 winner + "  (press any key)", True, COL["text"])
-            screen.blit(txt, txt.get_rect(center=(SCR_W // 2, SCR_H // 3)))
+            dirty.append(screen.blit(
+                txt, txt.get_rect(center=(SCR_W // 2, SCR_H // 3))))
 
-        pygame.display.flip()
+        pygame.display.update(dirty)
 
 if __name__ == "__main__":
     main()
@@ -1,4 +1,5 @@
 import pygame
+import functools
 import math
 import random
 import sys
@@ -12,6 +13,19 @@ SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
 
+# Missiles collide when their centres are closer than HIT_RADIUS
+HIT_RADIUS = 10
+HIT_RADIUS_SQ = HIT_RADIUS * HIT_RADIUS
+
+# Broadphase grid cells are 1 << GRID_SHIFT (32 px), larger than HIT_RADIUS
+GRID_SHIFT = 5
+GRID_COLS = (SCREEN_WIDTH >> GRID_SHIFT) + 1
+GRID_ROWS = (SCREEN_HEIGHT >> GRID_SHIFT) + 1
+# Below this many missile pairs a plain double loop beats building the hash
+BRUTE_FORCE_PAIRS = 64
+# Upper bound on recycled Missile objects kept for reuse
+MISSILE_POOL_SIZE = 256
+
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -24,6 +38,39 @@ GRAY = (128, 128, 128)
 DARK_GREEN = (0, 100, 0)
 BROWN = (139, 69, 19)
 
+# Levels: (cities, launchers, frames between spawns, missile speed, missiles per wave)
+LEVELS = [
+    (3, 1, 120, 2.0, 5),   # Level 1: 1 launcher, 3 cities, slow missiles
+    (4, 1, 100, 2.5, 6),   # Level 2: 1 launcher, 4 cities, slightly faster
+    (5, 2, 80, 3.0, 7),    # Level 3: 2 launchers, 5 cities, faster missiles
+    (6, 2, 60, 3.5, 8),    # Level 4: 2 launchers, 6 cities, even faster
+    (7, 3, 50, 4.0, 10),   # Level 5: 3 launchers, 7 cities, very fast
+]
+
+# Missile effects
+TRAIL_LENGTH = 10
+MAX_EXPLOSION_RADIUS = 30
+MAX_EXPLOSION_DURATION = 20
+
+def _make_trail_surface(color, alpha):
+    surface = pygame.Surface((6, 6), pygame.SRCALPHA)
+    pygame.draw.circle(surface, (*color, alpha), (3, 3), 2)
+    return surface
+
+def _make_explosion_surface(duration):
+    radius = (duration / MAX_EXPLOSION_DURATION) * MAX_EXPLOSION_RADIUS
+    alpha = 255 - (duration * 255 // MAX_EXPLOSION_DURATION)
+    surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surface, (*ORANGE, alpha), (radius, radius), radius)
+    return surface
+
+# Pre-rendered trail dots (one per fade step) and explosion frames (one per tick)
+_TRAIL_SURFS = {
+    color: [_make_trail_surface(color, 255 - (i * 255 // TRAIL_LENGTH)) for i in range(1, TRAIL_LENGTH + 1)]
+    for color in (RED, GREEN)
+}
+_EXPLOSION_SURFS = [_make_explosion_surface(duration) for duration in range(MAX_EXPLOSION_DURATION)]
+
 class City:
     def __init__(self, x: int, y: int):
         self.x = x
@@ -33,10 +80,11 @@ class City:
         self.destroyed = False
         self.health = 100
         
-    def draw(self, screen):
+    def draw(self, screen) -> pygame.Rect:
+        # Returns the screen area covered by the city
         if not self.destroyed:
             # City building
-            pygame.draw.rect(screen, GRAY, (self.x, self.y, self.width, self.height))
+            area = pygame.draw.rect(screen, GRAY, (self.x, self.y, self.width, self.height))
             # Windows
             for i in range(3):
                 for j in range(2):
@@ -45,12 +93,13 @@ class City:
                     pygame.draw.rect(screen, YELLOW, (window_x, window_y, 4, 4))
         else:
             # Destroyed city (rubble)
-            pygame.draw.rect(screen, BROWN, (self.x, self.y, self.width, self.height))
+            area = pygame.draw.rect(screen, BROWN, (self.x, self.y, self.width, self.height))
             # Rubble details
             for i in range(5):
                 rubble_x = self.x + random.randint(0, self.width - 5)
                 rubble_y = self.y + random.randint(0, self.height - 5)
-                pygame.draw.circle(screen, DARK_GREEN, (rubble_x, rubble_y), 2)
+                area.union_ip(pygame.draw.circle(screen, DARK_GREEN, (rubble_x, rubble_y), 2))
+        return area
 
 class MissileLauncher:
     def __init__(self, x: int, y: int):
@@ -61,13 +110,15 @@ class MissileLauncher:
         self.reload_time = 0
         self.reload_delay = 30  # frames between shots
         
-    def draw(self, screen):
+    def draw(self, screen) -> pygame.Rect:
         # Launcher base
         pygame.draw.rect(screen, DARK_GREEN, (self.x, self.y, self.width, self.height))
         # Launcher barrel
         pygame.draw.rect(screen, GRAY, (self.x + 5, self.y - 10, 10, 15))
         # Radar dish
         pygame.draw.circle(screen, BLUE, (self.x + self.width // 2, self.y + 5), 8)
+        # Base plus barrel, which also contains the dish
+        return pygame.Rect(self.x, self.y - 10, self.width, self.height + 10)
         
     def can_fire(self) -> bool:
         return self.reload_time <= 0
@@ -83,7 +134,15 @@ class MissileLauncher:
             self.reload_time -= 1
 
 class Missile:
+    __slots__ = ("x", "y", "target_x", "target_y", "speed", "is_defense", "exploded",
+                 "explosion_radius", "max_explosion_radius", "explosion_duration",
+                 "max_explosion_duration", "dx", "dy")
+    
     def __init__(self, x: int, y: int, target_x: int, target_y: int, speed: float, is_defense: bool = False):
+        self.init(x, y, target_x, target_y, speed, is_defense)
+        
+    def init(self, x: int, y: int, target_x: int, target_y: int, speed: float, is_defense: bool = False):
+        # Reset every field so pooled missiles can be reused
         self.x = x
         self.y = y
         self.target_x = target_x
@@ -92,132 +151,92 @@ class Missile:
         self.is_defense = is_defense
         self.exploded = False
         self.explosion_radius = 0
-        self.max_explosion_radius = 30
+        self.max_explosion_radius = MAX_EXPLOSION_RADIUS
         self.explosion_duration = 0
-        self.max_explosion_duration = 20
+        self.max_explosion_duration = MAX_EXPLOSION_DURATION
         
         # Calculate direction
         dx = target_x - x
         dy = target_y - y
-        distance = math.sqrt(dx**2 + dy**2)
+        distance = math.hypot(dx, dy)
         if distance > 0:
-            self.dx = (dx / distance) * speed
-            self.dy = (dy / distance) * speed
+            scale = speed / distance
+            self.dx = dx * scale
+            self.dy = dy * scale
         else:
             self.dx = 0
             self.dy = speed
             
-    def update(self):
-        if not self.exploded:
-            self.x += self.dx
-            self.y += self.dy
-        else:
-            self.explosion_duration += 1
-            if self.explosion_duration < self.max_explosion_duration:
-                self.explosion_radius = (self.explosion_duration / self.max_explosion_duration) * self.max_explosion_radius
-                
-    def draw(self, screen):
-        if not self.exploded:
-            # Missile body
-            color = GREEN if self.is_defense else RED
-            pygame.draw.circle(screen, color, (int(self.x), int(self.y)), 3)
-            # Missile trail
-            trail_length = 10
-            for i in range(1, trail_length + 1):
-                alpha = 255 - (i * 255 // trail_length)
-                trail_color = (*color, alpha)
-                trail_surface = pygame.Surface((6, 6), pygame.SRCALPHA)
-                pygame.draw.circle(trail_surface, trail_color, (3, 3), 2)
-                trail_x = int(self.x - self.dx * i * 0.5)
-                trail_y = int(self.y - self.dy * i * 0.5)
-                screen.blit(trail_surface, (trail_x - 3, trail_y - 3))
-        else:
-            # Explosion
-            if self.explosion_duration < self.max_explosion_duration:
-                alpha = 255 - (self.explosion_duration * 255 // self.max_explosion_duration)
-                explosion_color = (*ORANGE, alpha)
-                explosion_surface = pygame.Surface((self.explosion_radius * 2, self.explosion_radius * 2), pygame.SRCALPHA)
-                pygame.draw.circle(explosion_surface, explosion_color, (self.explosion_radius, self.explosion_radius), self.explosion_radius)
-                screen.blit(explosion_surface, (int(self.x - self.explosion_radius), int(self.y - self.explosion_radius)))
-                
     def check_collision(self, other_missile) -> bool:
         if self.exploded or other_missile.exploded:
             return False
-        distance = math.sqrt((self.x - other_missile.x)**2 + (self.y - other_missile.y)**2)
-        return distance < 10
-        
-    def check_city_hit(self, city) -> bool:
-        if self.exploded or city.destroyed:
-            return False
-        return (self.x >= city.x and self.x <= city.x + city.width and 
-                self.y >= city.y and self.y <= city.y + city.height)
+        dx = self.x - other_missile.x
+        dy = self.y - other_missile.y
+        return dx * dx + dy * dy < HIT_RADIUS_SQ
+
+@functools.lru_cache(maxsize=256)
+def _render(font, text, color):
+    # UI text rarely changes between frames, so reuse the rendered surface
+    return font.render(text, True, color)
 
 class Game:
+    _missile_pool: List[Missile] = []
+    
     def __init__(self):
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Missile Defender")
         self.clock = pygame.time.Clock()
+        _render.cache_clear()  # drop surfaces rendered with the previous game's fonts
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         
+        # Static backdrop; each frame only the areas drawn last frame are
+        # restored from it and pushed to the display
+        self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.background.fill(BLACK)
+        pygame.draw.rect(self.background, DARK_GREEN, (0, SCREEN_HEIGHT - 20, SCREEN_WIDTH, 20))
+        self.dirty_rects = []
+        self.full_redraw = True
+        
         self.level = 1
         self.score = 0
         self.cities = []
         self.launchers = []
         self.attack_missiles = []
         self.defense_missiles = []
+        # Uniform broadphase grid of attack missiles, refilled every frame
+        self.grid = [[] for _ in range(GRID_COLS * GRID_ROWS)]
+        self._used_cells = []
         self.game_state = "playing"  # "playing", "game_over", "victory"
         
         self.setup_level()
         
     def setup_level(self):
         # Clear existing objects
+        for missile in self.attack_missiles:
+            self._release_missile(missile)
+        for missile in self.defense_missiles:
+            self._release_missile(missile)
         self.cities.clear()
+        self.alive_cities_cache = []
+        self.alive_city_count = 0
         self.launchers.clear()
         self.attack_missiles.clear()
         self.defense_missiles.clear()
         
         # Setup based on level
-        if self.level == 1:
-            # Level 1: 1 launcher, 3 cities, slow missiles
-            self.setup_cities(3)
-            self.setup_launchers(1)
-            self.missile_spawn_rate = 120  # frames between missile spawns
-            self.missile_speed = 2.0
-            self.missiles_per_wave = 5
-        elif self.level == 2:
-            # Level 2: 1 launcher, 4 cities, slightly faster
-            self.setup_cities(4)
-            self.setup_launchers(1)
-            self.missile_spawn_rate = 100
-            self.missile_speed = 2.5
-            self.missiles_per_wave = 6
-        elif self.level == 3:
-            # Level 3: 2 launchers, 5 cities, faster missiles
-            self.setup_cities(5)
-            self.setup_launchers(2)
-            self.missile_spawn_rate = 80
-            self.missile_speed = 3.0
-            self.missiles_per_wave = 7
-        elif self.level == 4:
-            # Level 4: 2 launchers, 6 cities, even faster
-            self.setup_cities(6)
-            self.setup_launchers(2)
-            self.missile_spawn_rate = 60
-            self.missile_speed = 3.5
-            self.missiles_per_wave = 8
-        elif self.level == 5:
-            # Level 5: 3 launchers, 7 cities, very fast
-            self.setup_cities(7)
-            self.setup_launchers(3)
-            self.missile_spawn_rate = 50
-            self.missile_speed = 4.0
-            self.missiles_per_wave = 10
-        else:
+        if self.level > len(LEVELS):
             # Victory!
             self.game_state = "victory"
             return
             
+        num_cities, num_launchers, spawn_rate, speed, per_wave = LEVELS[self.level - 1]
+        self.setup_cities(num_cities)
+        self.setup_launchers(num_launchers)
+        self.missile_spawn_rate = spawn_rate  # frames between missile spawns
+        self.missile_speed = speed
+        self.missiles_per_wave = per_wave
+            
         self.missile_spawn_timer = 0
         self.missiles_spawned = 0
         self.wave_complete = False
@@ -232,6 +251,16 @@ class Game:
             y = SCREEN_HEIGHT - 50
             self.cities.append(City(x, y))
             
+        # All cities share one row, so a single band rejects airborne missiles
+        row = self.cities[0]
+        self.cities_band_top = row.y
+        self.cities_band_bottom = row.y + row.height
+        self._city_bounds = [(city.x, city.x + city.width) for city in self.cities]
+        
+        # Kept in sync on destruction so nothing has to rescan the city list
+        self.alive_cities_cache = list(self.cities)
+        self.alive_city_count = len(self.cities)
+            
     def setup_launchers(self, num_launchers: int):
         launcher_width = 20
         spacing = (SCREEN_WIDTH - 100) // (num_launchers + 1)
@@ -242,16 +271,26 @@ class Game:
             y = SCREEN_HEIGHT - 100
             self.launchers.append(MissileLauncher(x, y))
             
+    def _acquire_missile(self, x, y, target_x, target_y, speed, is_defense):
+        if self._missile_pool:
+            missile = self._missile_pool.pop()
+            missile.init(x, y, target_x, target_y, speed, is_defense)
+            return missile
+        return Missile(x, y, target_x, target_y, speed, is_defense)
+        
+    def _release_missile(self, missile):
+        if len(self._missile_pool) < MISSILE_POOL_SIZE:
+            self._missile_pool.append(missile)
+            
     def spawn_attack_missile(self):
         if self.missiles_spawned >= self.missiles_per_wave:
             return
             
         # Choose random city as target
-        alive_cities = [city for city in self.cities if not city.destroyed]
-        if not alive_cities:
+        if self.alive_city_count == 0:
             return
             
-        target_city = random.choice(alive_cities)
+        target_city = random.choice(self.alive_cities_cache)
         target_x = target_city.x + target_city.width // 2
         target_y = target_city.y + target_city.height // 2
         
@@ -259,7 +298,7 @@ class Game:
         spawn_x = random.randint(50, SCREEN_WIDTH - 50)
         spawn_y = -20
         
-        missile = Missile(spawn_x, spawn_y, target_x, target_y, self.missile_speed, False)
+        missile = self._acquire_missile(spawn_x, spawn_y, target_x, target_y, self.missile_speed, False)
         self.attack_missiles.append(missile)
         self.missiles_spawned += 1
         
@@ -272,26 +311,101 @@ class Game:
                     return False
                 elif event.key == pygame.K_SPACE and self.game_state in ["game_over", "victory"]:
                     self.__init__()  # Restart game
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                # Left click fires one missile from the nearest ready launcher
+                if self.game_state == "playing":
+                    self.fire_defense_missile(event.pos)
                     
-        # Mouse input for firing missiles
-        if self.game_state == "playing":
-            mouse_pos = pygame.mouse.get_pos()
-            if pygame.mouse.get_pressed()[0]:  # Left click
-                for launcher in self.launchers:
-                    if launcher.can_fire():
-                        defense_missile = Missile(
-                            launcher.x + launcher.width // 2,
-                            launcher.y,
-                            mouse_pos[0],
-                            mouse_pos[1],
-                            5.0,  # Defense missiles are faster
-                            True
-                        )
-                        self.defense_missiles.append(defense_missile)
-                        launcher.fire()
-                        
         return True
         
+    def fire_defense_missile(self, target):
+        mx, my = target
+        ready = [launcher for launcher in self.launchers if launcher.can_fire()]
+        if not ready:
+            return
+            
+        launcher = min(ready, key=lambda l: (l.x + l.width // 2 - mx) ** 2 + (l.y - my) ** 2)
+        defense_missile = self._acquire_missile(
+            launcher.x + launcher.width // 2,
+            launcher.y,
+            mx,
+            my,
+            5.0,  # Defense missiles are faster
+            True
+        )
+        self.defense_missiles.append(defense_missile)
+        launcher.fire()
+        
+    def _advance_missiles(self, missiles, min_y, max_y, in_band=None):
+        # Move live missiles, grow explosions and drop finished or off-screen
+        # missiles back into the pool, returning the survivors
+        band_top = self.cities_band_top
+        band_bottom = self.cities_band_bottom
+        survivors = []
+        for missile in missiles:
+            if missile.exploded:
+                duration = missile.explosion_duration + 1
+                missile.explosion_duration = duration
+                if duration >= MAX_EXPLOSION_DURATION:
+                    self._release_missile(missile)
+                    continue
+                missile.explosion_radius = (duration / MAX_EXPLOSION_DURATION) * MAX_EXPLOSION_RADIUS
+            else:
+                missile.x += missile.dx
+                y = missile.y + missile.dy
+                missile.y = y
+                if y < min_y or y > max_y:
+                    self._release_missile(missile)
+                    continue
+                if in_band is not None and band_top <= y <= band_bottom:
+                    in_band.append(missile)
+            survivors.append(missile)
+        return survivors
+        
+    def check_missile_collisions(self):
+        live_attack = [missile for missile in self.attack_missiles if not missile.exploded]
+        live_defense = [missile for missile in self.defense_missiles if not missile.exploded]
+        if not live_attack or not live_defense:
+            return
+            
+        if len(live_attack) * len(live_defense) <= BRUTE_FORCE_PAIRS:
+            for defense_missile in live_defense:
+                for attack_missile in live_attack:
+                    if defense_missile.check_collision(attack_missile):
+                        defense_missile.exploded = True
+                        attack_missile.exploded = True
+                        self.score += 100
+            return
+            
+        # Bucket attack missiles into the grid, then test each defense missile
+        # against its own cell and the 8 neighbours. Off-screen positions are
+        # clamped to the border cells, which keeps neighbouring cells adjacent.
+        grid = self.grid
+        used_cells = self._used_cells
+        for index in used_cells:
+            grid[index].clear()
+        used_cells.clear()
+        
+        for attack_missile in live_attack:
+            cx = min(max(int(attack_missile.x) >> GRID_SHIFT, 0), GRID_COLS - 1)
+            cy = min(max(int(attack_missile.y) >> GRID_SHIFT, 0), GRID_ROWS - 1)
+            index = cy * GRID_COLS + cx
+            if not grid[index]:
+                used_cells.append(index)
+            grid[index].append(attack_missile)
+            
+        for defense_missile in live_defense:
+            cx = min(max(int(defense_missile.x) >> GRID_SHIFT, 0), GRID_COLS - 1)
+            cy = min(max(int(defense_missile.y) >> GRID_SHIFT, 0), GRID_ROWS - 1)
+            for ny in range(max(cy - 1, 0), min(cy + 2, GRID_ROWS)):
+                row = ny * GRID_COLS
+                for nx in range(max(cx - 1, 0), min(cx + 2, GRID_COLS)):
+                    for attack_missile in grid[row + nx]:
+                        if defense_missile.check_collision(attack_missile):
+                            defense_missile.exploded = True
+                            attack_missile.exploded = True
+                            self.score += 100
+                            
     def update(self):
         if self.game_state != "playing":
             return
@@ -306,114 +420,139 @@ class Game:
             self.spawn_attack_missile()
             self.missile_spawn_timer = 0
             
-        # Update missiles
-        for missile in self.attack_missiles[:]:
-            missile.update()
-            if missile.exploded and missile.explosion_duration >= missile.max_explosion_duration:
-                self.attack_missiles.remove(missile)
-            elif missile.y > SCREEN_HEIGHT + 50:
-                self.attack_missiles.remove(missile)
-                
-        for missile in self.defense_missiles[:]:
-            missile.update()
-            if missile.exploded and missile.explosion_duration >= missile.max_explosion_duration:
-                self.defense_missiles.remove(missile)
-            elif missile.y < -50:
-                self.defense_missiles.remove(missile)
+        # Advance and cull each missile list in one pass. Attack missiles that
+        # end up in the city row are collected so the hit test only sees them.
+        in_band = []
+        self.attack_missiles = self._advance_missiles(self.attack_missiles, -math.inf, SCREEN_HEIGHT + 50, in_band)
+        self.defense_missiles = self._advance_missiles(self.defense_missiles, -50, math.inf)
                 
         # Check missile collisions
-        for defense_missile in self.defense_missiles[:]:
-            for attack_missile in self.attack_missiles[:]:
-                if defense_missile.check_collision(attack_missile):
-                    defense_missile.exploded = True
-                    attack_missile.exploded = True
-                    self.score += 100
+        self.check_missile_collisions()
                     
         # Check city hits
-        for missile in self.attack_missiles[:]:
-            for city in self.cities:
-                if missile.check_city_hit(city):
+        for missile in in_band:
+            if missile.exploded:
+                continue
+            x = missile.x
+            for city, (left, right) in zip(self.cities, self._city_bounds):
+                if not city.destroyed and left <= x <= right:
                     city.destroyed = True
+                    self.alive_city_count -= 1
+                    self.alive_cities_cache.remove(city)
                     missile.exploded = True
                     self.score -= 200
+                    break
                     
         # Check level completion
         if self.missiles_spawned >= self.missiles_per_wave and len(self.attack_missiles) == 0:
-            alive_cities = [city for city in self.cities if not city.destroyed]
-            if alive_cities:
+            if self.alive_city_count > 0:
                 self.level += 1
                 self.setup_level()
             else:
                 self.game_state = "game_over"
                 
         # Check game over
-        alive_cities = [city for city in self.cities if not city.destroyed]
-        if not alive_cities:
+        if self.alive_city_count == 0:
             self.game_state = "game_over"
             
     def draw(self):
-        self.screen.fill(BLACK)
-        
-        # Draw ground
-        pygame.draw.rect(self.screen, DARK_GREEN, (0, SCREEN_HEIGHT - 20, SCREEN_WIDTH, 20))
+        screen = self.screen
+        background = self.background
+        if self.full_redraw:
+            screen.blit(background, (0, 0))
+        else:
+            # Erase last frame's drawing by restoring the background under it
+            screen.blits([(background, rect, rect) for rect in self.dirty_rects], False)
+        previous_rects = self.dirty_rects
+        self.dirty_rects = []
         
         # Draw cities
         for city in self.cities:
-            city.draw(self.screen)
+            self.dirty_rects.append(city.draw(screen))
             
         # Draw launchers
         for launcher in self.launchers:
-            launcher.draw(self.screen)
+            self.dirty_rects.append(launcher.draw(screen))
             
         # Draw missiles
-        for missile in self.attack_missiles:
-            missile.draw(self.screen)
-        for missile in self.defense_missiles:
-            missile.draw(self.screen)
+        self.draw_missiles(self.attack_missiles, RED)
+        self.draw_missiles(self.defense_missiles, GREEN)
             
         # Draw UI
         self.draw_ui()
         
-        pygame.display.flip()
+        # Push only the regions that changed since the last frame
+        if self.full_redraw:
+            pygame.display.flip()
+            self.full_redraw = False
+        else:
+            pygame.display.update(previous_rects + self.dirty_rects)
         
+    def draw_missiles(self, missiles, color):
+        # Trails and explosions are collected into one blits() batch, then the
+        # missile heads are drawn on top in a single loop
+        trail_surfaces = _TRAIL_SURFS[color]
+        blits = []
+        heads = []
+        for missile in missiles:
+            x = missile.x
+            y = missile.y
+            if missile.exploded:
+                radius = missile.explosion_radius
+                blits.append((_EXPLOSION_SURFS[missile.explosion_duration], (int(x - radius), int(y - radius))))
+                continue
+            heads.append((int(x), int(y)))
+            step_x = missile.dx * 0.5
+            step_y = missile.dy * 0.5
+            for i, trail_surface in enumerate(trail_surfaces, 1):
+                blits.append((trail_surface, (int(x - step_x * i) - 3, int(y - step_y * i) - 3)))
+                
+        screen = self.screen
+        dirty_rects = self.dirty_rects
+        dirty_rects.extend(screen.blits(blits))
+        draw_circle = pygame.draw.circle
+        for head in heads:
+            dirty_rects.append(draw_circle(screen, color, head, 3))
+            
     def draw_ui(self):
+        dirty_rects = self.dirty_rects
+        
         # Level and score
-        level_text = self.font.render(f"Level: {self.level}", True, WHITE)
-        score_text = self.font.render(f"Score: {self.score}", True, WHITE)
-        self.screen.blit(level_text, (10, 10))
-        self.screen.blit(score_text, (10, 50))
+        level_text = _render(self.font, f"Level: {self.level}", WHITE)
+        score_text = _render(self.font, f"Score: {self.score}", WHITE)
+        dirty_rects.append(self.screen.blit(level_text, (10, 10)))
+        dirty_rects.append(self.screen.blit(score_text, (10, 50)))
         
         # Cities remaining
-        alive_cities = len([city for city in self.cities if not city.destroyed])
-        cities_text = self.small_font.render(f"Cities: {alive_cities}/{len(self.cities)}", True, WHITE)
-        self.screen.blit(cities_text, (10, 90))
+        cities_text = _render(self.small_font, f"Cities: {self.alive_city_count}/{len(self.cities)}", WHITE)
+        dirty_rects.append(self.screen.blit(cities_text, (10, 90)))
         
         # Instructions
         if self.game_state == "playing":
-            instructions = self.small_font.render("Click to fire missiles at incoming threats!", True, WHITE)
-            self.screen.blit(instructions, (SCREEN_WIDTH // 2 - instructions.get_width() // 2, 10))
+            instructions = _render(self.small_font, "Click to fire missiles at incoming threats!", WHITE)
+            dirty_rects.append(self.screen.blit(instructions, (SCREEN_WIDTH // 2 - instructions.get_width() // 2, 10)))
             
         # Game over screen
         elif self.game_state == "game_over":
-            game_over_text = self.font.render("GAME OVER", True, RED)
-            final_score_text = self.font.render(f"Final Score: {self.score}", True, WHITE)
-            restart_text = self.small_font.render("Press SPACE to restart", True, WHITE)
+            game_over_text = _render(self.font, "GAME OVER", RED)
+            final_score_text = _render(self.font, f"Final Score: {self.score}", WHITE)
+            restart_text = _render(self.small_font, "Press SPACE to restart", WHITE)
             
-            self.screen.blit(game_over_text, (SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, SCREEN_HEIGHT // 2 - 60))
-            self.screen.blit(final_score_text, (SCREEN_WIDTH // 2 - final_score_text.get_width() // 2, SCREEN_HEIGHT // 2 - 20))
-            self.screen.blit(restart_text, (SCREEN_WIDTH // 2 - restart_text.get_width() // 2, SCREEN_HEIGHT // 2 + 20))
+            dirty_rects.append(self.screen.blit(game_over_text, (SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, SCREEN_HEIGHT // 2 - 60)))
+            dirty_rects.append(self.screen.blit(final_score_text, (SCREEN_WIDTH // 2 - final_score_text.get_width() // 2, SCREEN_HEIGHT // 2 - 20)))
+            dirty_rects.append(self.screen.blit(restart_text, (SCREEN_WIDTH // 2 - restart_text.get_width() // 2, SCREEN_HEIGHT // 2 + 20)))
             
         # Victory screen
         elif self.game_state == "victory":
-            victory_text = self.font.render("VICTORY!", True, GREEN)
-            congrats_text = self.font.render("Congratulations! You've defended all cities!", True, WHITE)
-            final_score_text = self.font.render(f"Final Score: {self.score}", True, WHITE)
-            restart_text = self.small_font.render("Press SPACE to play again", True, WHITE)
+            victory_text = _render(self.font, "VICTORY!", GREEN)
+            congrats_text = _render(self.font, "Congratulations! You've defended all cities!", WHITE)
+            final_score_text = _render(self.font, f"Final Score: {self.score}", WHITE)
+            restart_text = _render(self.small_font, "Press SPACE to play again", WHITE)
             
-            self.screen.blit(victory_text, (SCREEN_WIDTH // 2 - victory_text.get_width() // 2, SCREEN_HEIGHT // 2 - 80))
-            self.screen.blit(congrats_text, (SCREEN_WIDTH // 2 - congrats_text.get_width() // 2, SCREEN_HEIGHT // 2 - 40))
-            self.screen.blit(final_score_text, (SCREEN_WIDTH // 2 - final_score_text.get_width() // 2, SCREEN_HEIGHT // 2))
-            self.screen.blit(restart_text, (SCREEN_WIDTH // 2 - restart_text.get_width() // 2, SCREEN_HEIGHT // 2 + 40))
+            dirty_rects.append(self.screen.blit(victory_text, (SCREEN_WIDTH // 2 - victory_text.get_width() // 2, SCREEN_HEIGHT // 2 - 80)))
+            dirty_rects.append(self.screen.blit(congrats_text, (SCREEN_WIDTH // 2 - congrats_text.get_width() // 2, SCREEN_HEIGHT // 2 - 40)))
+            dirty_rects.append(self.screen.blit(final_score_text, (SCREEN_WIDTH // 2 - final_score_text.get_width() // 2, SCREEN_HEIGHT // 2)))
+            dirty_rects.append(self.screen.blit(restart_text, (SCREEN_WIDTH // 2 - restart_text.get_width() // 2, SCREEN_HEIGHT // 2 + 40)))
             
     def run(self):
         running = True
@@ -3,6 +3,7 @@ import math
 import random
 import sys
 from typing import List, Tuple, Optional
+import numpy as np
 
 # Initialize pygame
 pygame.init()
@@ -12,6 +13,20 @@ SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
 
+# Capacity of the projectile buffers
+MAX_MISSILES = 64
+MAX_INTERCEPTORS = 64
+MAX_EXPLOSIONS = 64
+
+# An interceptor hits a missile within this radius; compared squared
+HIT_RADIUS = 8
+HIT_RADIUS_SQ = HIT_RADIUS * HIT_RADIUS
+
+# Projectile sprites are cached per direction, quantized to this many buckets
+ANGLE_BUCKETS = 32
+SPRITE_SIZE = 24
+SPRITE_CENTER = SPRITE_SIZE // 2
+
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -24,104 +39,117 @@ GRAY = (128, 128, 128)
 DARK_GREEN = (0, 100, 0)
 BROWN = (139, 69, 19)
 
-class Missile:
-    def __init__(self, x: float, y: float, target_x: float, target_y: float, speed: float):
-        self.x = x
-        self.y = y
-        self.target_x = target_x
-        self.target_y = target_y
-        self.speed = speed
-        self.active = True
-        
-        # Calculate direction
-        dx = target_x - x
-        dy = target_y - y
-        distance = math.sqrt(dx**2 + dy**2)
-        self.dx = (dx / distance) * speed if distance > 0 else 0
-        self.dy = (dy / distance) * speed if distance > 0 else speed
+class Projectiles:
+    # Structure-of-Arrays buffer for one kind of projectile; a slot is in
+    # use while its active flag is set
+    def __init__(self, capacity: int):
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        # Heading quantized to ANGLE_BUCKETS; fixed at spawn since projectiles fly straight
+        self.bucket = np.zeros(capacity, dtype=np.intp)
+        self.active = np.zeros(capacity, dtype=bool)
     
-    def update(self):
-        if self.active:
-            self.x += self.dx
-            self.y += self.dy
-    
-    def draw(self, screen):
-        if self.active:
-            # Draw missile trail
-            for i in range(5):
-                trail_x = self.x - self.dx * i * 0.2
-                trail_y = self.y - self.dy * i * 0.2
-                pygame.draw.circle(screen, ORANGE, (int(trail_x), int(trail_y)), 2 - i)
-            
-            # Draw missile
-            pygame.draw.circle(screen, RED, (int(self.x), int(self.y)), 4)
+    def clear(self):
+        self.active[:] = False
     
-    def check_collision(self, x: float, y: float, radius: float) -> bool:
-        if not self.active:
-            return False
-        distance = math.sqrt((self.x - x)**2 + (self.y - y)**2)
-        return distance < radius
-
-class Interceptor:
-    def __init__(self, x: float, y: float, target_x: float, target_y: float, speed: float):
-        self.x = x
-        self.y = y
-        self.target_x = target_x
-        self.target_y = target_y
-        self.speed = speed
-        self.active = True
-        
-        # Calculate direction
-        dx = target_x - x
-        dy = target_y - y
-        distance = math.sqrt(dx**2 + dy**2)
-        self.dx = (dx / distance) * speed if distance > 0 else 0
-        self.dy = (dy / distance) * speed if distance > 0 else speed
+    def has_free(self) -> bool:
+        return not self.active.all()
     
-    def update(self):
-        if self.active:
-            self.x += self.dx
-            self.y += self.dy
-    
-    def draw(self, screen):
-        if self.active:
-            # Draw interceptor trail
-            for i in range(3):
-                trail_x = self.x - self.dx * i * 0.3
-                trail_y = self.y - self.dy * i * 0.3
-                pygame.draw.circle(screen, YELLOW, (int(trail_x), int(trail_y)), 3 - i)
-            
-            # Draw interceptor
-            pygame.draw.circle(screen, GREEN, (int(self.x), int(self.y)), 5)
+    def spawn(self, origins, targets, speed: float) -> int:
+        # Launch one projectile per origin/target row, normalizing all the
+        # headings at once; returns how many fitted in the free slots
+        slots = np.flatnonzero(~self.active)
+        origins = np.asarray(origins, dtype=np.float64)[:len(slots)]
+        heading = np.asarray(targets, dtype=np.float64)[:len(slots)] - origins
+        distance = np.linalg.norm(heading, axis=1, keepdims=True)
+        vel = np.divide(heading, distance, out=np.zeros_like(heading), where=distance > 0) * speed
+        # Projectiles already on target fall straight down
+        vel[distance[:, 0] == 0] = (0, speed)
+        slots = slots[:len(origins)]
+        self.pos[slots] = origins
+        self.vel[slots] = vel
+        self.bucket[slots] = np.round(np.arctan2(vel[:, 1], vel[:, 0]) / (2 * np.pi) * ANGLE_BUCKETS).astype(np.intp) % ANGLE_BUCKETS
+        self.active[slots] = True
+        return len(slots)
+
+# Projectile state lives in Projectiles buffers; these classes only know how
+# to draw one projectile (head plus fading trail) from its position and
+# velocity, which is used to pre-render their sprites.
+class Projectile:
+    head_color = WHITE
+    head_radius = 4
+    trail_color = WHITE
+    trail_radius = 3
+    trail_segments = 3
+    trail_spacing = 0.3
     
-    def check_collision(self, x: float, y: float, radius: float) -> bool:
-        if not self.active:
-            return False
-        distance = math.sqrt((self.x - x)**2 + (self.y - y)**2)
-        return distance < radius
+    @classmethod
+    def draw(cls, screen, x: float, y: float, dx: float, dy: float):
+        # Draw trail, shrinking by a pixel per segment
+        for i in range(cls.trail_segments):
+            trail_x = x - dx * i * cls.trail_spacing
+            trail_y = y - dy * i * cls.trail_spacing
+            pygame.draw.circle(screen, cls.trail_color, (int(trail_x), int(trail_y)), cls.trail_radius - i)
+        
+        # Draw head
+        pygame.draw.circle(screen, cls.head_color, (int(x), int(y)), cls.head_radius)
+
+class Missile(Projectile):
+    head_color = RED
+    head_radius = 4
+    trail_color = ORANGE
+    trail_radius = 2
+    trail_segments = 5
+    trail_spacing = 0.2
+
+class Interceptor(Projectile):
+    head_color = GREEN
+    head_radius = 5
+    trail_color = YELLOW
+    trail_radius = 3
+    trail_segments = 3
+    trail_spacing = 0.3
+
+def make_projectile_sprite(kind, dx: float, dy: float) -> pygame.Surface:
+    # Render a projectile (head plus trail) centred on a transparent surface
+    sprite = pygame.Surface((SPRITE_SIZE, SPRITE_SIZE), pygame.SRCALPHA)
+    kind.draw(sprite, SPRITE_CENTER, SPRITE_CENTER, dx, dy)
+    return sprite.convert_alpha()
 
 class City:
+    # Shared sprites, rendered on first use (needs the display to exist)
+    _sprite_intact = None
+    _sprite_destroyed = None
+    
     def __init__(self, x: float, y: float):
         self.x = x
         self.y = y
         self.destroyed = False
         self.size = 20
     
-    def draw(self, screen):
-        if not self.destroyed:
-            # Draw city building
-            pygame.draw.rect(screen, GRAY, (self.x - 10, self.y - 15, 20, 15))
-            # Draw windows
-            pygame.draw.rect(screen, YELLOW, (self.x - 8, self.y - 12, 4, 4))
-            pygame.draw.rect(screen, YELLOW, (self.x + 4, self.y - 12, 4, 4))
-            pygame.draw.rect(screen, YELLOW, (self.x - 8, self.y - 6, 4, 4))
-            pygame.draw.rect(screen, YELLOW, (self.x + 4, self.y - 6, 4, 4))
-        else:
-            # Draw destroyed city
-            pygame.draw.rect(screen, RED, (self.x - 10, self.y - 15, 20, 15))
-            pygame.draw.line(screen, BLACK, (self.x - 10, self.y - 7), (self.x + 10, self.y - 7), 3)
+    @classmethod
+    def _build_sprites(cls):
+        # City building with windows
+        cls._sprite_intact = pygame.Surface((20, 15)).convert()
+        cls._sprite_intact.fill(GRAY)
+        for window in ((2, 3), (14, 3), (2, 9), (14, 9)):
+            pygame.draw.rect(cls._sprite_intact, YELLOW, (*window, 4, 4))
+        # Destroyed city
+        cls._sprite_destroyed = pygame.Surface((20, 15)).convert()
+        cls._sprite_destroyed.fill(RED)
+        pygame.draw.line(cls._sprite_destroyed, BLACK, (0, 8), (20, 8), 3)
+    
+    def blit_item(self) -> Tuple[pygame.Surface, Tuple[float, float]]:
+        # (sprite, position) pair for Surface.blits
+        if City._sprite_intact is None:
+            City._build_sprites()
+        sprite = City._sprite_destroyed if self.destroyed else City._sprite_intact
+        return sprite, (self.x - 10, self.y - 15)
 
 class Launcher:
+    # Shared sprite, rendered on first use (needs the display to exist)
+    _sprite = None
+    
     def __init__(self, x: float, y: float):
         self.x = x
         self.y = y
@@ -131,60 +159,164 @@ class Launcher:
     def can_fire(self) -> bool:
         return self.cooldown <= 0
     
-    def fire(self, target_x: float, target_y: float, speed: float) -> Interceptor:
+    def fire(self) -> bool:
         if self.can_fire():
             self.cooldown = self.cooldown_time
-            return Interceptor(self.x, self.y, target_x, target_y, speed)
-        return None
+            return True
+        return False
     
     def update(self):
         if self.cooldown > 0:
             self.cooldown -= 1
     
-    def draw(self, screen):
+    @classmethod
+    def _build_sprite(cls):
+        cls._sprite = pygame.Surface((30, 30), pygame.SRCALPHA)
         # Draw launcher base
-        pygame.draw.rect(screen, DARK_GREEN, (self.x - 15, self.y - 10, 30, 20))
+        pygame.draw.rect(cls._sprite, DARK_GREEN, (0, 10, 30, 20))
         # Draw launcher barrel
-        pygame.draw.rect(screen, BROWN, (self.x - 3, self.y - 20, 6, 20))
+        pygame.draw.rect(cls._sprite, BROWN, (12, 0, 6, 20))
+        cls._sprite = cls._sprite.convert_alpha()
+    
+    def blit_item(self) -> Tuple[pygame.Surface, Tuple[float, float]]:
+        # (sprite, position) pair for Surface.blits
+        if Launcher._sprite is None:
+            Launcher._build_sprite()
+        return Launcher._sprite, (self.x - 15, self.y - 20)
 
-class Explosion:
-    def __init__(self, x: float, y: float):
-        self.x = x
-        self.y = y
-        self.radius = 5
-        self.max_radius = 30
-        self.active = True
+class Explosions:
+    # Fixed-capacity Structure-of-Arrays buffer of growing explosions; a
+    # slot is in use while its active flag is set
+    START_RADIUS = 5
+    MAX_RADIUS = 30
+    GROWTH = 2
     
-    def update(self):
-        self.radius += 2
-        if self.radius >= self.max_radius:
-            self.active = False
-    
-    def draw(self, screen):
-        if self.active:
-            alpha = 255 - (self.radius / self.max_radius) * 255
-            color = (255, 255, 0, int(alpha))
-            # Create a surface for the explosion
-            explosion_surface = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(explosion_surface, color, (self.radius, self.radius), self.radius)
-            screen.blit(explosion_surface, (self.x - self.radius, self.y - self.radius))
+    def __init__(self, capacity: int):
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.radius = np.zeros(capacity, dtype=np.int32)
+        self.active = np.zeros(capacity, dtype=bool)
+    
+    def clear(self):
+        self.active[:] = False
+    
+    def spawn(self, x: float, y: float):
+        # argmin finds the first free slot; a full buffer drops the explosion
+        slot = self.active.argmin()
+        if self.active[slot]:
+            return
+        self.pos[slot] = (x, y)
+        self.radius[slot] = self.START_RADIUS
+        self.active[slot] = True
+    
+    def step(self):
+        self.radius[self.active] += self.GROWTH
+        self.active &= self.radius < self.MAX_RADIUS
+    
+    @staticmethod
+    def make_frame(radius: int, max_radius: int = 30) -> pygame.Surface:
+        alpha = 255 - (radius / max_radius) * 255
+        color = (255, 255, 0, int(alpha))
+        frame = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(frame, color, (radius, radius), radius)
+        return frame.convert_alpha()
+    
+    def draw(self, screen, frames: List[pygame.Surface]):
+        # frames holds one pre-rendered surface per radius, starting at
+        # START_RADIUS; all live explosions go to SDL in a single blits call
+        active = self.active
+        screen.blits([
+            (frames[radius - self.START_RADIUS], (x - radius, y - radius))
+            for (x, y), radius in zip(self.pos[active].tolist(), self.radius[active].tolist())
+        ], False)
+
+def step_simulation(missile_pos: np.ndarray, missile_vel: np.ndarray, missile_active: np.ndarray,
+                    interceptor_pos: np.ndarray, interceptor_vel: np.ndarray, interceptor_active: np.ndarray,
+                    city_x: np.ndarray, city_destroyed: np.ndarray) -> Tuple[int, List[int], List[Tuple[float, float]]]:
+    # Advance one frame of projectile simulation in place on the SoA arrays.
+    # Returns how many missiles reached the ground, the indices of cities
+    # destroyed this frame and the positions of missiles shot down, for the
+    # caller to score and draw.
+    lost_cities = []
+    intercepts = []
+    
+    # Update missiles: one vectorized step over the live slots
+    missile_pos[missile_active] += missile_vel[missile_active]
+    
+    # Check if missiles hit ground
+    grounded = np.flatnonzero(missile_active & (missile_pos[:, 1] >= SCREEN_HEIGHT))
+    if len(grounded):
+        missile_active[grounded] = False
+        # Horizontal distance from every grounded missile to every city
+        distances = np.abs(missile_pos[grounded, 0:1].astype(np.float64) - city_x[None, :])
+        # Each missile destroys the closest city still standing, in slot
+        # order so two missiles on the same frame never share a target
+        for row in distances:
+            row[city_destroyed] = np.inf
+            closest = row.argmin()
+            if np.isfinite(row[closest]):
+                city_destroyed[closest] = True
+                lost_cities.append(int(closest))
+    
+    # Update interceptors
+    interceptor_pos[interceptor_active] += interceptor_vel[interceptor_active]
+    
+    # Check collision with missiles: squared distances of every
+    # interceptor/missile pair in one broadcast
+    interceptor_idx = np.flatnonzero(interceptor_active)
+    missile_idx = np.flatnonzero(missile_active)
+    if len(interceptor_idx) and len(missile_idx):
+        diff = missile_pos[None, missile_idx, :] - interceptor_pos[interceptor_idx, None, :]
+        hits = (diff * diff).sum(axis=2) < HIT_RADIUS_SQ
+        # Resolve hits in interceptor order so each missile is claimed once
+        for row in np.flatnonzero(hits.any(axis=1)):
+            for m in missile_idx[hits[row]]:
+                if not missile_active[m]:
+                    continue
+                # Destroy both objects
+                intercepts.append(tuple(missile_pos[m].tolist()))
+                missile_active[m] = False
+                interceptor_active[interceptor_idx[row]] = False
+                break
+    
+    # Free interceptors that left the screen without hitting anything
+    x, y = interceptor_pos[:, 0], interceptor_pos[:, 1]
+    interceptor_active &= (x >= -10) & (x <= SCREEN_WIDTH + 10) & (y >= -10) & (y <= SCREEN_HEIGHT + 10)
+    
+    return len(grounded), lost_cities, intercepts
 
 class Game:
     def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # SCALED lets SDL present through its renderer, which is what makes vsync available
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SCALED, vsync=1)
         pygame.display.set_caption("Missile Defender")
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         
+        # (kind, speed) -> pre-rendered projectile sprites, one per angle bucket
+        self._sprite_cache = {}
+        # Rendered UI text: label -> (text, surface), re-rendered only when the text changes
+        self._text_cache = {}
+        # Semi-transparent overlay for the game over / win / level complete screens
+        self._overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self._overlay.set_alpha(128)
+        self._overlay.fill(BLACK)
+        # Static scene behind the projectiles, rebuilt when _background_dirty is set
+        self._background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self._background_dirty = True
+        # Explosion animation, one frame per radius from 5 to 30
+        self._explosion_frames = [Explosions.make_frame(radius) for radius in range(Explosions.START_RADIUS, Explosions.MAX_RADIUS + 1)]
+        # The game over / win screens are static, so they are only redrawn after an event
+        self._needs_redraw = True
+        
         self.reset_game()
     
     def reset_game(self):
         self.level = 1
         self.score = 0
-        self.missiles: List[Missile] = []
-        self.interceptors: List[Interceptor] = []
-        self.explosions: List[Explosion] = []
+        self.missiles = Projectiles(MAX_MISSILES)
+        self.interceptors = Projectiles(MAX_INTERCEPTORS)
+        self.explosions = Explosions(MAX_EXPLOSIONS)
         self.missile_spawn_timer = 0
         self.level_complete = False
         self.game_over = False
@@ -211,6 +343,11 @@ class Game:
             x = city_spacing * (i + 1)
             y = SCREEN_HEIGHT - 50
             self.cities.append(City(x, y))
+        self.city_x = np.array([city.x for city in self.cities], dtype=np.float64)
+        self.city_destroyed = np.zeros(len(self.cities), dtype=bool)
+        self.cities_alive = config["cities"]
+        self._alive_city_indices = list(range(len(self.cities)))
+        self._background_dirty = True
         
         # Setup launchers
         self.launchers: List[Launcher] = []
@@ -229,23 +366,32 @@ class Game:
         
         # Clear existing objects
         self.missiles.clear()
+        self.missiles_in_flight = 0
         self.interceptors.clear()
         self.explosions.clear()
         self.missile_spawn_timer = 0
     
     def spawn_missile(self):
         if self.missiles_remaining > 0:
+            if not self.missiles.has_free():
+                return
             # Choose a random city as target
-            target_city = random.choice([city for city in self.cities if not city.destroyed])
-            if target_city:
+            if self._alive_city_indices:
+                target_city = self.cities[random.choice(self._alive_city_indices)]
                 # Spawn from top of screen
                 x = random.randint(50, SCREEN_WIDTH - 50)
-                missile = Missile(x, 0, target_city.x, target_city.y, self.missile_speed)
-                self.missiles.append(missile)
+                self.missiles_in_flight += self.missiles.spawn([(x, 0)], [(target_city.x, target_city.y)], self.missile_speed)
                 self.missiles_remaining -= 1
     
+    def launch_interceptor(self, launcher: Launcher, target_x: float, target_y: float) -> bool:
+        if not self.interceptors.has_free() or not launcher.fire():
+            return False
+        self.interceptors.spawn([(launcher.x, launcher.y)], [(target_x, target_y)], self.interceptor_speed)
+        return True
+    
     def handle_input(self):
         for event in pygame.event.get():
+            self._needs_redraw = True
             if event.type == pygame.QUIT:
                 return False
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -253,9 +399,7 @@ class Game:
                     # Fire interceptor at mouse position
                     mouse_x, mouse_y = pygame.mouse.get_pos()
                     for launcher in self.launchers:
-                        interceptor = launcher.fire(mouse_x, mouse_y, self.interceptor_speed)
-                        if interceptor:
-                            self.interceptors.append(interceptor)
+                        if self.launch_interceptor(launcher, mouse_x, mouse_y):
                             break
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_r:
@@ -279,59 +423,30 @@ class Game:
             self.spawn_missile()
             self.missile_spawn_timer = 0
         
-        # Update missiles
-        for missile in self.missiles[:]:
-            missile.update()
-            
-            # Check if missile hit ground
-            if missile.y >= SCREEN_HEIGHT:
-                missile.active = False
-                # Find closest city and destroy it
-                closest_city = None
-                min_distance = float('inf')
-                for city in self.cities:
-                    if not city.destroyed:
-                        distance = abs(missile.x - city.x)
-                        if distance < min_distance:
-                            min_distance = distance
-                            closest_city = city
-                
-                if closest_city:
-                    closest_city.destroyed = True
-                    self.score -= 100
-        
-        # Update interceptors
-        for interceptor in self.interceptors[:]:
-            interceptor.update()
-            
-            # Check collision with missiles
-            for missile in self.missiles[:]:
-                if missile.active and interceptor.active:
-                    if interceptor.check_collision(missile.x, missile.y, 8):
-                        # Create explosion
-                        explosion = Explosion(missile.x, missile.y)
-                        self.explosions.append(explosion)
-                        
-                        # Destroy both objects
-                        missile.active = False
-                        interceptor.active = False
-                        self.missiles_destroyed += 1
-                        self.score += 50
+        # Move missiles and interceptors and resolve ground impacts and intercepts
+        landed, lost_cities, intercepts = step_simulation(
+            self.missiles.pos, self.missiles.vel, self.missiles.active,
+            self.interceptors.pos, self.interceptors.vel, self.interceptors.active,
+            self.city_x, self.city_destroyed)
+        self.missiles_in_flight -= landed + len(intercepts)
+        for c in lost_cities:
+            self.cities[c].destroyed = True
+            self.cities_alive -= 1
+            self._alive_city_indices.remove(c)
+            self._background_dirty = True
+            self.score -= 100
+        for mx, my in intercepts:
+            self.explosions.spawn(mx, my)
+            self.missiles_destroyed += 1
+            self.score += 50
         
         # Update explosions
-        for explosion in self.explosions[:]:
-            explosion.update()
-            if not explosion.active:
-                self.explosions.remove(explosion)
-        
-        # Remove inactive objects
-        self.missiles = [m for m in self.missiles if m.active]
-        self.interceptors = [i for i in self.interceptors if i.active]
+        self.explosions.step()
         
         # Check level completion
-        if self.missiles_remaining == 0 and len(self.missiles) == 0:
+        if self.missiles_remaining == 0 and self.missiles_in_flight == 0:
             self.level_complete = True
-            self.score += 200 * len([city for city in self.cities if not city.destroyed])
+            self.score += 200 * self.cities_alive
             
             if self.level >= 5:
                 self.game_won = True
@@ -340,62 +455,87 @@ class Game:
                 self.setup_level()
         
         # Check game over
-        if all(city.destroyed for city in self.cities):
+        if self.cities_alive == 0:
             self.game_over = True
     
-    def draw(self):
-        self.screen.fill(BLACK)
+    def build_background(self):
+        # Sky, ground, cities and launchers only change when a level starts
+        # or a city is destroyed, so they are composed once into one surface
+        self._background.fill(BLACK)
         
         # Draw ground
-        pygame.draw.rect(self.screen, DARK_GREEN, (0, SCREEN_HEIGHT - 30, SCREEN_WIDTH, 30))
+        pygame.draw.rect(self._background, DARK_GREEN, (0, SCREEN_HEIGHT - 30, SCREEN_WIDTH, 30))
         
-        # Draw cities
-        for city in self.cities:
-            city.draw(self.screen)
-        
-        # Draw launchers
-        for launcher in self.launchers:
-            launcher.draw(self.screen)
+        # Draw cities and launchers in one batch
+        self._background.blits([city.blit_item() for city in self.cities] +
+                               [launcher.blit_item() for launcher in self.launchers], False)
+        self._background_dirty = False
+    
+    def draw(self):
+        if self._background_dirty:
+            self.build_background()
+        self.screen.blit(self._background, (0, 0))
         
         # Draw missiles
-        for missile in self.missiles:
-            missile.draw(self.screen)
+        self.draw_projectiles(Missile, self.missile_speed, self.missiles)
         
         # Draw interceptors
-        for interceptor in self.interceptors:
-            interceptor.draw(self.screen)
+        self.draw_projectiles(Interceptor, self.interceptor_speed, self.interceptors)
         
         # Draw explosions
-        for explosion in self.explosions:
-            explosion.draw(self.screen)
+        self.explosions.draw(self.screen, self._explosion_frames)
         
         # Draw UI
         self.draw_ui()
         
         pygame.display.flip()
+        self._needs_redraw = not (self.game_over or self.game_won)
+    
+    def projectile_sprites(self, kind, speed: float) -> List[pygame.Surface]:
+        # One sprite per angle bucket for this kind of projectile at this speed
+        key = (kind, speed)
+        sprites = self._sprite_cache.get(key)
+        if sprites is None:
+            sprites = []
+            for bucket in range(ANGLE_BUCKETS):
+                angle = bucket * 2 * math.pi / ANGLE_BUCKETS
+                sprites.append(make_projectile_sprite(kind, math.cos(angle) * speed, math.sin(angle) * speed))
+            self._sprite_cache[key] = sprites
+        return sprites
+    
+    def draw_projectiles(self, kind, speed: float, projectiles: Projectiles):
+        # Blit every live projectile of one kind in a single SDL call, with
+        # the sprite corners computed for all of them at once
+        active = projectiles.active
+        if not active.any():
+            return
+        sprites = self.projectile_sprites(kind, speed)
+        corners = projectiles.pos[active].astype(int) - SPRITE_CENTER
+        self.screen.blits(zip([sprites[bucket] for bucket in projectiles.bucket[active].tolist()], corners.tolist()), False)
+    
+    def _text(self, label: str, text: str, font: pygame.font.Font, color) -> pygame.Surface:
+        cached = self._text_cache.get(label)
+        if cached is None or cached[0] != text:
+            cached = (text, font.render(text, True, color).convert_alpha())
+            self._text_cache[label] = cached
+        return cached[1]
     
     def draw_ui(self):
-        # Draw score
-        score_text = self.font.render(f"Score: {self.score}", True, WHITE)
-        self.screen.blit(score_text, (10, 10))
-        
-        # Draw level
-        level_text = self.font.render(f"Level: {self.level}", True, WHITE)
-        self.screen.blit(level_text, (10, 50))
-        
-        # Draw missiles remaining
-        missiles_text = self.small_font.render(f"Missiles: {self.missiles_remaining}", True, WHITE)
-        self.screen.blit(missiles_text, (10, 90))
-        
-        # Draw cities remaining
-        cities_remaining = len([city for city in self.cities if not city.destroyed])
-        cities_text = self.small_font.render(f"Cities: {cities_remaining}", True, WHITE)
-        self.screen.blit(cities_text, (10, 110))
+        # HUD labels are collected and handed to SDL in one blits call
+        hud = [
+            # Score and level
+            (self._text("score", f"Score: {self.score}", self.font, WHITE), (10, 10)),
+            (self._text("level", f"Level: {self.level}", self.font, WHITE), (10, 50)),
+            # Missiles and cities remaining
+            (self._text("missiles", f"Missiles: {self.missiles_remaining}", self.small_font, WHITE), (10, 90)),
+            (self._text("cities", f"Cities: {self.cities_alive}", self.small_font, WHITE), (10, 110)),
+        ]
         
         # Draw instructions
         if not self.game_over and not self.game_won:
-            instructions = self.small_font.render("Click to fire interceptors!", True, WHITE)
-            self.screen.blit(instructions, (SCREEN_WIDTH // 2 - 100, 10))
+            hud.append((self._text("instructions", "Click to fire interceptors!", self.small_font, WHITE),
+                        (SCREEN_WIDTH // 2 - 100, 10)))
+        self.screen.blits(hud, False)
         
         # Draw game over screen
         if self.game_over:
@@ -409,78 +549,51 @@ class Game:
         if self.level_complete and not self.game_won:
             self.draw_level_complete_screen()
     
+    def draw_overlay(self, labels: List[Tuple[pygame.Surface, int]]):
+        # Semi-transparent overlay with each label centred horizontally at
+        # its y offset from the middle of the screen, in one blits call
+        self.screen.blits([(self._overlay, (0, 0))] + [
+            (label, label.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + dy)))
+            for label, dy in labels
+        ], False)
+    
     def draw_game_over_screen(self):
-        # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
-        
-        # Game over text
-        game_over_text = self.font.render("GAME OVER", True, RED)
-        text_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
-        self.screen.blit(game_over_text, text_rect)
-        
-        # Final score
-        score_text = self.font.render(f"Final Score: {self.score}", True, WHITE)
-        score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        self.screen.blit(score_text, score_rect)
-        
-        # Restart instruction
-        restart_text = self.small_font.render("Press R to restart or ESC to quit", True, WHITE)
-        restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
-        self.screen.blit(restart_text, restart_rect)
+        self.draw_overlay([
+            # Game over text
+            (self._text("game_over", "GAME OVER", self.font, RED), -50),
+            # Final score
+            (self._text("final_score", f"Final Score: {self.score}", self.font, WHITE), 0),
+            # Restart instruction
+            (self._text("restart", "Press R to restart or ESC to quit", self.small_font, WHITE), 50),
+        ])
     
     def draw_win_screen(self):
-        # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
-        
-        # Congratulations text
-        congrats_text = self.font.render("CONGRATULATIONS!", True, GREEN)
-        text_rect = congrats_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
-        self.screen.blit(congrats_text, text_rect)
-        
-        # Win message
-        win_text = self.font.render("You've defended all cities!", True, WHITE)
-        win_rect = win_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        self.screen.blit(win_text, win_rect)
-        
-        # Final score
-        score_text = self.font.render(f"Final Score: {self.score}", True, WHITE)
-        score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
-        self.screen.blit(score_text, score_rect)
-        
-        # Restart instruction
-        restart_text = self.small_font.render("Press R to play again or ESC to quit", True, WHITE)
-        restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100))
-        self.screen.blit(restart_text, restart_rect)
+        self.draw_overlay([
+            # Congratulations text
+            (self._text("congrats", "CONGRATULATIONS!", self.font, GREEN), -50),
+            # Win message
+            (self._text("win", "You've defended all cities!", self.font, WHITE), 0),
+            # Final score
+            (self._text("final_score", f"Final Score: {self.score}", self.font, WHITE), 50),
+            # Restart instruction
+            (self._text("play_again", "Press R to play again or ESC to quit", self.small_font, WHITE), 100),
+        ])
     
     def draw_level_complete_screen(self):
-        # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
-        
-        # Level complete text
-        complete_text = self.font.render(f"Level {self.level - 1} Complete!", True, GREEN)
-        text_rect = complete_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        self.screen.blit(complete_text, text_rect)
-        
-        # Continue instruction
-        continue_text = self.small_font.render("Press any key to continue...", True, WHITE)
-        continue_rect = continue_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
-        self.screen.blit(continue_text, continue_rect)
+        self.draw_overlay([
+            # Level complete text
+            (self._text("level_complete", f"Level {self.level - 1} Complete!", self.font, GREEN), 0),
+            # Continue instruction
+            (self._text("continue", "Press any key to continue...", self.small_font, WHITE), 50),
+        ])
     
     def run(self):
         running = True
         while running:
             running = self.handle_input()
             self.update()
-            self.draw()
+            if self._needs_redraw:
+                self.draw()
             self.clock.tick(FPS)
         
         pygame.quit()
@@ -1,8 +1,9 @@
 import pygame
+import functools
 import math
 import random
-from typing import List, Tuple, Optional
-import time
+from typing import Dict, List, Tuple, Optional
+import numpy as np
 
 # Initialize Pygame
 pygame.init()
@@ -12,6 +13,21 @@ SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
 FPS = 60
 
+# Capacity of the missile buffers and of each missile kind's trail buffer
+MAX_PLAYER_MISSILES = 64
+MAX_ENEMY_MISSILES = 32
+MAX_TRAIL_PARTICLES = 1024
+MAX_EXPLOSION_PARTICLES = 1024
+
+# Cell size of the collision grid, about the size of the largest collider
+GRID_CELL = 64
+# Above this many player/enemy missile pairs the collision test is broadcast
+BROADCAST_PAIRS = 64
+
+# Power-up bob, sin(3t) * 3 px sampled once per frame over one period
+BOB_FRAMES = round(2 * math.pi / 3 * FPS)
+BOB_OFFSETS = [math.sin(2 * math.pi * i / BOB_FRAMES) * 3 for i in range(BOB_FRAMES)]
+
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -28,7 +44,67 @@ CYAN = (0, 255, 255)
 DARK_RED = (139, 0, 0)
 LIGHT_BLUE = (173, 216, 230)
 
+# Colors an explosion particle can take, indexed by ParticleArrays.color
+PARTICLE_COLORS = [YELLOW, ORANGE, RED, WHITE]
+
+class NoiseRing:
+    # Pre-generated uniform [0, 1) floats handed out in order, wrapping
+    # around; cheaper than a random module call per particle for cosmetic
+    # jitter that doesn't need a fresh Mersenne Twister draw each time
+    def __init__(self, size: int, seed: int = 0):
+        self.values = np.random.default_rng(seed).random(size)
+        self.mask = size - 1
+        self.index = 0
+        
+    def take(self, n: int) -> np.ndarray:
+        idx = (np.arange(self.index, self.index + n)) & self.mask
+        self.index = (self.index + n) & self.mask
+        return self.values[idx]
+
+# Shared by trail and explosion particles; size must be a power of two
+noise = NoiseRing(1 << 16)
+
+# Per-frame kernels over Structure-of-Arrays buffers; each is a handful of
+# masked vector ops, independent of how many objects are alive
+def step_missiles(x: np.ndarray, y: np.ndarray, vx: np.ndarray, vy: np.ndarray, alive: np.ndarray):
+    x[alive] += vx[alive]
+    y[alive] += vy[alive]
+
+def step_particles(x: np.ndarray, y: np.ndarray, vx: np.ndarray, vy: np.ndarray,
+                   life: np.ndarray, alive: np.ndarray):
+    x[alive] += vx[alive]
+    y[alive] += vy[alive]
+    life[alive] -= 1
+    alive &= life > 0
+
+def grid_cells(x: float, y: float, width: float, height: float):
+    # Keys of every collision grid cell an axis-aligned box overlaps
+    cx0, cx1 = int(x // GRID_CELL), int((x + width) // GRID_CELL)
+    cy0, cy1 = int(y // GRID_CELL), int((y + height) // GRID_CELL)
+    return [(cx, cy) for cx in range(cx0, cx1 + 1) for cy in range(cy0, cy1 + 1)]
+
+# Pre-rendered entity sprites by name, built on first use (needs the display)
+_sprite_cache: Dict[str, pygame.Surface] = {}
+
+def cached_sprite(name: str, build) -> pygame.Surface:
+    sprite = _sprite_cache.get(name)
+    if sprite is None:
+        sprite = build().convert_alpha()
+        _sprite_cache[name] = sprite
+    return sprite
+
+@functools.lru_cache(maxsize=None)
+def particle_sprite(color: Tuple[int, int, int], radius: int, alpha: int) -> pygame.Surface:
+    # One translucent dot per color, size and alpha level, shared by every
+    # trail and explosion particle and the explosion flashes
+    sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, (*color, alpha), (radius, radius), radius)
+    return sprite
+
 class City:
+    # Sprites cover the roof overhang and the chimney above the building
+    SPRITE_OFFSET = (-3, -15)
+    
     def __init__(self, x: int, y: int):
         self.x = x
         self.y = y
@@ -38,6 +114,9 @@ class City:
         self.health = 100
         self.max_health = 100
         self.damage_animation = 0
+        # Lit/dark windows, column by column, fixed for the city's lifetime
+        self.windows = tuple(random.random() > 0.3 for _ in range(12))  # Some windows dark
+        self.sprite_key = ''.join('1' if lit else '0' for lit in self.windows)
         
     def take_damage(self, damage: int):
         if not self.destroyed:
@@ -47,44 +126,61 @@ class City:
                 self.destroyed = True
                 self.health = 0
         
-    def draw(self, screen):
-        if not self.destroyed:
-            # Health bar
-            health_ratio = self.health / self.max_health
-            health_width = int(self.width * health_ratio)
-            pygame.draw.rect(screen, RED, (self.x, self.y - 10, self.width, 5))
-            pygame.draw.rect(screen, GREEN, (self.x, self.y - 10, health_width, 5))
-            
+    @staticmethod
+    def build_sprite(state: str, windows: Tuple[bool, ...]) -> pygame.Surface:
+        # state is 'intact', 'damaged' (red flash) or 'destroyed'
+        width, height = 50, 40
+        sprite = pygame.Surface((width + 6, height + 15), pygame.SRCALPHA)
+        x, y = 3, 15
+        if state != 'destroyed':
             # City building with damage animation
-            color = GRAY
-            if self.damage_animation > 0:
-                color = RED
-                self.damage_animation -= 1
-                
-            pygame.draw.rect(screen, color, (self.x, self.y, self.width, self.height))
+            color = RED if state == 'damaged' else GRAY
+            pygame.draw.rect(sprite, color, (x, y, width, height))
             
             # Windows
             for i in range(4):
                 for j in range(3):
-                    window_x = self.x + 5 + i * 10
-                    window_y = self.y + 5 + j * 10
-                    window_color = YELLOW if random.random() > 0.3 else BLACK  # Some windows dark
-                    pygame.draw.rect(screen, window_color, (window_x, window_y, 6, 6))
+                    window_x = x + 5 + i * 10
+                    window_y = y + 5 + j * 10
+                    window_color = YELLOW if windows[i * 3 + j] else BLACK
+                    pygame.draw.rect(sprite, window_color, (window_x, window_y, 6, 6))
             
             # Roof
-            pygame.draw.rect(screen, DARK_GREEN, (self.x - 3, self.y, self.width + 6, 8))
+            pygame.draw.rect(sprite, DARK_GREEN, (x - 3, y, width + 6, 8))
             
             # Chimney
-            pygame.draw.rect(screen, BROWN, (self.x + self.width - 8, self.y - 15, 6, 15))
+            pygame.draw.rect(sprite, BROWN, (x + width - 8, y - 15, 6, 15))
         else:
             # Destroyed city (rubble)
-            pygame.draw.rect(screen, BROWN, (self.x, self.y, self.width, self.height))
-            # Rubble pieces
+            pygame.draw.rect(sprite, BROWN, (x, y, width, height))
+            # Rubble pieces, from a fixed seed so they don't change between frames
+            rng = random.Random(0)
             for _ in range(8):
-                rubble_x = self.x + random.randint(0, self.width - 5)
-                rubble_y = self.y + random.randint(0, self.height - 5)
-                rubble_size = random.randint(2, 5)
-                pygame.draw.rect(screen, GRAY, (rubble_x, rubble_y, rubble_size, rubble_size))
+                rubble_x = x + rng.randint(0, width - 5)
+                rubble_y = y + rng.randint(0, height - 5)
+                rubble_size = rng.randint(2, 5)
+                pygame.draw.rect(sprite, GRAY, (rubble_x, rubble_y, rubble_size, rubble_size))
+        return sprite
+        
+    def draw(self, screen):
+        if not self.destroyed:
+            # Health bar
+            health_ratio = self.health / self.max_health
+            health_width = int(self.width * health_ratio)
+            pygame.draw.rect(screen, RED, (self.x, self.y - 10, self.width, 5))
+            pygame.draw.rect(screen, GREEN, (self.x, self.y - 10, health_width, 5))
+            
+            # City building with damage animation
+            state = 'intact'
+            if self.damage_animation > 0:
+                state = 'damaged'
+                self.damage_animation -= 1
+            name = f'city_{state}_{self.sprite_key}'
+        else:
+            state = 'destroyed'
+            name = 'city_destroyed'
+        sprite = cached_sprite(name, lambda: City.build_sprite(state, self.windows))
+        screen.blit(sprite, (self.x + City.SPRITE_OFFSET[0], self.y + City.SPRITE_OFFSET[1]))
 
 class MissileLauncher:
     def __init__(self, x: int, y: int):
@@ -92,7 +188,6 @@ class MissileLauncher:
         self.y = y
         self.width = 25
         self.height = 35
-        self.missiles: List[PlayerMissile] = []
         self.reload_time = 0
         self.reload_delay = 15  # frames between shots
         self.ammo = 10
@@ -100,15 +195,24 @@ class MissileLauncher:
         self.reload_cooldown = 0
         self.reload_duration = 120  # frames to reload
         
-    def draw(self, screen):
+    @staticmethod
+    def build_sprite() -> pygame.Surface:
+        # Base, body and barrel; the sprite's origin is (x - 8, y - 15)
+        width, height = 25, 35
+        sprite = pygame.Surface((41, height + 27), pygame.SRCALPHA)
+        x, y = 8, 15
         # Base
-        pygame.draw.rect(screen, DARK_GREEN, (self.x - 8, self.y + self.height, 41, 12))
+        pygame.draw.rect(sprite, DARK_GREEN, (x - 8, y + height, 41, 12))
         
         # Launcher body
-        pygame.draw.rect(screen, GRAY, (self.x, self.y, self.width, self.height))
+        pygame.draw.rect(sprite, GRAY, (x, y, width, height))
         
         # Barrel
-        pygame.draw.rect(screen, BLACK, (self.x + 8, self.y - 15, 9, 20))
+        pygame.draw.rect(sprite, BLACK, (x + 8, y - 15, 9, 20))
+        return sprite
+        
+    def draw(self, screen):
+        screen.blit(cached_sprite('launcher', MissileLauncher.build_sprite), (self.x - 8, self.y - 15))
         
         # Ammo indicator
         ammo_ratio = self.ammo / self.max_ammo
@@ -122,16 +226,17 @@ class MissileLauncher:
             reload_width = int(35 * reload_ratio)
             pygame.draw.rect(screen, CYAN, (self.x - 5, self.y + self.height + 22, reload_width, 3))
         
-    def fire(self):
+    def fire(self) -> bool:
+        # Spends a round if the launcher is ready; the caller spawns the missile
         if self.reload_time <= 0 and self.ammo > 0 and self.reload_cooldown <= 0:
-            missile = PlayerMissile(self.x + 12, self.y - 10)
-            self.missiles.append(missile)
             self.reload_time = self.reload_delay
             self.ammo -= 1
             
             # Start reload if out of ammo
             if self.ammo <= 0:
                 self.reload_cooldown = self.reload_duration
+            return True
+        return False
             
     def update(self):
         if self.reload_time > 0:
@@ -141,175 +246,269 @@ class MissileLauncher:
             self.reload_cooldown -= 1
             if self.reload_cooldown <= 0:
                 self.ammo = self.max_ammo
-            
-        # Update missiles
-        for missile in self.missiles[:]:
-            missile.update()
-            if missile.y < -10:
-                self.missiles.remove(missile)
 
+class MissileArrays:
+    # Structure-of-Arrays storage for one kind of missile and its trail
+    # particles; a slot is in use while its alive flag is set
+    def __init__(self, capacity: int, width: int, height: int, trail_life: int):
+        self.width = width
+        self.height = height
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.alive = np.zeros(capacity, dtype=bool)
+        
+        # Trail particles, each owned by the missile slot that emitted it
+        self.trail_life = trail_life
+        self.tp_x = np.zeros(MAX_TRAIL_PARTICLES, dtype=np.float32)
+        self.tp_y = np.zeros(MAX_TRAIL_PARTICLES, dtype=np.float32)
+        self.tp_life = np.zeros(MAX_TRAIL_PARTICLES, dtype=np.int32)
+        self.tp_owner = np.zeros(MAX_TRAIL_PARTICLES, dtype=np.intp)
+        self.tp_alive = np.zeros(MAX_TRAIL_PARTICLES, dtype=bool)
+        
+    def count(self) -> int:
+        return int(np.count_nonzero(self.alive))
+        
+    def has_free(self) -> bool:
+        return not self.alive.all()
+        
+    def spawn(self, x: float, y: float, vx: float, vy: float) -> int:
+        # Returns the slot used, or -1 if the buffer is full
+        free = np.flatnonzero(~self.alive)
+        if len(free) == 0:
+            return -1
+        slot = free[0]
+        self.x[slot] = x
+        self.y[slot] = y
+        self.vx[slot] = vx
+        self.vy[slot] = vy
+        self.alive[slot] = True
+        return slot
+        
+    def spawn_many(self, x: np.ndarray, y: np.ndarray, vx: np.ndarray, vy: np.ndarray) -> int:
+        # Fills free slots in order; returns how many fit, the rest are dropped
+        slots = np.flatnonzero(~self.alive)[:len(x)]
+        n = len(slots)
+        self.x[slots] = x[:n]
+        self.y[slots] = y[:n]
+        self.vx[slots] = vx[:n]
+        self.vy[slots] = vy[:n]
+        self.alive[slots] = True
+        return n
+        
+    def kill(self, slots):
+        # A missile's trail disappears with it
+        self.alive[slots] = False
+        self.tp_alive &= self.alive[self.tp_owner]
+        
+    def emit_trails(self, slots: np.ndarray, x: np.ndarray, y: np.ndarray):
+        # One particle per given missile slot; those that don't fit are dropped
+        p = np.flatnonzero(~self.tp_alive)[:len(slots)]
+        n = len(p)
+        self.tp_x[p] = x[:n]
+        self.tp_y[p] = y[:n]
+        self.tp_life[p] = self.trail_life
+        self.tp_owner[p] = slots[:n]
+        self.tp_alive[p] = True
+        
+    def step(self):
+        step_missiles(self.x, self.y, self.vx, self.vy, self.alive)
+        
+    def age_trails(self):
+        self.tp_life[self.tp_alive] -= 1
+        self.tp_alive &= self.tp_life > 0
+
+# Missile state lives in MissileArrays; these classes only know how each
+# kind moves, leaves its trail and is drawn.
 class PlayerMissile:
-    def __init__(self, x: int, y: int):
-        self.x = x
-        self.y = y
-        self.speed = 10
-        self.width = 6
-        self.height = 15
-        self.trail_particles = []
-        
-    def update(self):
-        self.y -= self.speed
-        
-        # Add trail particles
-        if random.random() > 0.3:
-            self.trail_particles.append({
-                'x': self.x + random.randint(-2, 2),
-                'y': self.y + self.height + random.randint(0, 5),
-                'life': 10
-            })
-        
-        # Update trail particles
-        for particle in self.trail_particles[:]:
-            particle['life'] -= 1
-            if particle['life'] <= 0:
-                self.trail_particles.remove(particle)
-        
-    def draw(self, screen):
-        # Trail particles
-        for particle in self.trail_particles:
-            alpha = int((particle['life'] / 10) * 255)
-            color = (255, 165, 0, alpha)
-            trail_surface = pygame.Surface((4, 4), pygame.SRCALPHA)
-            pygame.draw.circle(trail_surface, color, (2, 2), 2)
-            screen.blit(trail_surface, (particle['x'], particle['y']))
-        
+    SPEED = 10
+    WIDTH = 6
+    HEIGHT = 15
+    TRAIL_LIFE = 10
+    
+    @staticmethod
+    def add_trail(missiles: MissileArrays):
+        # 70% of missiles emit a particle, jittered -2..2 px across and 0..5 px below the body
+        slots = np.flatnonzero(missiles.alive)
+        emit, jitter_x, jitter_y = noise.take(3 * len(slots)).reshape(3, -1)
+        emit = emit > 0.3
+        slots = slots[emit]
+        missiles.emit_trails(slots, missiles.x[slots] + (jitter_x[emit] * 5).astype(int) - 2,
+                             missiles.y[slots] + PlayerMissile.HEIGHT + (jitter_y[emit] * 6).astype(int))
+    
+    @staticmethod
+    def draw_trail(screen, missiles: MissileArrays):
+        tp_alive = missiles.tp_alive
+        screen.blits([
+            (particle_sprite(ORANGE, 2, int((life / 10) * 255)), (px, py))
+            for px, py, life in zip(missiles.tp_x[tp_alive].tolist(), missiles.tp_y[tp_alive].tolist(),
+                                    missiles.tp_life[tp_alive].tolist())
+        ], False)
+        
+    @staticmethod
+    def build_sprite() -> pygame.Surface:
+        # Body, tip and exhaust; the sprite's origin is (x, y - 10)
+        width = PlayerMissile.WIDTH
+        height = PlayerMissile.HEIGHT
+        sprite = pygame.Surface((width, height + 18), pygame.SRCALPHA)
+        x, y = 0, 10
         # Missile body
-        pygame.draw.rect(screen, WHITE, (self.x, self.y, self.width, self.height))
+        pygame.draw.rect(sprite, WHITE, (x, y, width, height))
         
         # Missile tip
-        pygame.draw.polygon(screen, RED, [
-            (self.x, self.y),
-            (self.x + self.width, self.y),
-            (self.x + self.width // 2, self.y - 10)
+        pygame.draw.polygon(sprite, RED, [
+            (x, y),
+            (x + width, y),
+            (x + width // 2, y - 10)
         ])
         
         # Exhaust trail
-        pygame.draw.rect(screen, ORANGE, (self.x + 1, self.y + self.height, 4, 8))
+        pygame.draw.rect(sprite, ORANGE, (x + 1, y + height, 4, 8))
+        return sprite
+        
+    @staticmethod
+    def draw(screen, x: float, y: float):
+        screen.blit(cached_sprite('player_missile', PlayerMissile.build_sprite), (x, y - 10))
 
 class EnemyMissile:
-    def __init__(self, x: int, y: int, target_x: int, target_y: int, speed: float = 3):
-        self.x = x
-        self.y = y
-        self.target_x = target_x
-        self.target_y = target_y
-        self.speed = speed
-        self.width = 8
-        self.height = 20
-        self.trail_particles = []
-        
-        # Calculate trajectory
-        dx = target_x - x
-        dy = target_y - y
-        distance = math.sqrt(dx**2 + dy**2)
-        if distance > 0:
-            self.vx = (dx / distance) * self.speed
-            self.vy = (dy / distance) * self.speed
-        else:
-            self.vx = 0
-            self.vy = self.speed
-            
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        
-        # Add trail particles
-        if random.random() > 0.4:
-            self.trail_particles.append({
-                'x': self.x + random.randint(-3, 3),
-                'y': self.y + self.height + random.randint(0, 8),
-                'life': 15
-            })
-        
-        # Update trail particles
-        for particle in self.trail_particles[:]:
-            particle['life'] -= 1
-            if particle['life'] <= 0:
-                self.trail_particles.remove(particle)
-        
-    def draw(self, screen):
-        # Trail particles
-        for particle in self.trail_particles:
-            alpha = int((particle['life'] / 15) * 255)
-            color = (255, 0, 0, alpha)
-            trail_surface = pygame.Surface((6, 6), pygame.SRCALPHA)
-            pygame.draw.circle(trail_surface, color, (3, 3), 3)
-            screen.blit(trail_surface, (particle['x'], particle['y']))
-        
+    WIDTH = 8
+    HEIGHT = 20
+    TRAIL_LIFE = 15
+    
+    @staticmethod
+    def trajectory(x, y, target_x, target_y, speed: float) -> Tuple[np.ndarray, np.ndarray]:
+        # Calculate trajectory; works on scalars or whole arrays of spawns
+        dx = np.subtract(target_x, x, dtype=np.float64)
+        dy = np.subtract(target_y, y, dtype=np.float64)
+        distance = np.hypot(dx, dy)
+        moving = distance > 0
+        scale = speed / np.where(moving, distance, 1)
+        return np.where(moving, dx * scale, 0), np.where(moving, dy * scale, speed)
+    
+    @staticmethod
+    def add_trail(missiles: MissileArrays):
+        # 60% of missiles emit a particle, jittered -3..3 px across and 0..8 px below the body
+        slots = np.flatnonzero(missiles.alive)
+        emit, jitter_x, jitter_y = noise.take(3 * len(slots)).reshape(3, -1)
+        emit = emit > 0.4
+        slots = slots[emit]
+        missiles.emit_trails(slots, missiles.x[slots] + (jitter_x[emit] * 7).astype(int) - 3,
+                             missiles.y[slots] + EnemyMissile.HEIGHT + (jitter_y[emit] * 9).astype(int))
+    
+    @staticmethod
+    def draw_trail(screen, missiles: MissileArrays):
+        tp_alive = missiles.tp_alive
+        screen.blits([
+            (particle_sprite(RED, 3, int((life / 15) * 255)), (px, py))
+            for px, py, life in zip(missiles.tp_x[tp_alive].tolist(), missiles.tp_y[tp_alive].tolist(),
+                                    missiles.tp_life[tp_alive].tolist())
+        ], False)
+        
+    @staticmethod
+    def build_sprite() -> pygame.Surface:
+        # Body, tip and fins; the sprite's origin is (x - 2, y - 12)
+        width = EnemyMissile.WIDTH
+        height = EnemyMissile.HEIGHT
+        sprite = pygame.Surface((width + 4, height + 12), pygame.SRCALPHA)
+        x, y = 2, 12
         # Missile body
-        pygame.draw.rect(screen, RED, (self.x, self.y, self.width, self.height))
+        pygame.draw.rect(sprite, RED, (x, y, width, height))
         
         # Missile tip
-        pygame.draw.polygon(screen, WHITE, [
-            (self.x, self.y),
-            (self.x + self.width, self.y),
-            (self.x + self.width // 2, self.y - 12)
+        pygame.draw.polygon(sprite, WHITE, [
+            (x, y),
+            (x + width, y),
+            (x + width // 2, y - 12)
         ])
         
         # Fins
-        pygame.draw.rect(screen, DARK_RED, (self.x - 2, self.y + self.height - 8, 4, 6))
-        pygame.draw.rect(screen, DARK_RED, (self.x + self.width - 2, self.y + self.height - 8, 4, 6))
+        pygame.draw.rect(sprite, DARK_RED, (x - 2, y + height - 8, 4, 6))
+        pygame.draw.rect(sprite, DARK_RED, (x + width - 2, y + height - 8, 4, 6))
+        return sprite
+        
+    @staticmethod
+    def draw(screen, x: float, y: float):
+        screen.blit(cached_sprite('enemy_missile', EnemyMissile.build_sprite), (x - 2, y - 12))
+
+class ParticleArrays:
+    # Structure-of-Arrays storage for explosion particles from every
+    # explosion; a slot is in use while its alive flag is set
+    def __init__(self, capacity: int):
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.int32)
+        self.color = np.zeros(capacity, dtype=np.uint8)
+        self.alive = np.zeros(capacity, dtype=bool)
+        
+    def emit(self, x: float, y: float, vx: np.ndarray, vy: np.ndarray, life: np.ndarray, color: np.ndarray):
+        # Particles that don't fit in the free slots are dropped
+        slots = np.flatnonzero(~self.alive)[:len(vx)]
+        n = len(slots)
+        self.x[slots] = x
+        self.y[slots] = y
+        self.vx[slots] = vx[:n]
+        self.vy[slots] = vy[:n]
+        self.life[slots] = life[:n]
+        self.color[slots] = color[:n]
+        self.alive[slots] = True
+        
+    def step(self):
+        step_particles(self.x, self.y, self.vx, self.vy, self.life, self.alive)
+        
+    def draw(self, screen):
+        alive = self.alive
+        screen.blits([
+            (particle_sprite(PARTICLE_COLORS[c], 2, int((life / 25) * 255)), (x - 2, y - 2))
+            for x, y, life, c in zip(self.x[alive].tolist(), self.y[alive].tolist(),
+                                     self.life[alive].tolist(), self.color[alive].tolist())
+        ], False)
+
+class Pool:
+    # Recycles objects through their reset() method instead of building new ones
+    def __init__(self, cls, size: int):
+        self.cls = cls
+        self.free = [cls.__new__(cls) for _ in range(size)]
+        
+    def get(self, *args):
+        obj = self.free.pop() if self.free else self.cls.__new__(self.cls)
+        obj.reset(*args)
+        return obj
+    
+    def release(self, obj):
+        self.free.append(obj)
 
 class Explosion:
-    def __init__(self, x: int, y: int, size: int = 30):
+    __slots__ = ('x', 'y', 'radius', 'max_radius', 'life')
+    
+    def __init__(self, x: int, y: int, particles: ParticleArrays, size: int = 30):
+        self.reset(x, y, particles, size)
+        
+    def reset(self, x: int, y: int, particles: ParticleArrays, size: int = 30):
         self.x = x
         self.y = y
         self.radius = 5
         self.max_radius = size
         self.life = 25
-        self.particles = []
-        
-        # Create explosion particles
-        for _ in range(20):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 8)
-            self.particles.append({
-                'x': x,
-                'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'life': random.randint(15, 25),
-                'color': random.choice([YELLOW, ORANGE, RED, WHITE])
-            })
+        
+        # Create explosion particles in the shared particle buffer
+        angles, speeds, lives, colors = noise.take(80).reshape(4, 20)
+        angles = angles * (2 * np.pi)
+        speeds = 2 + speeds * 6
+        particles.emit(x, y, np.cos(angles) * speeds, np.sin(angles) * speeds, 15 + (lives * 11).astype(int), (colors * len(PARTICLE_COLORS)).astype(int))
         
     def update(self):
         self.radius += 1
         self.life -= 1
         
-        # Update particles
-        for particle in self.particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['life'] -= 1
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
-        
     def draw(self, screen):
         if self.life > 0:
-            # Main explosion
+            # Main explosion; radius and alpha both follow life, so every
+            # explosion reuses the same 25 cached discs
             alpha = int((self.life / 25) * 255)
-            color = (255, 255, 0, alpha)
-            explosion_surface = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(explosion_surface, color, (self.radius, self.radius), self.radius)
-            screen.blit(explosion_surface, (self.x - self.radius, self.y - self.radius))
-            
-            # Particles
-            for particle in self.particles:
-                if particle['life'] > 0:
-                    alpha = int((particle['life'] / 25) * 255)
-                    color = (*particle['color'][:3], alpha)
-                    particle_surface = pygame.Surface((4, 4), pygame.SRCALPHA)
-                    pygame.draw.circle(particle_surface, color, (2, 2), 2)
-                    screen.blit(particle_surface, (particle['x'] - 2, particle['y'] - 2))
+            screen.blit(particle_sprite(YELLOW, self.radius, alpha), (self.x - self.radius, self.y - self.radius))
 
 class PowerUp:
     def __init__(self, x: int, y: int, power_type: str):
@@ -321,9 +520,9 @@ class PowerUp:
         self.life = 300  # frames
         self.bob_offset = 0
         
-    def update(self):
+    def update(self, frame: int):
         self.life -= 1
-        self.bob_offset = math.sin(time.time() * 3) * 3
+        self.bob_offset = BOB_OFFSETS[frame % BOB_FRAMES]
         
     def draw(self, screen):
         if self.power_type == 'rapid_fire':
@@ -345,9 +544,21 @@ class Game:
         
         # Game objects
         self.cities = self.create_cities()
+        # Cities never move, so they are binned into the collision grid once
+        self.city_grid = {}
+        for i, city in enumerate(self.cities):
+            for cell in grid_cells(city.x, city.y, city.width, city.height):
+                self.city_grid.setdefault(cell, []).append(i)
         self.launchers = self.create_launchers()
-        self.enemy_missiles: List[EnemyMissile] = []
+        # Launchers never move either; clicks pick one by nearest x
+        self.launcher_xs = np.array([launcher.x for launcher in self.launchers])
+        self.player_missiles = MissileArrays(MAX_PLAYER_MISSILES, PlayerMissile.WIDTH, PlayerMissile.HEIGHT,
+                                             PlayerMissile.TRAIL_LIFE)
+        self.enemy_missiles = MissileArrays(MAX_ENEMY_MISSILES, EnemyMissile.WIDTH, EnemyMissile.HEIGHT,
+                                            EnemyMissile.TRAIL_LIFE)
         self.explosions: List[Explosion] = []
+        self.explosion_pool = Pool(Explosion, 32)
+        self.particles = ParticleArrays(MAX_EXPLOSION_PARTICLES)
         self.power_ups: List[PowerUp] = []
         
         # Game state
@@ -358,6 +569,11 @@ class Game:
         self.wave_delay = 180  # frames between waves
         self.game_over = False
         self.paused = False
+        self.frame = 0
+        # Gameplay randomness (wave targets and start points); unseeded, so
+        # every game plays differently. The seeded noise ring is for cosmetic
+        # jitter only
+        self.rng = np.random.default_rng()
         
         # Power-up effects
         self.rapid_fire_timer = 0
@@ -371,6 +587,24 @@ class Game:
         # Background stars
         self.stars = [(random.randint(0, SCREEN_WIDTH), random.randint(0, SCREEN_HEIGHT)) 
                      for _ in range(100)]
+        # Sky, stars and ground never change, so they are drawn once
+        self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.background.fill(BLACK)
+        for star in self.stars:
+            pygame.draw.circle(self.background, WHITE, star, 1)
+        pygame.draw.rect(self.background, DARK_GREEN, (0, SCREEN_HEIGHT - 30, SCREEN_WIDTH, 30))
+        # Shield tint, only refilled when its alpha steps (every 12 frames)
+        self.shield_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.shield_alpha = -1
+        
+        # Fonts are loaded once; rendered text is reused until its string changes
+        self.font = pygame.font.Font(None, 36)
+        self.big_font = pygame.font.Font(None, 72)
+        self._text: Dict[str, Tuple[str, pygame.Surface]] = {}
+        self.game_over_text = self.big_font.render("GAME OVER", True, RED)
+        self.restart_text = self.font.render("Press R to restart", True, WHITE)
+        self.pause_text = self.big_font.render("PAUSED", True, WHITE)
+        self.resume_text = self.font.render("Press P to resume", True, WHITE)
         
     def create_cities(self) -> List[City]:
         cities = []
@@ -390,17 +624,22 @@ class Game:
             launchers.append(MissileLauncher(x, y))
         return launchers
     
-    def spawn_enemy_missile(self):
-        if len(self.enemy_missiles) < self.missiles_per_wave:
-            # Choose a random city as target
-            alive_cities = [city for city in self.cities if not city.destroyed]
-            if alive_cities:
-                target_city = random.choice(alive_cities)
-                x = random.randint(50, SCREEN_WIDTH - 50)
-                y = -30
-                speed = 2 + (self.level * 0.5)  # Speed increases with level
-                missile = EnemyMissile(x, y, target_city.x + target_city.width // 2, target_city.y, speed)
-                self.enemy_missiles.append(missile)
+    def spawn_wave(self):
+        # Tops the sky up to missiles_per_wave enemies in one batch
+        n = self.missiles_per_wave - self.enemy_missiles.count()
+        alive_cities = [city for city in self.cities if not city.destroyed]
+        if n <= 0 or not alive_cities:
+            return
+        # Random target city and start x per missile
+        picks = self.rng.integers(len(alive_cities), size=n)
+        targets = [alive_cities[i] for i in picks.tolist()]
+        target_x = np.array([city.x + city.width // 2 for city in targets])
+        target_y = np.array([city.y for city in targets])
+        x = self.rng.integers(50, SCREEN_WIDTH - 50, size=n, endpoint=True)
+        y = np.full(n, -30)
+        speed = 2 + (self.level * 0.5)  # Speed increases with level
+        vx, vy = EnemyMissile.trajectory(x, y, target_x, target_y, speed)
+        self.enemy_missiles.spawn_many(x, y, vx, vy)
     
     def spawn_power_up(self):
         if random.random() < 0.01:  # 1% chance per frame
@@ -411,57 +650,117 @@ class Game:
             power_up = PowerUp(x, y, power_type)
             self.power_ups.append(power_up)
     
+    def launch(self, launcher: MissileLauncher):
+        if self.player_missiles.has_free() and launcher.fire():
+            self.player_missiles.spawn(launcher.x + 12, launcher.y - 10, 0, -PlayerMissile.SPEED)
+    
     def check_collisions(self):
-        # Check player missiles vs enemy missiles
-        for launcher in self.launchers:
-            for player_missile in launcher.missiles[:]:
-                for enemy_missile in self.enemy_missiles[:]:
-                    if (player_missile.x < enemy_missile.x + enemy_missile.width and
-                        player_missile.x + player_missile.width > enemy_missile.x and
-                        player_missile.y < enemy_missile.y + enemy_missile.height and
-                        player_missile.y + player_missile.height > enemy_missile.y):
-                        
-                        # Create explosion
-                        explosion = Explosion(enemy_missile.x + enemy_missile.width // 2, 
-                                            enemy_missile.y + enemy_missile.height // 2)
-                        self.explosions.append(explosion)
-                        
-                        # Remove missiles
-                        launcher.missiles.remove(player_missile)
-                        self.enemy_missiles.remove(enemy_missile)
-                        self.score += 100
-                        break
+        enemies = self.enemy_missiles
+        ew, eh = enemies.width, enemies.height
+        # Box edges, computed once per frame rather than per tested pair
+        ex_min, ey_min = enemies.x.astype(np.float64), enemies.y.astype(np.float64)
+        ex_max, ey_max = ex_min + ew, ey_min + eh
+        ex, ey = ex_min.tolist(), ey_min.tolist()
+        ex2, ey2 = ex_max.tolist(), ey_max.tolist()
+        enemy_slots = np.flatnonzero(enemies.alive).tolist()
+        removed = set()
+        # Bound methods and attributes used inside the loops below
+        spawn_explosion = self.explosion_pool.get
+        add_explosion = self.explosions.append
+        particles = self.particles
+        
+        # Check player missiles vs enemy missiles: find, per player missile,
+        # the enemy slots its box overlaps in ascending order
+        players = self.player_missiles
+        pw, ph = players.width, players.height
+        player_slots = np.flatnonzero(players.alive)
+        overlaps = []
+        if len(player_slots) * len(enemy_slots) > BROADCAST_PAIRS:
+            # Many pairs: test all of them in one NumPy broadcast
+            px_min = players.x[player_slots, None].astype(np.float64)
+            py_min = players.y[player_slots, None].astype(np.float64)
+            px_max, py_max = px_min + pw, py_min + ph
+            live_enemies = np.array(enemy_slots)
+            hits = ((px_min < ex_max[live_enemies]) & (px_max > ex_min[live_enemies]) &
+                    (py_min < ey_max[live_enemies]) & (py_max > ey_min[live_enemies]))
+            for row in np.flatnonzero(hits.any(axis=1)).tolist():
+                overlaps.append((int(player_slots[row]), live_enemies[hits[row]].tolist()))
+        else:
+            # Few pairs: bin enemy missiles into a uniform grid so each player
+            # missile only tests the enemies in the cells its box overlaps
+            grid = {}
+            for i in enemy_slots:
+                for cell in grid_cells(ex[i], ey[i], ew, eh):
+                    grid.setdefault(cell, []).append(i)
+            grid_get = grid.get
+            for p, px, py in zip(player_slots.tolist(), players.x[player_slots].tolist(),
+                                 players.y[player_slots].tolist()):
+                candidates = set()
+                for cell in grid_cells(px, py, pw, ph):
+                    candidates.update(grid_get(cell, ()))
+                px2, py2 = px + pw, py + ph
+                hit = [i for i in sorted(candidates)
+                       if px < ex2[i] and px2 > ex[i] and py < ey2[i] and py2 > ey[i]]
+                if hit:
+                    overlaps.append((p, hit))
+        
+        spent = []
+        for p, hit in overlaps:
+            # Lowest slot first, matching a scan of the whole buffer
+            for i in hit:
+                if i in removed:
+                    continue
+                
+                # Create explosion
+                add_explosion(spawn_explosion(ex[i] + ew // 2, ey[i] + eh // 2, particles))
+                
+                # Remove missiles
+                spent.append(p)
+                removed.add(i)
+                self.score += 100
+                break
+        if spent:
+            players.kill(spent)
         
         # Check enemy missiles vs cities
-        for enemy_missile in self.enemy_missiles[:]:
-            for city in self.cities:
+        city_cells = self.city_grid.get
+        cities = self.cities
+        shielded = self.shield_timer > 0
+        for i in enemy_slots:
+            if i in removed:
+                continue
+            x, y = ex[i], ey[i]
+            candidates = set()
+            for cell in grid_cells(x, y, ew, eh):
+                candidates.update(city_cells(cell, ()))
+            for c in sorted(candidates):
+                city = cities[c]
                 if not city.destroyed:
-                    if (enemy_missile.x < city.x + city.width and
-                        enemy_missile.x + enemy_missile.width > city.x and
-                        enemy_missile.y < city.y + city.height and
-                        enemy_missile.y + enemy_missile.height > city.y):
+                    if (x < city.x + city.width and
+                        ex2[i] > city.x and
+                        y < city.y + city.height and
+                        ey2[i] > city.y):
                         
                         # Check if shield is active
-                        if self.shield_timer > 0:
+                        if shielded:
                             # Create explosion
-                            explosion = Explosion(enemy_missile.x + enemy_missile.width // 2, 
-                                                enemy_missile.y + enemy_missile.height // 2)
-                            self.explosions.append(explosion)
-                            self.enemy_missiles.remove(enemy_missile)
+                            add_explosion(spawn_explosion(x + ew // 2, y + eh // 2, particles))
                             self.score += 50
                         else:
                             # Create explosion
-                            explosion = Explosion(enemy_missile.x + enemy_missile.width // 2, 
-                                                enemy_missile.y + enemy_missile.height // 2, 50)
-                            self.explosions.append(explosion)
+                            add_explosion(spawn_explosion(x + ew // 2, y + eh // 2, particles, 50))
                             
                             # Damage city
                             city.take_damage(25)
-                            self.enemy_missiles.remove(enemy_missile)
+                        removed.add(i)
                         break
         
+        if removed:
+            enemies.kill(list(removed))
+        
         # Check power-ups vs launchers
-        for power_up in self.power_ups[:]:
+        collected = set()
+        for p, power_up in enumerate(self.power_ups):
             for launcher in self.launchers:
                 if (power_up.x < launcher.x + launcher.width and
                     power_up.x + power_up.width > launcher.x and
@@ -476,8 +775,10 @@ class Game:
                     else:  # multi_shot
                         self.multi_shot_timer = 450  # 7.5 seconds
                     
-                    self.power_ups.remove(power_up)
+                    collected.add(p)
                     break
+        if collected:
+            self.power_ups = [power_up for p, power_up in enumerate(self.power_ups) if p not in collected]
         
         # Check if all cities are destroyed
         if all(city.destroyed for city in self.cities):
@@ -486,28 +787,42 @@ class Game:
     def update(self):
         if self.game_over or self.paused:
             return
+        self.frame += 1
             
         # Update launchers
         for launcher in self.launchers:
             launcher.update()
         
+        # Update player missiles, dropping those that left the top of the screen
+        players = self.player_missiles
+        players.step()
+        PlayerMissile.add_trail(players)
+        players.age_trails()
+        players.kill(players.alive & (players.y < -10))
+        
         # Update enemy missiles
-        for missile in self.enemy_missiles[:]:
-            missile.update()
-            if missile.y > SCREEN_HEIGHT + 30:
-                self.enemy_missiles.remove(missile)
+        enemies = self.enemy_missiles
+        enemies.step()
+        EnemyMissile.add_trail(enemies)
+        enemies.age_trails()
+        enemies.kill(enemies.alive & (enemies.y > SCREEN_HEIGHT + 30))
         
         # Update explosions
-        for explosion in self.explosions[:]:
+        live_explosions = []
+        keep, release = live_explosions.append, self.explosion_pool.release
+        for explosion in self.explosions:
             explosion.update()
-            if explosion.life <= 0:
-                self.explosions.remove(explosion)
+            if explosion.life > 0:
+                keep(explosion)
+            else:
+                release(explosion)
+        self.explosions = live_explosions
+        self.particles.step()
         
         # Update power-ups
-        for power_up in self.power_ups[:]:
-            power_up.update()
-            if power_up.life <= 0:
-                self.power_ups.remove(power_up)
+        for power_up in self.power_ups:
+            power_up.update(self.frame)
+        self.power_ups = [power_up for power_up in self.power_ups if power_up.life > 0]
         
         # Update power-up timers
         if self.rapid_fire_timer > 0:
@@ -520,8 +835,8 @@ class Game:
         # Spawn enemy missiles
         self.wave_timer += 1
         if self.wave_timer >= self.wave_delay:
-            self.spawn_enemy_missile()
-            if len(self.enemy_missiles) >= self.missiles_per_wave:
+            self.spawn_wave()
+            if self.enemy_missiles.count() >= self.missiles_per_wave:
                 self.wave_timer = 0
                 self.level += 1
                 self.missiles_per_wave = min(3 + self.level, 12)
@@ -533,100 +848,109 @@ class Game:
         # Check collisions
         self.check_collisions()
     
+    def render_text(self, slot: str, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        # Each UI slot keeps its last rendered string
+        cached = self._text.get(slot)
+        if cached is None or cached[0] != text:
+            cached = (text, self.font.render(text, True, color))
+            self._text[slot] = cached
+        return cached[1]
+    
     def draw(self):
-        self.screen.fill(BLACK)
-        
-        # Draw stars
-        for star in self.stars:
-            pygame.draw.circle(self.screen, WHITE, star, 1)
-        
-        # Draw ground
-        pygame.draw.rect(self.screen, DARK_GREEN, (0, SCREEN_HEIGHT - 30, SCREEN_WIDTH, 30))
+        screen = self.screen
+        screen.blit(self.background, (0, 0))
         
         # Draw shield effect
         if self.shield_timer > 0:
-            shield_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
             alpha = int((self.shield_timer / 600) * 50)
-            pygame.draw.rect(shield_surface, (0, 255, 255, alpha), (0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
-            self.screen.blit(shield_surface, (0, 0))
+            if alpha != self.shield_alpha:
+                self.shield_overlay.fill((0, 255, 255, alpha))
+                self.shield_alpha = alpha
+            screen.blit(self.shield_overlay, (0, 0))
         
         # Draw cities
         for city in self.cities:
-            city.draw(self.screen)
+            city.draw(screen)
         
         # Draw launchers
         for launcher in self.launchers:
-            launcher.draw(self.screen)
-            for missile in launcher.missiles:
-                missile.draw(self.screen)
+            launcher.draw(screen)
+        
+        # Draw player missiles
+        players = self.player_missiles
+        PlayerMissile.draw_trail(screen, players)
+        draw_missile = PlayerMissile.draw
+        for x, y in zip(players.x[players.alive].tolist(), players.y[players.alive].tolist()):
+            draw_missile(screen, x, y)
         
         # Draw enemy missiles
-        for missile in self.enemy_missiles:
-            missile.draw(self.screen)
+        enemies = self.enemy_missiles
+        EnemyMissile.draw_trail(screen, enemies)
+        draw_missile = EnemyMissile.draw
+        for x, y in zip(enemies.x[enemies.alive].tolist(), enemies.y[enemies.alive].tolist()):
+            draw_missile(screen, x, y)
         
         # Draw explosions
         for explosion in self.explosions:
-            explosion.draw(self.screen)
+            explosion.draw(screen)
+        self.particles.draw(screen)
         
         # Draw power-ups
         for power_up in self.power_ups:
-            power_up.draw(self.screen)
+            power_up.draw(screen)
         
         # Draw UI
-        font = pygame.font.Font(None, 36)
-        score_text = font.render(f"Score: {self.score}", True, WHITE)
-        level_text = font.render(f"Level: {self.level}", True, WHITE)
-        cities_text = font.render(f"Cities: {sum(1 for city in self.cities if not city.destroyed)}", True, WHITE)
+        score_text = self.render_text('score', f"Score: {self.score}", WHITE)
+        level_text = self.render_text('level', f"Level: {self.level}", WHITE)
+        cities_text = self.render_text('cities', f"Cities: {sum(1 for city in self.cities if not city.destroyed)}", WHITE)
         
-        self.screen.blit(score_text, (10, 10))
-        self.screen.blit(level_text, (10, 50))
-        self.screen.blit(cities_text, (10, 90))
+        screen.blit(score_text, (10, 10))
+        screen.blit(level_text, (10, 50))
+        screen.blit(cities_text, (10, 90))
         
         # Draw power-up indicators
         y_offset = 130
         if self.rapid_fire_timer > 0:
-            rapid_text = font.render(f"Rapid Fire: {self.rapid_fire_timer // 60 + 1}s", True, YELLOW)
-            self.screen.blit(rapid_text, (10, y_offset))
+            rapid_text = self.render_text('rapid_fire', f"Rapid Fire: {self.rapid_fire_timer // 60 + 1}s", YELLOW)
+            screen.blit(rapid_text, (10, y_offset))
             y_offset += 30
         
         if self.shield_timer > 0:
-            shield_text = font.render(f"Shield: {self.shield_timer // 60 + 1}s", True, CYAN)
-            self.screen.blit(shield_text, (10, y_offset))
+            shield_text = self.render_text('shield', f"Shield: {self.shield_timer // 60 + 1}s", CYAN)
+            screen.blit(shield_text, (10, y_offset))
             y_offset += 30
         
         if self.multi_shot_timer > 0:
-            multi_text = font.render(f"Multi Shot: {self.multi_shot_timer // 60 + 1}s", True, PURPLE)
-            self.screen.blit(multi_text, (10, y_offset))
+            multi_text = self.render_text('multi_shot', f"Multi Shot: {self.multi_shot_timer // 60 + 1}s", PURPLE)
+            screen.blit(multi_text, (10, y_offset))
         
         if self.game_over:
             # Dark overlay
             overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
             overlay.set_alpha(128)
             overlay.fill(BLACK)
-            self.screen.blit(overlay, (0, 0))
+            screen.blit(overlay, (0, 0))
             
-            game_over_font = pygame.font.Font(None, 72)
-            game_over_text = game_over_font.render("GAME OVER", True, RED)
-            restart_text = font.render("Press R to restart", True, WHITE)
-            final_score_text = font.render(f"Final Score: {self.score}", True, WHITE)
+            game_over_text = self.game_over_text
+            restart_text = self.restart_text
+            final_score_text = self.render_text('final_score', f"Final Score: {self.score}", WHITE)
             
-            self.screen.blit(game_over_text, (SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, SCREEN_HEIGHT // 2 - 80))
-            self.screen.blit(final_score_text, (SCREEN_WIDTH // 2 - final_score_text.get_width() // 2, SCREEN_HEIGHT // 2 - 20))
-            self.screen.blit(restart_text, (SCREEN_WIDTH // 2 - restart_text.get_width() // 2, SCREEN_HEIGHT // 2 + 40))
+            screen.blit(game_over_text, (SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, SCREEN_HEIGHT // 2 - 80))
+            screen.blit(final_score_text, (SCREEN_WIDTH // 2 - final_score_text.get_width() // 2, SCREEN_HEIGHT // 2 - 20))
+            screen.blit(restart_text, (SCREEN_WIDTH // 2 - restart_text.get_width() // 2, SCREEN_HEIGHT // 2 + 40))
         
         if self.paused:
             # Dark overlay
             overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
             overlay.set_alpha(128)
             overlay.fill(BLACK)
-            self.screen.blit(overlay, (0, 0))
+            screen.blit(overlay, (0, 0))
             
-            pause_font = pygame.font.Font(None, 72)
-            pause_text = pause_font.render("PAUSED", True, WHITE)
-            resume_text = font.render("Press P to resume", True, WHITE)
+            pause_text = self.pause_text
+            resume_text = self.resume_text
             
-            self.screen.blit(pause_text, (SCREEN_WIDTH // 2 - pause_text.get_width() // 2, SCREEN_HEIGHT // 2 - 40))
-            self.screen.blit(resume_text, (SCREEN_WIDTH // 2 - resume_text.get_width() // 2, SCREEN_HEIGHT // 2 + 40))
+            screen.blit(pause_text, (SCREEN_WIDTH // 2 - pause_text.get_width() // 2, SCREEN_HEIGHT // 2 - 40))
+            screen.blit(resume_text, (SCREEN_WIDTH // 2 - resume_text.get_width() // 2, SCREEN_HEIGHT // 2 + 40))
         
         pygame.display.flip()
     
@@ -638,8 +962,8 @@ class Game:
                 if event.button == 1:  # Left click
                     # Find closest launcher to mouse
                     mouse_x, mouse_y = event.pos
-                    closest_launcher = min(self.launchers, 
-                                         key=lambda l: abs(l.x - mouse_x))
+                    closest = int(np.argmin(np.abs(self.launcher_xs - mouse_x)))
+                    closest_launcher = self.launchers[closest]
                     
                     # Apply rapid fire effect
                     if self.rapid_fire_timer > 0:
@@ -647,15 +971,15 @@ class Game:
                     else:
                         closest_launcher.reload_delay = 15
                     
-                    closest_launcher.fire()
+                    self.launch(closest_launcher)
                     
                     # Multi-shot effect
                     if self.multi_shot_timer > 0:
                         # Fire from adjacent launchers too
-                        for launcher in self.launchers:
-                            if launcher != closest_launcher:
-                                if abs(launcher.x - closest_launcher.x) < 200:  # Within range
-                                    launcher.fire()
+                        in_range = np.abs(self.launcher_xs - self.launcher_xs[closest]) < 200
+                        in_range[closest] = False
+                        for i in np.flatnonzero(in_range).tolist():
+                            self.launch(self.launchers[i])
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_r and self.game_over:
                     self.__init__()  # Restart game
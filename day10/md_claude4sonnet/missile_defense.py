@@ -1,7 +1,9 @@
 import pygame
 import math
+import functools
 import random
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
+import numpy as np
 
 # Initialize Pygame
 pygame.init()
@@ -11,6 +13,17 @@ SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
 
+# Capacity of the missile and interceptor buffers
+MAX_MISSILES = 16
+MAX_INTERCEPTORS = 64
+
+# Width of the x buckets mapping a missile to the city below it
+CITY_CELL = 10
+# Size of the grid cells missiles are binned into for click lookups; the
+# same as the click radius, so a click only has to search its 3x3 cells
+CLICK_RADIUS = 100
+CLICK_CELL = CLICK_RADIUS
+
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -23,6 +36,11 @@ GRAY = (128, 128, 128)
 DARK_GREEN = (0, 100, 0)
 
 class City:
+    __slots__ = ('x', 'y', 'width', 'height', 'destroyed', 'health', 'rubble', 'rubble_sprite')
+    
+    # Every standing city looks the same, so one sprite is shared
+    intact_sprite: Optional[pygame.Surface] = None
+    
     def __init__(self, x: int, y: int):
         self.x = x
         self.y = y
@@ -30,107 +48,160 @@ class City:
         self.height = 30
         self.destroyed = False
         self.health = 100
-        
-    def draw(self, screen):
+        self.rubble: List[Tuple[int, int]] = []
+        self.rubble_sprite: Optional[pygame.Surface] = None
+        
+    def destroy(self):
+        # Rubble is scattered once, when the city falls, and baked into
+        # this city's own sprite
+        self.destroyed = True
+        self.rubble = [(random.randint(0, self.width - 8), random.randint(0, self.height - 8))
+                       for i in range(4)]
+        self.rubble_sprite = self.build_sprite()
+        
+    def build_sprite(self) -> pygame.Surface:
+        sprite = pygame.Surface((self.width, self.height)).convert()
         if not self.destroyed:
             # City building
-            pygame.draw.rect(screen, DARK_GREEN, (self.x, self.y, self.width, self.height))
+            sprite.fill(DARK_GREEN)
             # Windows
             for i in range(3):
                 for j in range(2):
-                    window_x = self.x + 5 + i * 10
-                    window_y = self.y + 5 + j * 10
-                    pygame.draw.rect(screen, YELLOW, (window_x, window_y, 6, 6))
+                    window_x = 5 + i * 10
+                    window_y = 5 + j * 10
+                    pygame.draw.rect(sprite, YELLOW, (window_x, window_y, 6, 6))
         else:
             # Destroyed city (rubble)
-            pygame.draw.rect(screen, GRAY, (self.x, self.y, self.width, self.height))
+            sprite.fill(GRAY)
             # Rubble details
-            for i in range(4):
-                rubble_x = self.x + random.randint(0, self.width - 8)
-                rubble_y = self.y + random.randint(0, self.height - 8)
-                pygame.draw.rect(screen, BLACK, (rubble_x, rubble_y, 8, 8))
-
-class Missile:
-    def __init__(self, start_x: int, target_x: int, target_y: int):
-        self.x = start_x
-        self.y = 0
-        self.target_x = target_x
-        self.target_y = target_y
-        self.speed = 2
-        self.destroyed = False
-        self.explosion_radius = 20
+            for rubble_x, rubble_y in self.rubble:
+                pygame.draw.rect(sprite, BLACK, (rubble_x, rubble_y, 8, 8))
+        return sprite
         
-        # Calculate trajectory
-        dx = target_x - start_x
-        dy = target_y - 0
-        distance = math.sqrt(dx**2 + dy**2)
-        self.vx = (dx / distance) * self.speed
-        self.vy = (dy / distance) * self.speed
-        
-    def update(self):
+    def draw(self, screen) -> pygame.Rect:
         if not self.destroyed:
-            self.x += self.vx
-            self.y += self.vy
-            
-    def draw(self, screen):
-        if not self.destroyed:
-            # Missile body
-            pygame.draw.line(screen, RED, (self.x, self.y), (self.x, self.y - 15), 3)
-            # Missile tip
-            pygame.draw.polygon(screen, RED, [
-                (self.x, self.y - 15),
-                (self.x - 3, self.y - 20),
-                (self.x + 3, self.y - 20)
-            ])
-            # Trail
-            for i in range(3):
-                trail_y = self.y + 5 + i * 5
-                trail_x = self.x + random.randint(-2, 2)
-                pygame.draw.circle(screen, ORANGE, (trail_x, trail_y), 2)
+            if City.intact_sprite is None:
+                City.intact_sprite = self.build_sprite()
+            return screen.blit(City.intact_sprite, (self.x, self.y))
+        else:
+            return screen.blit(self.rubble_sprite, (self.x, self.y))
 
-class Interceptor:
-    def __init__(self, x: int, y: int, target_x: int, target_y: int):
-        self.x = x
-        self.y = y
-        self.target_x = target_x
-        self.target_y = target_y
-        self.speed = 4
-        self.destroyed = False
-        self.explosion_radius = 15
+class Projectiles:
+    # Missiles or interceptors stored as one NumPy array per field; the
+    # live ones are packed into the first n slots
+    __slots__ = ('speed', 'n', 'x', 'y', 'vx', 'vy')
+    
+    def __init__(self, capacity: int, speed: float):
+        self.speed = speed
+        self.n = 0
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        # Positions accumulate a few pixels a frame across the whole screen,
+        # which needs float32; velocities only have to be good to a fraction
+        # of a pixel over a flight, so half precision is enough
+        self.vx = np.zeros(capacity, dtype=np.float16)
+        self.vy = np.zeros(capacity, dtype=np.float16)
+        
+    def count(self) -> int:
+        return self.n
+    
+    def spawn(self, x: float, y: float, target_x: float, target_y: float) -> bool:
+        # Returns False if every slot is in use
+        slot = self.n
+        if slot == len(self.x):
+            return False
         
         # Calculate trajectory
         dx = target_x - x
         dy = target_y - y
-        distance = math.sqrt(dx**2 + dy**2)
+        distance = math.hypot(dx, dy)
         if distance > 0:
-            self.vx = (dx / distance) * self.speed
-            self.vy = (dy / distance) * self.speed
+            scale = self.speed / distance
+            self.vx[slot] = dx * scale
+            self.vy[slot] = dy * scale
         else:
-            self.vx = 0
-            self.vy = -self.speed
-            
-    def update(self):
-        if not self.destroyed:
-            self.x += self.vx
-            self.y += self.vy
-            
-    def draw(self, screen):
-        if not self.destroyed:
-            # Interceptor body
-            pygame.draw.line(screen, BLUE, (self.x, self.y), (self.x, self.y - 12), 2)
-            # Interceptor tip
-            pygame.draw.polygon(screen, BLUE, [
-                (self.x, self.y - 12),
-                (self.x - 2, self.y - 16),
-                (self.x + 2, self.y - 16)
-            ])
-            # Trail
-            for i in range(2):
-                trail_y = self.y + 3 + i * 4
-                trail_x = self.x + random.randint(-1, 1)
-                pygame.draw.circle(screen, WHITE, (trail_x, trail_y), 1)
+            self.vx[slot] = 0
+            self.vy[slot] = -self.speed
+        self.x[slot] = x
+        self.y[slot] = y
+        self.n += 1
+        return True
+    
+    def remove(self, slots: List[int]):
+        # Fill each freed slot with the last live projectile; highest slot
+        # first, so a slot still waiting to be freed is never the one moved
+        x, y, vx, vy = self.x, self.y, self.vx, self.vy
+        for slot in sorted(slots, reverse=True):
+            last = self.n - 1
+            x[slot] = x[last]
+            y[slot] = y[last]
+            vx[slot] = vx[last]
+            vy[slot] = vy[last]
+            self.n = last
+
+class Missile:
+    SPEED = 2
+    EXPLOSION_RADIUS = 20
+    
+    # Drawing functions are bound as defaults so the per-missile calls skip
+    # the global and attribute lookups
+    @staticmethod
+    def draw(screen, x: float, y: float, jitter: List[int],
+             draw_line=pygame.draw.line, draw_polygon=pygame.draw.polygon,
+             draw_circle=pygame.draw.circle) -> pygame.Rect:
+        # Missile body
+        body = draw_line(screen, RED, (x, y), (x, y - 15), 3)
+        # Missile tip
+        drawn = [draw_polygon(screen, RED, [
+            (x, y - 15),
+            (x - 3, y - 20),
+            (x + 3, y - 20)
+        ])]
+        # Trail
+        for i in range(3):
+            trail_y = y + 5 + i * 5
+            trail_x = x + jitter[i]
+            drawn.append(draw_circle(screen, ORANGE, (trail_x, trail_y), 2))
+        return body.unionall(drawn)
+
+class Interceptor:
+    SPEED = 4
+    
+    @staticmethod
+    def draw(screen, x: float, y: float, jitter: List[int],
+             draw_line=pygame.draw.line, draw_polygon=pygame.draw.polygon,
+             draw_circle=pygame.draw.circle) -> pygame.Rect:
+        # Interceptor body
+        body = draw_line(screen, BLUE, (x, y), (x, y - 12), 2)
+        # Interceptor tip
+        drawn = [draw_polygon(screen, BLUE, [
+            (x, y - 12),
+            (x - 2, y - 16),
+            (x + 2, y - 16)
+        ])]
+        # Trail
+        for i in range(2):
+            trail_y = y + 3 + i * 4
+            trail_x = x + jitter[i]
+            drawn.append(draw_circle(screen, WHITE, (trail_x, trail_y), 1))
+        return body.unionall(drawn)
+
+# Explosion frames by radius and alpha; an explosion of a given size walks
+# the same 30 (radius, alpha) steps every time, so each is drawn only once.
+# The fade is premultiplied into opaque colours on black and the frames are
+# added onto the screen, which over the night sky matches an alpha blend
+# without the per-pixel alpha work.
+@functools.lru_cache(maxsize=None)
+def explosion_sprite(radius: int, alpha: int) -> pygame.Surface:
+    sprite = pygame.Surface((radius * 2, radius * 2)).convert()
+    sprite.fill(BLACK)
+    pygame.draw.circle(sprite, (alpha, alpha, 0), (radius, radius), radius)
+    pygame.draw.circle(sprite, (alpha, 100 * alpha // 255, 0), (radius, radius), radius // 2)
+    return sprite
 
 class Explosion:
+    __slots__ = ('x', 'y', 'radius', 'max_radius', 'life', 'max_life')
+    
     def __init__(self, x: int, y: int, radius: int):
         self.x = x
         self.y = y
@@ -143,14 +214,80 @@ class Explosion:
         self.life -= 1
         self.radius = int(self.max_radius * (self.life / self.max_life))
         
-    def draw(self, screen):
+    def draw(self, screen) -> Optional[pygame.Rect]:
         if self.life > 0:
             alpha = int(255 * (self.life / self.max_life))
-            # Create a surface for the explosion with alpha
-            explosion_surface = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(explosion_surface, (255, 255, 0, alpha), (self.radius, self.radius), self.radius)
-            pygame.draw.circle(explosion_surface, (255, 100, 0, alpha), (self.radius, self.radius), self.radius // 2)
-            screen.blit(explosion_surface, (self.x - self.radius, self.y - self.radius))
+            return screen.blit(explosion_sprite(self.radius, alpha), (self.x - self.radius, self.y - self.radius),
+                               special_flags=pygame.BLEND_RGB_ADD)
+        return None
+
+def step_simulation(missile_x: np.ndarray, missile_y: np.ndarray, missile_vx: np.ndarray, missile_vy: np.ndarray,
+                    interceptor_x: np.ndarray, interceptor_y: np.ndarray,
+                    interceptor_vx: np.ndarray, interceptor_vy: np.ndarray,
+                    city_by_bucket: np.ndarray, city_box: np.ndarray,
+                    city_destroyed: np.ndarray) -> Tuple[List[Tuple[float, float]], List[Tuple[int, float, float]],
+                                                         List[int], List[int]]:
+    # Advance one frame of projectile simulation in place on the live
+    # slices of the SoA arrays. Returns the positions of missiles shot down;
+    # for every city hit, its index and the impact position; and the slots
+    # of missiles and interceptors to remove.
+    intercepts = []
+    impacts = []
+    missile_alive = np.ones(len(missile_x), dtype=bool)
+    interceptor_alive = np.ones(len(interceptor_x), dtype=bool)
+    
+    # Update missiles and interceptors
+    missile_x += missile_vx
+    missile_y += missile_vy
+    interceptor_x += interceptor_vx
+    interceptor_y += interceptor_vy
+    mx, my = missile_x.tolist(), missile_y.tolist()
+    
+    # Check interceptor-missile collisions: squared distances for every
+    # pair at once, then each interceptor in turn takes the first missile
+    # in range that an earlier interceptor hasn't already hit
+    dx = interceptor_x[:, None] - missile_x
+    dy = interceptor_y[:, None] - missile_y
+    hits = dx * dx + dy * dy < 15 * 15
+    for i in np.flatnonzero(hits.any(axis=1)).tolist():
+        for m in np.flatnonzero(hits[i]).tolist():
+            if not missile_alive[m]:
+                continue
+            missile_alive[m] = False
+            interceptor_alive[i] = False
+            intercepts.append((mx[m], my[m]))
+            break
+    
+    # Check missile-city collisions against the one city under each
+    # missile low enough to reach them; only these can have fallen past
+    # the bottom too, so their slots are freed in the same pass
+    for m in np.flatnonzero(missile_alive & (missile_y >= SCREEN_HEIGHT - 80)).tolist():
+        x, y = mx[m], my[m]
+        if y >= SCREEN_HEIGHT:
+            missile_alive[m] = False
+            continue
+        if not 0 <= x <= SCREEN_WIDTH:
+            continue
+        c = city_by_bucket[int(x) // CITY_CELL]
+        if c < 0 or city_destroyed[c]:
+            continue
+        left, top, right, bottom = city_box[c]
+        if left <= x <= right and top <= y <= bottom:
+            missile_alive[m] = False
+            city_destroyed[c] = True
+            impacts.append((int(c), x, y))
+    
+    # Free the slots of interceptors that left the screen
+    interceptor_alive &= ((interceptor_y > 0) & (interceptor_y < SCREEN_HEIGHT) &
+                          (interceptor_x > 0) & (interceptor_x < SCREEN_WIDTH))
+    return (intercepts, impacts,
+            np.flatnonzero(~missile_alive).tolist(), np.flatnonzero(~interceptor_alive).tolist())
+
+# Rendered labels, keyed by font, text and colour; UI numbers change rarely
+# so most frames are served from here instead of re-rasterizing glyphs
+@functools.lru_cache(maxsize=64)
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    return font.render(text, True, color).convert_alpha()
 
 class Game:
     def __init__(self):
@@ -168,8 +305,8 @@ class Game:
         
         # Game objects
         self.cities = []
-        self.missiles = []
-        self.interceptors = []
+        self.missiles = Projectiles(MAX_MISSILES, Missile.SPEED)
+        self.interceptors = Projectiles(MAX_INTERCEPTORS, Interceptor.SPEED)
         self.explosions = []
         
         # Game settings
@@ -180,10 +317,35 @@ class Game:
         # Initialize cities
         self.init_cities()
         
+        # Sky and ground never change, so they are drawn once and each
+        # frame starts from a copy
+        self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.background.fill(BLACK)
+        pygame.draw.rect(self.background, DARK_GREEN, (0, SCREEN_HEIGHT - 20, SCREEN_WIDTH, 20))
+        # Screen areas drawn over last frame, None until the first full frame
+        self.dirty_rects: Optional[List[pygame.Rect]] = None
+        
+        # Trail flicker offsets, read per frame from these tables instead of
+        # drawing fresh random numbers for every trail dot
+        self.frame = 0
+        self.missile_grid: Dict[Tuple[int, int], List[int]] = {}
+        self.missile_grid_frame = -1
+        self.missile_jitter = np.random.randint(-2, 3, size=(256, 3)).tolist()
+        self.interceptor_jitter = np.random.randint(-1, 2, size=(256, 2)).tolist()
+        
         # Font
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         
+        # Instructions never change, so they are rendered once
+        instructions = [
+            "Click near missiles to launch interceptors",
+            "Defend your cities!",
+            "Press ESC to quit"
+        ]
+        self.instruction_texts = [self.small_font.render(instruction, True, GRAY).convert_alpha()
+                                  for instruction in instructions]
+        
     def init_cities(self):
         city_positions = [
             (50, SCREEN_HEIGHT - 50),
@@ -198,63 +360,66 @@ class Game:
         
         for x, y in city_positions:
             self.cities.append(City(x, y))
+        
+        # Cities are spaced more than a bucket apart, so each bucket holds
+        # at most one city index (-1 for none)
+        self.city_by_bucket = np.full(SCREEN_WIDTH // CITY_CELL + 1, -1, dtype=np.int32)
+        for i, city in enumerate(self.cities):
+            self.city_by_bucket[city.x // CITY_CELL:(city.x + city.width) // CITY_CELL + 1] = i
+        # City bounds and state as arrays for step_simulation
+        self.city_box = np.array([(city.x, city.y, city.x + city.width, city.y + city.height)
+                                  for city in self.cities], dtype=np.float32)
+        self.city_destroyed = np.zeros(len(self.cities), dtype=bool)
+        # Indices of the standing cities, kept up to date as they fall
+        self.alive_cities = list(range(len(self.cities)))
     
     def spawn_missile(self):
-        if len(self.missiles) < self.max_missiles:
+        if self.missiles.count() < self.max_missiles:
             # Choose a random city as target
-            target_city = random.choice([city for city in self.cities if not city.destroyed])
+            target_city = self.cities[random.choice(self.alive_cities)]
             if target_city:
                 start_x = random.randint(50, SCREEN_WIDTH - 50)
-                self.missiles.append(Missile(start_x, target_city.x + target_city.width // 2, target_city.y))
-                self.missiles_launched += 1
+                if self.missiles.spawn(start_x, 0, target_city.x + target_city.width // 2, target_city.y):
+                    self.missiles_launched += 1
+    
+    def missile_cells(self) -> Dict[Tuple[int, int], List[int]]:
+        # Missile slots by grid cell; missiles only move in update, so the
+        # grid is built on the first click of a frame and reused after
+        if self.missile_grid_frame != self.frame:
+            grid: Dict[Tuple[int, int], List[int]] = {}
+            missiles = self.missiles
+            n = missiles.n
+            for m, x, y in zip(range(n), missiles.x[:n].tolist(), missiles.y[:n].tolist()):
+                grid.setdefault((int(x) // CLICK_CELL, int(y) // CLICK_CELL), []).append(m)
+            self.missile_grid = grid
+            self.missile_grid_frame = self.frame
+        return self.missile_grid
     
     def launch_interceptor(self, mouse_x: int, mouse_y: int):
-        # Find the closest missile to the mouse position
+        # Find the closest missile to the mouse position among those in the
+        # cells around it; only the ordering matters, so squared distances
+        # are compared
+        missiles = self.missiles
+        mx, my = missiles.x, missiles.y
+        grid = self.missile_cells()
+        cell_x, cell_y = mouse_x // CLICK_CELL, mouse_y // CLICK_CELL
         closest_missile = None
-        closest_distance = float('inf')
-        
-        for missile in self.missiles:
-            if not missile.destroyed:
-                distance = math.sqrt((mouse_x - missile.x)**2 + (mouse_y - missile.y)**2)
-                if distance < closest_distance:
-                    closest_distance = distance
-                    closest_missile = missile
-        
-        if closest_missile and closest_distance < 100:  # Only launch if mouse is near a missile
+        closest_distance_sq = CLICK_RADIUS * CLICK_RADIUS  # Only launch if mouse is near a missile
+        
+        for cx in (cell_x - 1, cell_x, cell_x + 1):
+            for cy in (cell_y - 1, cell_y, cell_y + 1):
+                for m in grid.get((cx, cy), ()):
+                    dx, dy = mouse_x - float(mx[m]), mouse_y - float(my[m])
+                    distance_sq = dx * dx + dy * dy
+                    if distance_sq < closest_distance_sq:
+                        closest_distance_sq = distance_sq
+                        closest_missile = m
+        
+        if closest_missile is not None:
             # Launch from bottom of screen
             launch_x = random.randint(50, SCREEN_WIDTH - 50)
-            self.interceptors.append(Interceptor(launch_x, SCREEN_HEIGHT - 20, closest_missile.x, closest_missile.y))
-    
-    def check_collisions(self):
-        # Check interceptor-missile collisions
-        for interceptor in self.interceptors:
-            if not interceptor.destroyed:
-                for missile in self.missiles:
-                    if not missile.destroyed:
-                        distance = math.sqrt((interceptor.x - missile.x)**2 + (interceptor.y - missile.y)**2)
-                        if distance < 15:
-                            # Create explosion
-                            self.explosions.append(Explosion(missile.x, missile.y, missile.explosion_radius))
-                            missile.destroyed = True
-                            interceptor.destroyed = True
-                            self.missiles_destroyed += 1
-                            self.score += 100
-                            break
-        
-        # Check missile-city collisions
-        for missile in self.missiles:
-            if not missile.destroyed and missile.y >= SCREEN_HEIGHT - 80:
-                for city in self.cities:
-                    if not city.destroyed:
-                        if (missile.x >= city.x and missile.x <= city.x + city.width and
-                            missile.y >= city.y and missile.y <= city.y + city.height):
-                            # Create explosion
-                            self.explosions.append(Explosion(missile.x, missile.y, missile.explosion_radius))
-                            missile.destroyed = True
-                            city.destroyed = True
-                            self.cities_destroyed += 1
-                            self.score -= 200
-                            break
+            self.interceptors.spawn(launch_x, SCREEN_HEIGHT - 20,
+                                    float(mx[closest_missile]), float(my[closest_missile]))
     
     def update(self):
         # Spawn missiles
@@ -266,86 +431,119 @@ class Game:
             self.missile_spawn_delay = max(30, self.missile_spawn_delay - 2)
             self.max_missiles = min(10, self.max_missiles + 1)
         
-        # Update missiles
-        for missile in self.missiles:
-            missile.update()
-        
-        # Update interceptors
-        for interceptor in self.interceptors:
-            interceptor.update()
-        
-        # Update explosions
-        for explosion in self.explosions[:]:
+        # Update explosions; a finished one is replaced by the last in the list
+        explosions = self.explosions
+        i = 0
+        while i < len(explosions):
+            explosion = explosions[i]
             explosion.update()
             if explosion.life <= 0:
-                self.explosions.remove(explosion)
-        
-        # Check collisions
-        self.check_collisions()
-        
-        # Remove destroyed objects
-        self.missiles = [m for m in self.missiles if not m.destroyed or m.y < SCREEN_HEIGHT]
-        self.interceptors = [i for i in self.interceptors if not i.destroyed or i.y > 0]
+                explosions[i] = explosions[-1]
+                explosions.pop()
+            else:
+                i += 1
+        
+        # Move missiles and interceptors and resolve their collisions
+        missiles, interceptors = self.missiles, self.interceptors
+        n, k = missiles.n, interceptors.n
+        intercepts, impacts, dead_missiles, dead_interceptors = step_simulation(
+            missiles.x[:n], missiles.y[:n], missiles.vx[:n], missiles.vy[:n],
+            interceptors.x[:k], interceptors.y[:k], interceptors.vx[:k], interceptors.vy[:k],
+            self.city_by_bucket, self.city_box, self.city_destroyed)
+        missiles.remove(dead_missiles)
+        interceptors.remove(dead_interceptors)
+        add_explosion = explosions.append
+        radius = Missile.EXPLOSION_RADIUS
+        for x, y in intercepts:
+            add_explosion(Explosion(x, y, radius))
+        for c, x, y in impacts:
+            add_explosion(Explosion(x, y, radius))
+            self.cities[c].destroy()
+            self.alive_cities.remove(c)
+        self.missiles_destroyed += len(intercepts)
+        self.cities_destroyed += len(impacts)
+        self.score += 100 * len(intercepts) - 200 * len(impacts)
         
         # Check game over
         if self.cities_destroyed >= len(self.cities):
             self.running = False
     
     def draw(self):
-        self.screen.fill(BLACK)
-        
-        # Draw ground
-        pygame.draw.rect(self.screen, DARK_GREEN, (0, SCREEN_HEIGHT - 20, SCREEN_WIDTH, 20))
+        screen = self.screen
+        # Draw sky and ground: on the first frame all of it, after that only
+        # where last frame's sprites need erasing
+        background, previous = self.background, self.dirty_rects
+        if previous is None:
+            screen.blit(background, (0, 0))
+        else:
+            for rect in previous:
+                screen.blit(background, rect, rect)
+        dirty = []
+        drawn = dirty.append
         
         # Draw cities
         for city in self.cities:
-            city.draw(self.screen)
+            drawn(city.draw(screen))
         
         # Draw missiles
-        for missile in self.missiles:
-            missile.draw(self.screen)
+        self.frame += 1
+        frame = self.frame
+        missiles = self.missiles
+        draw_missile, jitter = Missile.draw, self.missile_jitter
+        n = missiles.n
+        for m, x, y in zip(range(n), missiles.x[:n].tolist(), missiles.y[:n].tolist()):
+            drawn(draw_missile(screen, x, y, jitter[(frame + m) & 255]))
         
         # Draw interceptors
-        for interceptor in self.interceptors:
-            interceptor.draw(self.screen)
+        interceptors = self.interceptors
+        draw_interceptor, jitter = Interceptor.draw, self.interceptor_jitter
+        n = interceptors.n
+        for i, x, y in zip(range(n), interceptors.x[:n].tolist(), interceptors.y[:n].tolist()):
+            drawn(draw_interceptor(screen, x, y, jitter[(frame + i) & 255]))
         
         # Draw explosions
         for explosion in self.explosions:
-            explosion.draw(self.screen)
+            rect = explosion.draw(screen)
+            if rect:
+                drawn(rect)
         
         # Draw UI
-        self.draw_ui()
+        dirty.extend(self.draw_ui())
         
-        pygame.display.flip()
+        # Only present what changed: this frame's sprites and the erased
+        # places of last frame's
+        if previous is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(previous + dirty)
+        self.dirty_rects = dirty
     
-    def draw_ui(self):
+    def draw_ui(self) -> List[pygame.Rect]:
+        # Returns the areas drawn over
+        screen = self.screen
+        drawn = []
+        
         # Score
-        score_text = self.font.render(f"Score: {self.score}", True, WHITE)
-        self.screen.blit(score_text, (10, 10))
+        score_text = render_text(self.font, f"Score: {self.score}", WHITE)
+        drawn.append(screen.blit(score_text, (10, 10)))
         
         # Level
-        level_text = self.font.render(f"Level: {self.level}", True, WHITE)
-        self.screen.blit(level_text, (10, 50))
+        level_text = render_text(self.font, f"Level: {self.level}", WHITE)
+        drawn.append(screen.blit(level_text, (10, 50)))
         
         # Cities remaining
-        cities_remaining = len([city for city in self.cities if not city.destroyed])
-        cities_text = self.small_font.render(f"Cities: {cities_remaining}/{len(self.cities)}", True, WHITE)
-        self.screen.blit(cities_text, (10, 90))
+        cities_remaining = len(self.alive_cities)
+        cities_text = render_text(self.small_font, f"Cities: {cities_remaining}/{len(self.cities)}", WHITE)
+        drawn.append(screen.blit(cities_text, (10, 90)))
         
         # Missiles destroyed
-        missiles_text = self.small_font.render(f"Destroyed: {self.missiles_destroyed}", True, WHITE)
-        self.screen.blit(missiles_text, (10, 110))
+        missiles_text = render_text(self.small_font, f"Destroyed: {self.missiles_destroyed}", WHITE)
+        drawn.append(screen.blit(missiles_text, (10, 110)))
         
         # Instructions
-        instructions = [
-            "Click near missiles to launch interceptors",
-            "Defend your cities!",
-            "Press ESC to quit"
-        ]
-        
-        for i, instruction in enumerate(instructions):
-            inst_text = self.small_font.render(instruction, True, GRAY)
-            self.screen.blit(inst_text, (SCREEN_WIDTH - 300, 10 + i * 25))
+        for i, inst_text in enumerate(self.instruction_texts):
+            drawn.append(screen.blit(inst_text, (SCREEN_WIDTH - 300, 10 + i * 25)))
+        return drawn
     
     def handle_events(self):
         for event in pygame.event.get():
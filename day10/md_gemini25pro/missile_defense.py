@@ -1,7 +1,9 @@
 import pygame
 import math
+import functools
 import random
 from typing import List, Tuple, Optional
+import numpy as np
 
 # Initialize Pygame
 pygame.init()
@@ -11,6 +13,13 @@ SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
 
+# Capacity of the missile and interceptor buffers
+MAX_MISSILES = 32
+MAX_INTERCEPTORS = 64
+
+# Width of the x buckets mapping a missile to the city below it
+CITY_CELL = 10
+
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -24,6 +33,14 @@ DARK_GREEN = (0, 100, 0)
 LIGHT_BLUE = (173, 216, 230)
 
 class City:
+    __slots__ = ('x', 'y', 'width', 'height', 'destroyed', 'health', 'smoke', 'rubble_sprite')
+    
+    # Sprites reach up to the smoke puffs above the building
+    SPRITE_OFFSET = (-3, -18)
+    SPRITE_SIZE = (47, 48)
+    # Every standing city looks the same, so one sprite is shared
+    intact_sprite: Optional[pygame.Surface] = None
+    
     def __init__(self, x: int, y: int):
         self.x = x
         self.y = y
@@ -31,167 +48,232 @@ class City:
         self.height = 30
         self.destroyed = False
         self.health = 100
+        self.smoke: List[Tuple[int, int]] = []
+        self.rubble_sprite: Optional[pygame.Surface] = None
+        
+    def destroy(self):
+        # Smoke puffs are placed once, when the city falls, and baked into
+        # this city's own sprite
+        self.destroyed = True
+        self.smoke = [(random.randint(0, self.width), -random.randint(5, 15))
+                      for i in range(3)]
+        self.rubble_sprite = self.build_sprite()
         
-    def draw(self, screen):
+    def build_sprite(self) -> pygame.Surface:
+        # Drawn relative to the building's top-left corner at (x, y)
+        sprite = pygame.Surface(City.SPRITE_SIZE, pygame.SRCALPHA)
+        x, y = -City.SPRITE_OFFSET[0], -City.SPRITE_OFFSET[1]
         if not self.destroyed:
             # City building
-            pygame.draw.rect(screen, DARK_GREEN, (self.x, self.y, self.width, self.height))
+            pygame.draw.rect(sprite, DARK_GREEN, (x, y, self.width, self.height))
             # Windows
             for i in range(3):
                 for j in range(2):
-                    window_x = self.x + 5 + i * 10
-                    window_y = self.y + 5 + j * 10
-                    pygame.draw.rect(screen, YELLOW, (window_x, window_y, 6, 6))
+                    window_x = x + 5 + i * 10
+                    window_y = y + 5 + j * 10
+                    pygame.draw.rect(sprite, YELLOW, (window_x, window_y, 6, 6))
             # Roof
-            pygame.draw.polygon(screen, GRAY, [
-                (self.x, self.y),
-                (self.x + self.width // 2, self.y - 10),
-                (self.x + self.width, self.y)
+            pygame.draw.polygon(sprite, GRAY, [
+                (x, y),
+                (x + self.width // 2, y - 10),
+                (x + self.width, y)
             ])
         else:
             # Destroyed city (rubble)
-            pygame.draw.rect(screen, GRAY, (self.x, self.y, self.width, self.height))
+            pygame.draw.rect(sprite, GRAY, (x, y, self.width, self.height))
             # Smoke effect
-            for i in range(3):
-                smoke_x = self.x + random.randint(0, self.width)
-                smoke_y = self.y - random.randint(5, 15)
-                pygame.draw.circle(screen, (100, 100, 100), (smoke_x, smoke_y), 3)
-
-class Missile:
-    def __init__(self, start_x: int, target_x: int, target_y: int):
-        self.x = start_x
-        self.y = 0
-        self.target_x = target_x
-        self.target_y = target_y
-        self.speed = 2
-        self.destroyed = False
-        self.trail = []
-        
-        # Calculate trajectory
-        dx = target_x - start_x
-        dy = target_y - 0
-        distance = math.sqrt(dx*dx + dy*dy)
-        self.vx = (dx / distance) * self.speed
-        self.vy = (dy / distance) * self.speed
+            for smoke_x, smoke_y in self.smoke:
+                pygame.draw.circle(sprite, (100, 100, 100), (x + smoke_x, y + smoke_y), 3)
+        return sprite.convert_alpha()
         
-    def update(self):
+    def draw(self, screen) -> pygame.Rect:
         if not self.destroyed:
-            self.x += self.vx
-            self.y += self.vy
-            
-            # Add to trail
-            self.trail.append((self.x, self.y))
-            if len(self.trail) > 10:
-                self.trail.pop(0)
-                
-    def draw(self, screen):
-        if not self.destroyed:
-            # Draw trail
-            for i, (trail_x, trail_y) in enumerate(self.trail):
-                alpha = int(255 * (i / len(self.trail)))
-                color = (255, 0, 0, alpha)
-                pygame.draw.circle(screen, color, (int(trail_x), int(trail_y)), 2)
-            
-            # Draw missile
-            pygame.draw.circle(screen, RED, (int(self.x), int(self.y)), 4)
-            # Missile tip
-            pygame.draw.polygon(screen, ORANGE, [
-                (self.x, self.y - 6),
-                (self.x - 3, self.y),
-                (self.x + 3, self.y)
-            ])
-            
-    def check_collision(self, city: City) -> bool:
-        if self.destroyed or city.destroyed:
-            return False
-        return (self.x >= city.x and self.x <= city.x + city.width and
-                self.y >= city.y and self.y <= city.y + city.height)
+            if City.intact_sprite is None:
+                City.intact_sprite = self.build_sprite()
+            sprite = City.intact_sprite
+        else:
+            sprite = self.rubble_sprite
+        return screen.blit(sprite, (self.x + City.SPRITE_OFFSET[0], self.y + City.SPRITE_OFFSET[1]))
 
-class Interceptor:
-    def __init__(self, x: int, y: int, target_x: int, target_y: int):
-        self.x = x
-        self.y = y
-        self.target_x = target_x
-        self.target_y = target_y
-        self.speed = 4
-        self.destroyed = False
-        self.exploded = False
-        self.explosion_radius = 30
-        self.explosion_timer = 0
-        self.trail = []
+class Projectiles:
+    # Missiles or interceptors stored as one NumPy array per field; the
+    # live ones are packed into the first n slots
+    __slots__ = ('speed', 'trail_length', 'n', 'x', 'y', 'vx', 'vy', 'trails', 'trail_head', 'trail_count')
+    FIELDS = ('x', 'y', 'vx', 'vy', 'trails', 'trail_head', 'trail_count')
+    
+    def __init__(self, capacity: int, speed: float, trail_length: int):
+        self.speed = speed
+        self.trail_length = trail_length
+        self.n = 0
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        # Positions accumulate a few pixels a frame across the whole screen,
+        # which needs float32; velocities only have to be good to a fraction
+        # of a pixel over a flight, so half precision is enough
+        self.vx = np.zeros(capacity, dtype=np.float16)
+        self.vy = np.zeros(capacity, dtype=np.float16)
+        # Each slot's trail is a ring of its last trail_length positions;
+        # trail_head is where the next one is written
+        self.trails = np.zeros((capacity, trail_length, 2), dtype=np.float32)
+        self.trail_head = np.zeros(capacity, dtype=np.int8)
+        self.trail_count = np.zeros(capacity, dtype=np.int8)
+        
+    def spawn(self, x: float, y: float, target_x: float, target_y: float) -> int:
+        # Returns the slot used, or -1 if every slot is in use
+        slot = self.n
+        if slot == len(self.x):
+            return -1
         
         # Calculate trajectory
         dx = target_x - x
         dy = target_y - y
-        distance = math.sqrt(dx*dx + dy*dy)
+        distance = math.hypot(dx, dy)
         if distance > 0:
-            self.vx = (dx / distance) * self.speed
-            self.vy = (dy / distance) * self.speed
+            scale = self.speed / distance
+            self.vx[slot] = dx * scale
+            self.vy[slot] = dy * scale
         else:
-            self.vx = 0
-            self.vy = -self.speed
-            
+            self.vx[slot] = 0
+            self.vy[slot] = -self.speed
+        self.x[slot] = x
+        self.y[slot] = y
+        self.trail_head[slot] = 0
+        self.trail_count[slot] = 0
+        self.n += 1
+        return slot
+    
+    def remove(self, slots: List[int]):
+        # Fill each freed slot with the last live projectile; highest slot
+        # first, so a slot still waiting to be freed is never the one moved
+        arrays = [getattr(self, name) for name in self.FIELDS]
+        for slot in sorted(slots, reverse=True):
+            last = self.n - 1
+            for array in arrays:
+                array[slot] = array[last]
+            self.n = last
+    
+    def step(self, slots: np.ndarray):
+        # Advance the given slots and add their new positions to the trails
+        self.x[slots] += self.vx[slots]
+        self.y[slots] += self.vy[slots]
+        heads = self.trail_head[slots]
+        self.trails[slots, heads, 0] = self.x[slots]
+        self.trails[slots, heads, 1] = self.y[slots]
+        self.trail_head[slots] = (heads + 1) % self.trail_length
+        self.trail_count[slots] = np.minimum(self.trail_count[slots] + 1, self.trail_length)
+    
+    def ordered_trails(self) -> List[List[List[float]]]:
+        # Trail points of every live slot, oldest first
+        n, length = self.n, self.trail_length
+        order = (self.trail_head[:n, None] + np.arange(length)) % length
+        rings = np.take_along_axis(self.trails[:n], order[:, :, None], axis=1).tolist()
+        return [ring[length - count:] for ring, count in zip(rings, self.trail_count[:n].tolist())]
+
+class Interceptors(Projectiles):
+    # Interceptors fly to the clicked point, then burn there as an explosion
+    # for EXPLOSION_FRAMES frames
+    __slots__ = ('target_x', 'target_y', 'exploded', 'explosion_timer')
+    EXPLOSION_FRAMES = 10
+    FIELDS = Projectiles.FIELDS + ('target_x', 'target_y', 'exploded', 'explosion_timer')
+    
+    def __init__(self, capacity: int, speed: float, trail_length: int):
+        super().__init__(capacity, speed, trail_length)
+        # Targets are clicked pixels and the timer counts to EXPLOSION_FRAMES
+        self.target_x = np.zeros(capacity, dtype=np.int16)
+        self.target_y = np.zeros(capacity, dtype=np.int16)
+        self.exploded = np.zeros(capacity, dtype=bool)
+        self.explosion_timer = np.zeros(capacity, dtype=np.int8)
+        
+    def spawn(self, x: float, y: float, target_x: float, target_y: float) -> int:
+        slot = super().spawn(x, y, target_x, target_y)
+        if slot >= 0:
+            self.target_x[slot] = target_x
+            self.target_y[slot] = target_y
+            self.exploded[slot] = False
+            self.explosion_timer[slot] = 0
+        return slot
+    
     def update(self):
-        if not self.destroyed and not self.exploded:
-            self.x += self.vx
-            self.y += self.vy
-            
-            # Add to trail
-            self.trail.append((self.x, self.y))
-            if len(self.trail) > 8:
-                self.trail.pop(0)
-                
-            # Check if reached target area
-            distance_to_target = math.sqrt((self.x - self.target_x)**2 + (self.y - self.target_y)**2)
-            if distance_to_target < 20:
-                self.explode()
-                
-        elif self.exploded:
-            self.explosion_timer += 1
-            if self.explosion_timer > 10:
-                self.destroyed = True
-                
-    def explode(self):
-        self.exploded = True
-        self.explosion_timer = 0
+        # Explosions already burning age first, so one that starts this
+        # frame is not aged until the next
+        n = self.n
+        exploded = self.exploded[:n]
+        explosion_timer = self.explosion_timer[:n]
+        explosion_timer[exploded] += 1
+        burnt_out = np.flatnonzero(exploded & (explosion_timer > self.EXPLOSION_FRAMES))
         
-    def draw(self, screen):
-        if not self.destroyed:
-            if not self.exploded:
-                # Draw trail
-                for i, (trail_x, trail_y) in enumerate(self.trail):
-                    alpha = int(255 * (i / len(self.trail)))
-                    color = (0, 255, 0, alpha)
-                    pygame.draw.circle(screen, color, (int(trail_x), int(trail_y)), 2)
-                
-                # Draw interceptor
-                pygame.draw.circle(screen, GREEN, (int(self.x), int(self.y)), 3)
-                # Interceptor tip
-                pygame.draw.polygon(screen, WHITE, [
-                    (self.x, self.y - 5),
-                    (self.x - 2, self.y),
-                    (self.x + 2, self.y)
-                ])
-            else:
-                # Draw explosion
-                radius = self.explosion_radius * (1 - self.explosion_timer / 10)
-                pygame.draw.circle(screen, YELLOW, (int(self.x), int(self.y)), int(radius))
-                pygame.draw.circle(screen, ORANGE, (int(self.x), int(self.y)), int(radius * 0.7))
-                pygame.draw.circle(screen, RED, (int(self.x), int(self.y)), int(radius * 0.4))
-                
-    def check_collision(self, missile: Missile) -> bool:
-        if self.destroyed or missile.destroyed:
+        flying = np.flatnonzero(~exploded)
+        self.step(flying)
+        
+        # Check if reached target area
+        dx = self.x[flying] - self.target_x[flying]
+        dy = self.y[flying] - self.target_y[flying]
+        reached = flying[dx * dx + dy * dy < 20 * 20]
+        self.exploded[reached] = True
+        self.explosion_timer[reached] = 0
+        
+        self.remove(burnt_out.tolist())
+
+class Missile:
+    SPEED = 2
+    TRAIL_LENGTH = 10
+    TRAIL_COLOR = (255, 0, 0)
+    
+    # Drawing functions are bound as defaults so the per-dot calls skip the
+    # global and attribute lookups
+    @staticmethod
+    def draw(screen, x: float, y: float, draw_circle=pygame.draw.circle,
+             draw_polygon=pygame.draw.polygon) -> pygame.Rect:
+        # Draw missile
+        body = draw_circle(screen, RED, (int(x), int(y)), 4)
+        # Missile tip
+        return body.union(draw_polygon(screen, ORANGE, [
+            (x, y - 6),
+            (x - 3, y),
+            (x + 3, y)
+        ]))
+        
+    @staticmethod
+    def check_collision(x: float, y: float, city: City) -> bool:
+        if city.destroyed:
             return False
-        if self.exploded:
-            # Check explosion radius
-            distance = math.sqrt((self.x - missile.x)**2 + (self.y - missile.y)**2)
-            return distance < self.explosion_radius
-        else:
-            # Check direct collision
-            distance = math.sqrt((self.x - missile.x)**2 + (self.y - missile.y)**2)
-            return distance < 8
+        return (x >= city.x and x <= city.x + city.width and
+                y >= city.y and y <= city.y + city.height)
+
+class Interceptor:
+    SPEED = 4
+    TRAIL_LENGTH = 8
+    TRAIL_COLOR = (0, 255, 0)
+    # Reach of a direct hit in flight and of the explosion once it bursts
+    HIT_RADIUS = 8
+    EXPLOSION_RADIUS = 30
+    
+    @staticmethod
+    def draw(screen, x: float, y: float, draw_circle=pygame.draw.circle,
+             draw_polygon=pygame.draw.polygon) -> pygame.Rect:
+        # Draw interceptor
+        body = draw_circle(screen, GREEN, (int(x), int(y)), 3)
+        # Interceptor tip
+        return body.union(draw_polygon(screen, WHITE, [
+            (x, y - 5),
+            (x - 2, y),
+            (x + 2, y)
+        ]))
+        
+    @staticmethod
+    def draw_explosion(screen, x: float, y: float, explosion_timer: int,
+                       draw_circle=pygame.draw.circle) -> pygame.Rect:
+        radius = Interceptor.EXPLOSION_RADIUS * (1 - explosion_timer / Interceptors.EXPLOSION_FRAMES)
+        center = (int(x), int(y))
+        # The outer circle covers the inner ones
+        outer = draw_circle(screen, YELLOW, center, int(radius))
+        draw_circle(screen, ORANGE, center, int(radius * 0.7))
+        draw_circle(screen, RED, center, int(radius * 0.4))
+        return outer
 
 class Explosion:
+    __slots__ = ('x', 'y', 'timer', 'max_timer', 'radius')
+    
     def __init__(self, x: int, y: int):
         self.x = x
         self.y = y
@@ -202,20 +284,47 @@ class Explosion:
     def update(self):
         self.timer += 1
         
-    def draw(self, screen):
+    def draw(self, screen) -> Optional[pygame.Rect]:
         if self.timer < self.max_timer:
             progress = self.timer / self.max_timer
             radius = int(self.radius * (1 - progress * 0.5))
             alpha = int(255 * (1 - progress))
             
             # Explosion effect
-            pygame.draw.circle(screen, YELLOW, (int(self.x), int(self.y)), radius)
+            outer = pygame.draw.circle(screen, YELLOW, (int(self.x), int(self.y)), radius)
             pygame.draw.circle(screen, ORANGE, (int(self.x), int(self.y)), int(radius * 0.7))
             pygame.draw.circle(screen, RED, (int(self.x), int(self.y)), int(radius * 0.4))
+            return outer
+        return None
             
     def is_finished(self) -> bool:
         return self.timer >= self.max_timer
 
+# Trail dots by colour and alpha; the alpha only takes effect when a
+# translucent sprite is blitted, not when drawing straight onto the screen
+@functools.lru_cache(maxsize=None)
+def trail_dot(color: Tuple[int, int, int], alpha: int) -> pygame.Surface:
+    dot = pygame.Surface((5, 5), pygame.SRCALPHA)
+    pygame.draw.circle(dot, color + (alpha,), (2, 2), 2)
+    return dot.convert_alpha()
+
+def trail_blits(trails: List[List[List[float]]], color: Tuple[int, int, int]) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+    # (dot, position) pairs for Surface.blits, fading in from the oldest
+    # point, which is fully transparent and left out
+    blits = []
+    for trail in trails:
+        length = len(trail)
+        for i in range(1, length):
+            trail_x, trail_y = trail[i]
+            blits.append((trail_dot(color, int(255 * (i / length))), (int(trail_x) - 2, int(trail_y) - 2)))
+    return blits
+
+# Rendered labels, keyed by font, text and colour; UI numbers change rarely
+# so most frames are served from here instead of re-rasterizing glyphs
+@functools.lru_cache(maxsize=64)
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    return font.render(text, True, color).convert_alpha()
+
 class Game:
     def __init__(self):
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -225,8 +334,8 @@ class Game:
         
         # Game objects
         self.cities = []
-        self.missiles = []
-        self.interceptors = []
+        self.missiles = Projectiles(MAX_MISSILES, Missile.SPEED, Missile.TRAIL_LENGTH)
+        self.interceptors = Interceptors(MAX_INTERCEPTORS, Interceptor.SPEED, Interceptor.TRAIL_LENGTH)
         self.explosions = []
         
         # Game state
@@ -243,10 +352,30 @@ class Game:
         # Initialize cities
         self.init_cities()
         
+        # Sky, ground and launcher never change, so they are drawn once and
+        # each frame starts from a copy
+        self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.background.fill(BLACK)
+        pygame.draw.rect(self.background, DARK_GREEN, (0, SCREEN_HEIGHT - 20, SCREEN_WIDTH, 20))
+        launcher_x = SCREEN_WIDTH // 2
+        launcher_y = SCREEN_HEIGHT - 20
+        pygame.draw.rect(self.background, GRAY, (launcher_x - 10, launcher_y - 15, 20, 15))
+        pygame.draw.rect(self.background, DARK_GREEN, (launcher_x - 8, launcher_y - 13, 16, 11))
+        # Screen areas drawn over last frame, None until the first full frame
+        self.dirty_rects: Optional[List[pygame.Rect]] = None
+        
         # Font
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         
+        # The first two instruction lines never change, so they are rendered once
+        instructions = [
+            "Click to launch interceptors",
+            "Defend your cities!"
+        ]
+        self.instruction_texts = [self.small_font.render(instruction, True, WHITE).convert_alpha()
+                                  for instruction in instructions]
+        
     def init_cities(self):
         city_width = 40
         spacing = 60
@@ -257,13 +386,22 @@ class Game:
             x = start_x + i * spacing
             self.cities.append(City(x, y))
             
+        # Cities are spaced more than a bucket apart, so each bucket holds
+        # at most one city index
+        self.city_by_bucket: List[Optional[int]] = [None] * (SCREEN_WIDTH // CITY_CELL + 1)
+        for i, city in enumerate(self.cities):
+            for bucket in range(city.x // CITY_CELL, (city.x + city.width) // CITY_CELL + 1):
+                self.city_by_bucket[bucket] = i
+        # Indices of the standing cities, kept up to date as they fall
+        self.alive_cities = list(range(len(self.cities)))
+            
     def spawn_missile(self):
         if random.random() < 0.3:  # 30% chance each frame when timer is ready
             start_x = random.randint(50, SCREEN_WIDTH - 50)
-            target_city = random.choice([city for city in self.cities if not city.destroyed])
+            target_city = self.cities[random.choice(self.alive_cities)]
             if target_city:
-                self.missiles.append(Missile(start_x, target_city.x + target_city.width//2, target_city.y))
-                self.missiles_launched += 1
+                if self.missiles.spawn(start_x, 0, target_city.x + target_city.width//2, target_city.y) >= 0:
+                    self.missiles_launched += 1
                 
     def handle_input(self):
         for event in pygame.event.get():
@@ -278,7 +416,7 @@ class Game:
         launcher_x = SCREEN_WIDTH // 2
         launcher_y = SCREEN_HEIGHT - 20
         
-        self.interceptors.append(Interceptor(launcher_x, launcher_y, target_x, target_y))
+        self.interceptors.spawn(launcher_x, launcher_y, target_x, target_y)
         
     def update(self):
         # Spawn missiles
@@ -288,47 +426,67 @@ class Game:
             self.missile_spawn_timer = 0
             
         # Update missiles
-        for missile in self.missiles[:]:
-            missile.update()
-            
-            # Check collision with cities
-            for city in self.cities:
-                if missile.check_collision(city):
-                    city.destroyed = True
-                    missile.destroyed = True
-                    self.explosions.append(Explosion(missile.x, missile.y))
-                    self.lives -= 1
-                    break
-                    
-            # Remove missiles that are off screen or destroyed
-            if missile.y > SCREEN_HEIGHT + 50 or missile.destroyed:
-                if missile in self.missiles:
-                    self.missiles.remove(missile)
+        missiles = self.missiles
+        n = missiles.n
+        missiles.step(np.arange(n))
+        missile_alive = np.ones(n, dtype=bool)
+        mx, my = missiles.x[:n].tolist(), missiles.y[:n].tolist()
+        cities, city_by_bucket, explosions = self.cities, self.city_by_bucket, self.explosions
+        for m in np.flatnonzero(missiles.y[:n] >= SCREEN_HEIGHT - 50).tolist():
+            # Remove missiles that are off screen; only these low ones can be
+            x, y = mx[m], my[m]
+            if y > SCREEN_HEIGHT + 50:
+                missile_alive[m] = False
+                continue
+            # Check collision with the city below, if any
+            if not 0 <= x <= SCREEN_WIDTH:
+                continue
+            c = city_by_bucket[int(x) // CITY_CELL]
+            if c is not None and Missile.check_collision(x, y, cities[c]):
+                cities[c].destroy()
+                self.alive_cities.remove(c)
+                missile_alive[m] = False
+                explosions.append(Explosion(x, y))
+                self.lives -= 1
                     
         # Update interceptors
-        for interceptor in self.interceptors[:]:
-            interceptor.update()
-            
-            # Check collision with missiles
-            for missile in self.missiles[:]:
-                if interceptor.check_collision(missile):
-                    missile.destroyed = True
-                    interceptor.destroyed = True
-                    self.explosions.append(Explosion(missile.x, missile.y))
-                    self.score += 100
-                    self.missiles_destroyed += 1
-                    break
+        interceptors = self.interceptors
+        interceptors.update()
+        k = interceptors.n
+        interceptor_alive = np.ones(k, dtype=bool)
+        
+        # Check collision with missiles: squared distances for every pair at
+        # once, then each interceptor in turn takes the first missile in its
+        # reach that an earlier interceptor hasn't already hit
+        live_missiles = np.flatnonzero(missile_alive)
+        dx = interceptors.x[:k, None] - missiles.x[live_missiles]
+        dy = interceptors.y[:k, None] - missiles.y[live_missiles]
+        reach = np.where(interceptors.exploded[:k], Interceptor.EXPLOSION_RADIUS, Interceptor.HIT_RADIUS)
+        hits = dx * dx + dy * dy < (reach * reach)[:, None]
+        for i in np.flatnonzero(hits.any(axis=1)).tolist():
+            for m in live_missiles[hits[i]].tolist():
+                if not missile_alive[m]:
+                    continue
+                missile_alive[m] = False
+                interceptor_alive[i] = False
+                explosions.append(Explosion(mx[m], my[m]))
+                self.score += 100
+                self.missiles_destroyed += 1
+                break
                     
-            # Remove destroyed interceptors
-            if interceptor.destroyed:
-                if interceptor in self.interceptors:
-                    self.interceptors.remove(interceptor)
+        missiles.remove(np.flatnonzero(~missile_alive).tolist())
+        interceptors.remove(np.flatnonzero(~interceptor_alive).tolist())
                     
-        # Update explosions
-        for explosion in self.explosions[:]:
+        # Update explosions; a finished one is replaced by the last in the list
+        i = 0
+        while i < len(explosions):
+            explosion = explosions[i]
             explosion.update()
             if explosion.is_finished():
-                self.explosions.remove(explosion)
+                explosions[i] = explosions[-1]
+                explosions.pop()
+            else:
+                i += 1
                 
         # Check game over
         if self.lives <= 0:
@@ -340,58 +498,86 @@ class Game:
             self.missile_spawn_delay = max(30, self.missile_spawn_delay - 10)
             
     def draw(self):
-        self.screen.fill(BLACK)
-        
-        # Draw ground
-        pygame.draw.rect(self.screen, DARK_GREEN, (0, SCREEN_HEIGHT - 20, SCREEN_WIDTH, 20))
-        
-        # Draw launcher
-        launcher_x = SCREEN_WIDTH // 2
-        launcher_y = SCREEN_HEIGHT - 20
-        pygame.draw.rect(self.screen, GRAY, (launcher_x - 10, launcher_y - 15, 20, 15))
-        pygame.draw.rect(self.screen, DARK_GREEN, (launcher_x - 8, launcher_y - 13, 16, 11))
+        # Draw sky, ground and launcher: on the first frame all of it, after
+        # that only where last frame's sprites need erasing
+        screen = self.screen
+        background, previous = self.background, self.dirty_rects
+        if previous is None:
+            screen.blit(background, (0, 0))
+        else:
+            for rect in previous:
+                screen.blit(background, rect, rect)
+        dirty = []
+        drawn = dirty.append
         
         # Draw game objects
         for city in self.cities:
-            city.draw(self.screen)
+            drawn(city.draw(screen))
+            
+        # Trails of everything in flight go down first, in one batch
+        missiles, interceptors = self.missiles, self.interceptors
+        interceptor_exploded = interceptors.exploded[:interceptors.n].tolist()
+        interceptor_trails = [trail for trail, exploded in zip(interceptors.ordered_trails(), interceptor_exploded)
+                              if not exploded]
+        dots = trail_blits(missiles.ordered_trails(), Missile.TRAIL_COLOR)
+        dots += trail_blits(interceptor_trails, Interceptor.TRAIL_COLOR)
+        dirty.extend(screen.blits(dots))
             
-        for missile in self.missiles:
-            missile.draw(self.screen)
+        draw_missile = Missile.draw
+        n = missiles.n
+        for x, y in zip(missiles.x[:n].tolist(), missiles.y[:n].tolist()):
+            drawn(draw_missile(screen, x, y))
             
-        for interceptor in self.interceptors:
-            interceptor.draw(self.screen)
+        draw_interceptor, draw_explosion = Interceptor.draw, Interceptor.draw_explosion
+        n = interceptors.n
+        for x, y, exploded, timer in zip(interceptors.x[:n].tolist(), interceptors.y[:n].tolist(),
+                                         interceptor_exploded, interceptors.explosion_timer[:n].tolist()):
+            if exploded:
+                drawn(draw_explosion(screen, x, y, timer))
+            else:
+                drawn(draw_interceptor(screen, x, y))
             
         for explosion in self.explosions:
-            explosion.draw(self.screen)
+            rect = explosion.draw(screen)
+            if rect:
+                drawn(rect)
             
         # Draw UI
-        self.draw_ui()
+        dirty.extend(self.draw_ui())
         
-        pygame.display.flip()
+        # Only present what changed: this frame's sprites and the erased
+        # places of last frame's
+        if previous is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(previous + dirty)
+        self.dirty_rects = dirty
+        
+    def draw_ui(self) -> List[pygame.Rect]:
+        # Returns the areas drawn over
+        screen = self.screen
+        drawn = []
         
-    def draw_ui(self):
         # Score
-        score_text = self.font.render(f"Score: {self.score}", True, WHITE)
-        self.screen.blit(score_text, (10, 10))
+        score_text = render_text(self.font, f"Score: {self.score}", WHITE)
+        drawn.append(screen.blit(score_text, (10, 10)))
         
         # Lives
-        lives_text = self.font.render(f"Lives: {self.lives}", True, WHITE)
-        self.screen.blit(lives_text, (10, 50))
+        lives_text = render_text(self.font, f"Lives: {self.lives}", WHITE)
+        drawn.append(screen.blit(lives_text, (10, 50)))
         
         # Level
-        level_text = self.font.render(f"Level: {self.level}", True, WHITE)
-        self.screen.blit(level_text, (10, 90))
+        level_text = render_text(self.font, f"Level: {self.level}", WHITE)
+        drawn.append(screen.blit(level_text, (10, 90)))
         
         # Instructions
-        instructions = [
-            "Click to launch interceptors",
-            "Defend your cities!",
-            f"Missiles destroyed: {self.missiles_destroyed}"
+        texts = self.instruction_texts + [
+            render_text(self.small_font, f"Missiles destroyed: {self.missiles_destroyed}", WHITE)
         ]
         
-        for i, instruction in enumerate(instructions):
-            text = self.small_font.render(instruction, True, WHITE)
-            self.screen.blit(text, (SCREEN_WIDTH - 250, 10 + i * 25))
+        for i, text in enumerate(texts):
+            drawn.append(screen.blit(text, (SCREEN_WIDTH - 250, 10 + i * 25)))
+        return drawn
             
     def game_over(self):
         game_over_text = self.font.render("GAME OVER", True, RED)
@@ -1,6 +1,9 @@
 import pygame
 import math
+import functools
 import random
+from array import array
+from bisect import bisect_right
 from typing import List, Tuple, Optional
 
 # Initialize pygame
@@ -10,6 +13,7 @@ pygame.init()
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
+GRID_CELL = 64  # broad-phase cell size, must be at least the largest hit radius
 
 # Colors
 BLACK = (0, 0, 0)
@@ -19,10 +23,14 @@ GREEN = (0, 255, 0)
 BLUE = (0, 0, 255)
 YELLOW = (255, 255, 0)
 ORANGE = (255, 165, 0)
+CYAN = (0, 255, 255)
 GRAY = (128, 128, 128)
 DARK_GREEN = (0, 100, 0)
 
 class City:
+    # Sprites cover the roof above the city and rubble spilling past its edges
+    SPRITE_OFFSET = (-2, -10)
+    
     def __init__(self, x: int, y: int):
         self.x = x
         self.y = y
@@ -30,48 +38,113 @@ class City:
         self.height = 30
         self.destroyed = False
         self.health = 100
+        self.rect = pygame.Rect(x, y, self.width, self.height)
+        self._surf_ok = self.build_sprite(False)
+        self._surf_dead = None
         
-    def draw(self, screen):
-        if not self.destroyed:
+    def build_sprite(self, destroyed: bool) -> pygame.Surface:
+        ox, oy = self.SPRITE_OFFSET
+        surf = pygame.Surface((self.width - 2 * ox + 1, self.height - oy + 3), pygame.SRCALPHA)
+        x, y = -ox, -oy
+        if not destroyed:
             # City building
-            pygame.draw.rect(screen, DARK_GREEN, (self.x, self.y, self.width, self.height))
+            pygame.draw.rect(surf, DARK_GREEN, (x, y, self.width, self.height))
             # Windows
             for i in range(3):
                 for j in range(2):
-                    window_x = self.x + 5 + i * 10
-                    window_y = self.y + 5 + j * 10
-                    pygame.draw.rect(screen, YELLOW, (window_x, window_y, 6, 6))
+                    window_x = x + 5 + i * 10
+                    window_y = y + 5 + j * 10
+                    pygame.draw.rect(surf, YELLOW, (window_x, window_y, 6, 6))
             # Roof
-            pygame.draw.polygon(screen, GRAY, [
-                (self.x, self.y),
-                (self.x + self.width // 2, self.y - 10),
-                (self.x + self.width, self.y)
+            pygame.draw.polygon(surf, GRAY, [
+                (x, y),
+                (x + self.width // 2, y - 10),
+                (x + self.width, y)
             ])
         else:
             # Destroyed city
-            pygame.draw.rect(screen, RED, (self.x, self.y, self.width, self.height))
-            # Rubble
+            pygame.draw.rect(surf, RED, (x, y, self.width, self.height))
+            # Rubble, scattered once when the city falls
             for _ in range(5):
-                rubble_x = self.x + random.randint(0, self.width)
-                rubble_y = self.y + random.randint(0, self.height)
-                pygame.draw.circle(screen, GRAY, (rubble_x, rubble_y), 2)
+                rubble_x = x + random.randint(0, self.width)
+                rubble_y = y + random.randint(0, self.height)
+                pygame.draw.circle(surf, GRAY, (rubble_x, rubble_y), 2)
+        return surf
+        
+    def draw(self, screen) -> pygame.Rect:
+        if not self.destroyed:
+            surf = self._surf_ok
+        else:
+            if self._surf_dead is None:
+                self._surf_dead = self.build_sprite(True)
+            surf = self._surf_dead
+        return screen.blit(surf, (self.x + self.SPRITE_OFFSET[0], self.y + self.SPRITE_OFFSET[1]))
+
+# Trail dots by colour and alpha; the alpha only takes effect when a
+# translucent sprite is blitted, not when drawing straight onto the screen
+@functools.lru_cache(maxsize=None)
+def trail_dot(color: Tuple[int, int, int], alpha: int) -> pygame.Surface:
+    dot = pygame.Surface((5, 5), pygame.SRCALPHA)
+    pygame.draw.circle(dot, color + (alpha,), (2, 2), 2)
+    return dot.convert_alpha()
+
+class Trail:
+    # The last `length` positions as a ring of int16 (x, y) pairs; a trail
+    # only lives on screen, so the pixel coordinates fit
+    def __init__(self, length: int):
+        self.points = array('h', bytes(4 * length))
+        self.length = length
+        self.head = 0
+        self.count = 0
+        
+    def clear(self):
+        self.head = 0
+        self.count = 0
+        
+    def append(self, x: float, y: float):
+        # Overwrites the oldest point once the ring is full
+        i = 2 * self.head
+        self.points[i] = int(x)
+        self.points[i + 1] = int(y)
+        self.head = (self.head + 1) % self.length
+        if self.count < self.length:
+            self.count += 1
+            
+    def draw(self, screen, color: Tuple[int, int, int]) -> List[pygame.Rect]:
+        # Fades in from the oldest point, which is fully transparent and
+        # left out; returns the areas drawn over
+        points, length, count = self.points, self.length, self.count
+        start = self.head - count
+        drawn = []
+        for i in range(1, count):
+            j = 2 * ((start + i) % length)
+            dot = trail_dot(color, int(255 * (i / count)))
+            drawn.append(screen.blit(dot, (points[j] - 2, points[j + 1] - 2)))
+        return drawn
+
+# Launch velocities by offset to the target and speed. Missiles aim at one
+# of eight city centres and interceptors leave the fixed launcher, so
+# repeated launches are served from here instead of a fresh hypot
+@functools.lru_cache(maxsize=4096)
+def launch_velocity(dx: int, dy: int, speed: float) -> Tuple[float, float]:
+    scale = speed / math.hypot(dx, dy)
+    return dx * scale, dy * scale
 
 class Missile:
-    def __init__(self, start_x: int, target_x: int, target_y: int):
+    def __init__(self):
+        self.trail = Trail(10)
+        
+    def reset(self, start_x: int, target_x: int, target_y: int):
         self.x = start_x
         self.y = 0
         self.target_x = target_x
         self.target_y = target_y
         self.speed = 2
         self.destroyed = False
-        self.trail = []
+        self.trail.clear()
         
         # Calculate direction
-        dx = target_x - start_x
-        dy = target_y - 0
-        distance = math.sqrt(dx**2 + dy**2)
-        self.dx = (dx / distance) * self.speed
-        self.dy = (dy / distance) * self.speed
+        self.dx, self.dy = launch_velocity(target_x - start_x, target_y, self.speed)
         
     def update(self):
         if not self.destroyed:
@@ -79,45 +152,45 @@ class Missile:
             self.y += self.dy
             
             # Add to trail
-            self.trail.append((self.x, self.y))
-            if len(self.trail) > 10:
-                self.trail.pop(0)
+            self.trail.append(self.x, self.y)
                 
-    def draw(self, screen):
+    def draw(self, screen) -> Optional[pygame.Rect]:
+        # Returns the area drawn over, if any
         if not self.destroyed:
             # Draw trail
-            for i, (trail_x, trail_y) in enumerate(self.trail):
-                alpha = int(255 * (i / len(self.trail)))
-                color = (255, 255, 0, alpha)
-                pygame.draw.circle(screen, color, (int(trail_x), int(trail_y)), 2)
+            drawn = self.trail.draw(screen, YELLOW)
             
             # Draw missile
-            pygame.draw.circle(screen, RED, (int(self.x), int(self.y)), 4)
+            rect = pygame.draw.circle(screen, RED, (int(self.x), int(self.y)), 4)
             pygame.draw.circle(screen, ORANGE, (int(self.x), int(self.y)), 2)
+            return rect.unionall(drawn)
+        return None
             
     def check_collision(self, city: City) -> bool:
         if self.destroyed or city.destroyed:
             return False
-        return (self.x > city.x and self.x < city.x + city.width and
-                self.y > city.y and self.y < city.y + city.height)
+        return city.rect.collidepoint(self.x, self.y)
 
 class Interceptor:
-    def __init__(self, x: int, y: int, target_x: int, target_y: int):
+    HIT_RADIUS_SQ = 8 * 8
+    
+    def __init__(self):
+        self.trail = Trail(8)
+        
+    def reset(self, x: int, y: int, target_x: int, target_y: int):
         self.x = x
         self.y = y
         self.target_x = target_x
         self.target_y = target_y
         self.speed = 4
         self.destroyed = False
-        self.trail = []
+        self.trail.clear()
         
         # Calculate direction
         dx = target_x - x
         dy = target_y - y
-        distance = math.sqrt(dx**2 + dy**2)
-        if distance > 0:
-            self.dx = (dx / distance) * self.speed
-            self.dy = (dy / distance) * self.speed
+        if dx or dy:
+            self.dx, self.dy = launch_velocity(dx, dy, self.speed)
         else:
             self.dx = 0
             self.dy = -self.speed
@@ -128,30 +201,29 @@ class Interceptor:
             self.y += self.dy
             
             # Add to trail
-            self.trail.append((self.x, self.y))
-            if len(self.trail) > 8:
-                self.trail.pop(0)
+            self.trail.append(self.x, self.y)
                 
-    def draw(self, screen):
+    def draw(self, screen) -> Optional[pygame.Rect]:
+        # Returns the area drawn over, if any
         if not self.destroyed:
             # Draw trail
-            for i, (trail_x, trail_y) in enumerate(self.trail):
-                alpha = int(255 * (i / len(self.trail)))
-                color = (0, 255, 255, alpha)
-                pygame.draw.circle(screen, color, (int(trail_x), int(trail_y)), 2)
+            drawn = self.trail.draw(screen, CYAN)
             
             # Draw interceptor
-            pygame.draw.circle(screen, BLUE, (int(self.x), int(self.y)), 3)
+            rect = pygame.draw.circle(screen, BLUE, (int(self.x), int(self.y)), 3)
             pygame.draw.circle(screen, WHITE, (int(self.x), int(self.y)), 1)
+            return rect.unionall(drawn)
+        return None
             
     def check_collision(self, missile: Missile) -> bool:
         if self.destroyed or missile.destroyed:
             return False
-        distance = math.sqrt((self.x - missile.x)**2 + (self.y - missile.y)**2)
-        return distance < 8
+        dx = self.x - missile.x
+        dy = self.y - missile.y
+        return dx * dx + dy * dy < self.HIT_RADIUS_SQ
 
 class Explosion:
-    def __init__(self, x: int, y: int):
+    def reset(self, x: int, y: int):
         self.x = x
         self.y = y
         self.radius = 5
@@ -163,15 +235,73 @@ class Explosion:
         self.life -= 1
         self.radius = self.max_radius * (1 - self.life / self.max_life)
         
-    def draw(self, screen):
+    def draw(self, screen) -> Optional[pygame.Rect]:
         if self.life > 0:
             alpha = int(255 * (self.life / self.max_life))
             color = (255, 255, 0, alpha)
-            pygame.draw.circle(screen, color, (int(self.x), int(self.y)), int(self.radius))
+            return pygame.draw.circle(screen, color, (int(self.x), int(self.y)), int(self.radius))
+        return None
             
     def is_dead(self) -> bool:
         return self.life <= 0
 
+class Pool:
+    # Recycles objects through their reset() method instead of building new ones
+    def __init__(self, cls, size: int):
+        self.cls = cls
+        self.free = [cls() for _ in range(size)]
+        
+    def get(self, *args):
+        obj = self.free.pop() if self.free else self.cls()
+        obj.reset(*args)
+        return obj
+    
+    def release(self, obj):
+        self.free.append(obj)
+
+class SpatialHash:
+    def __init__(self, cell: int = GRID_CELL):
+        self.cell = cell
+        self.buckets = {}
+        
+    def clear(self):
+        self.buckets.clear()
+        
+    def insert(self, item, x: float, y: float):
+        key = (int(x) // self.cell, int(y) // self.cell)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            self.buckets[key] = [item]
+        else:
+            bucket.append(item)
+            
+    def query(self, x: float, y: float) -> list:
+        # Items in the cell containing (x, y) and its 8 neighbours
+        cx = int(x) // self.cell
+        cy = int(y) // self.cell
+        found = []
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                bucket = self.buckets.get((gx, gy))
+                if bucket:
+                    found.extend(bucket)
+        return found
+
+class CachedText:
+    # A label whose surface is re-rendered only when its value changes
+    def __init__(self, font: pygame.font.Font, template: str, color: Tuple[int, int, int]):
+        self.font = font
+        self.template = template
+        self.color = color
+        self._last = None
+        self._surf = None
+        
+    def get(self, value) -> pygame.Surface:
+        if self._surf is None or value != self._last:
+            self._surf = self.font.render(self.template.format(value), True, self.color)
+            self._last = value
+        return self._surf
+
 class Game:
     def __init__(self):
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -180,6 +310,16 @@ class Game:
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         
+        # UI text: numeric labels re-render only when their value changes,
+        # fixed strings are rendered once here
+        self.score_text = CachedText(self.font, "Score: {}", WHITE)
+        self.lives_text = CachedText(self.font, "Lives: {}", WHITE)
+        self.level_text = CachedText(self.font, "Level: {}", WHITE)
+        self.final_score_text = CachedText(self.font, "Final Score: {}", WHITE)
+        self.instructions_text = self.small_font.render("Click to launch interceptors!", True, WHITE)
+        self.game_over_text = self.font.render("GAME OVER", True, RED)
+        self.restart_text = self.small_font.render("Press R to restart", True, WHITE)
+        
         # Game state
         self.score = 0
         self.lives = 3
@@ -193,6 +333,24 @@ class Game:
         self.missiles = []
         self.interceptors = []
         self.explosions = []
+        self.missile_pool = Pool(Missile, 32)
+        self.interceptor_pool = Pool(Interceptor, 32)
+        self.explosion_pool = Pool(Explosion, 32)
+        
+        # Cities never move and share one row, so a missile can only hit
+        # once below their top edge, and then only the city starting
+        # nearest to its left
+        self.city_top = min(city.y for city in self.cities)
+        self.city_xs = array('i', sorted(city.x for city in self.cities))
+        self.cities_by_x = {city.x: city for city in self.cities}
+        self.missile_grid = SpatialHash()
+        
+        # Static scenery, and the screen areas drawn over last frame; None
+        # until the first full frame has been presented
+        self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.background.fill(BLACK)
+        pygame.draw.rect(self.background, DARK_GREEN, (0, SCREEN_HEIGHT - 20, SCREEN_WIDTH, 20))
+        self.dirty_rects: Optional[List[pygame.Rect]] = None
         
         # Timing
         self.missile_timer = 0
@@ -217,13 +375,13 @@ class Game:
             if available_cities:
                 target_city = random.choice(available_cities)
                 start_x = random.randint(50, SCREEN_WIDTH - 50)
-                missile = Missile(start_x, target_city.x + target_city.width // 2, target_city.y)
+                missile = self.missile_pool.get(start_x, target_city.x + target_city.width // 2, target_city.y)
                 self.missiles.append(missile)
                 self.missiles_launched += 1
     
     def launch_interceptor(self, mouse_x: int, mouse_y: int):
         if len(self.interceptors) < 3:  # Limit active interceptors
-            interceptor = Interceptor(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 20, mouse_x, mouse_y)
+            interceptor = self.interceptor_pool.get(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 20, mouse_x, mouse_y)
             self.interceptors.append(interceptor)
     
     def update(self):
@@ -238,49 +396,71 @@ class Game:
             # Increase difficulty
             self.missile_delay = max(60, self.missile_delay - 2)
         
-        # Update missiles
-        for missile in self.missiles[:]:
+        # Update missiles; walking backwards lets a removed missile's slot
+        # take the last one, which has already been visited
+        missiles = self.missiles
+        for i in range(len(missiles) - 1, -1, -1):
+            missile = missiles[i]
             missile.update()
             
             # Check if missile hit a city
-            for city in self.cities:
-                if missile.check_collision(city):
-                    city.destroyed = True
-                    missile.destroyed = True
-                    explosion = Explosion(missile.x, missile.y)
-                    self.explosions.append(explosion)
-                    self.lives -= 1
-                    break
+            if missile.y > self.city_top:
+                index = bisect_right(self.city_xs, missile.x) - 1
+                if index >= 0:
+                    city = self.cities_by_x[self.city_xs[index]]
+                    if missile.check_collision(city):
+                        city.destroyed = True
+                        missile.destroyed = True
+                        explosion = self.explosion_pool.get(missile.x, missile.y)
+                        self.explosions.append(explosion)
+                        self.lives -= 1
             
             # Remove missiles that are off screen or destroyed
             if missile.y > SCREEN_HEIGHT or missile.destroyed:
-                self.missiles.remove(missile)
+                missiles[i] = missiles[-1]
+                missiles.pop()
+                self.missile_pool.release(missile)
+        
+        # Bucket the surviving missiles for the interceptor checks
+        self.missile_grid.clear()
+        for index, missile in enumerate(self.missiles):
+            self.missile_grid.insert((index, missile), missile.x, missile.y)
         
         # Update interceptors
-        for interceptor in self.interceptors[:]:
+        interceptors = self.interceptors
+        for i in range(len(interceptors) - 1, -1, -1):
+            interceptor = interceptors[i]
             interceptor.update()
             
-            # Check collision with missiles
-            for missile in self.missiles[:]:
+            # Check collision with missiles in the neighbouring cells
+            nearby = self.missile_grid.query(interceptor.x, interceptor.y)
+            nearby.sort()  # test in list order, as the full scan did
+            for _, missile in nearby:
                 if interceptor.check_collision(missile):
                     missile.destroyed = True
                     interceptor.destroyed = True
-                    explosion = Explosion(missile.x, missile.y)
+                    explosion = self.explosion_pool.get(missile.x, missile.y)
                     self.explosions.append(explosion)
                     self.score += 100
                     self.missiles_destroyed += 1
                     break
             
             # Remove interceptors that are off screen or destroyed
-            if interceptor.y < 0 or interceptor.destroyed:
-                if interceptor in self.interceptors:
-                    self.interceptors.remove(interceptor)
+            if (interceptor.destroyed or interceptor.y < 0 or interceptor.y > SCREEN_HEIGHT or
+                interceptor.x < 0 or interceptor.x > SCREEN_WIDTH):
+                interceptors[i] = interceptors[-1]
+                interceptors.pop()
+                self.interceptor_pool.release(interceptor)
         
         # Update explosions
-        for explosion in self.explosions[:]:
+        explosions = self.explosions
+        for i in range(len(explosions) - 1, -1, -1):
+            explosion = explosions[i]
             explosion.update()
             if explosion.is_dead():
-                self.explosions.remove(explosion)
+                explosions[i] = explosions[-1]
+                explosions.pop()
+                self.explosion_pool.release(explosion)
         
         # Check game over
         if self.lives <= 0:
@@ -292,59 +472,65 @@ class Game:
             self.missiles_destroyed = 0
     
     def draw(self):
-        self.screen.fill(BLACK)
-        
-        # Draw ground
-        pygame.draw.rect(self.screen, DARK_GREEN, (0, SCREEN_HEIGHT - 20, SCREEN_WIDTH, 20))
+        screen = self.screen
+        # Draw sky and ground: on the first frame all of it, after that only
+        # where last frame's sprites need erasing
+        background, previous = self.background, self.dirty_rects
+        if previous is None:
+            screen.blit(background, (0, 0))
+        else:
+            for rect in previous:
+                screen.blit(background, rect, rect)
+        dirty = []
         
         # Draw cities
         for city in self.cities:
-            city.draw(self.screen)
-        
-        # Draw missiles
-        for missile in self.missiles:
-            missile.draw(self.screen)
-        
-        # Draw interceptors
-        for interceptor in self.interceptors:
-            interceptor.draw(self.screen)
+            dirty.append(city.draw(screen))
         
-        # Draw explosions
-        for explosion in self.explosions:
-            explosion.draw(self.screen)
+        # Draw missiles, interceptors and explosions
+        for group in (self.missiles, self.interceptors, self.explosions):
+            for obj in group:
+                rect = obj.draw(screen)
+                if rect:
+                    dirty.append(rect)
         
         # Draw UI
-        self.draw_ui()
+        dirty.extend(self.draw_ui())
         
-        pygame.display.flip()
+        # Only present what changed: this frame's sprites and the erased
+        # places of last frame's
+        if previous is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(previous + dirty)
+        self.dirty_rects = dirty
     
-    def draw_ui(self):
+    def draw_ui(self) -> List[pygame.Rect]:
+        # Returns the areas drawn over
+        screen = self.screen
+        drawn = []
+        
         # Score
-        score_text = self.font.render(f"Score: {self.score}", True, WHITE)
-        self.screen.blit(score_text, (10, 10))
+        drawn.append(screen.blit(self.score_text.get(self.score), (10, 10)))
         
         # Lives
-        lives_text = self.font.render(f"Lives: {self.lives}", True, WHITE)
-        self.screen.blit(lives_text, (10, 50))
+        drawn.append(screen.blit(self.lives_text.get(self.lives), (10, 50)))
         
         # Level
-        level_text = self.font.render(f"Level: {self.level}", True, WHITE)
-        self.screen.blit(level_text, (10, 90))
+        drawn.append(screen.blit(self.level_text.get(self.level), (10, 90)))
         
         # Instructions
         if not self.game_over:
-            instructions = self.small_font.render("Click to launch interceptors!", True, WHITE)
-            self.screen.blit(instructions, (SCREEN_WIDTH // 2 - 100, 10))
+            drawn.append(screen.blit(self.instructions_text, (SCREEN_WIDTH // 2 - 100, 10)))
         
         # Game over screen
         if self.game_over:
-            game_over_text = self.font.render("GAME OVER", True, RED)
-            final_score_text = self.font.render(f"Final Score: {self.score}", True, WHITE)
-            restart_text = self.small_font.render("Press R to restart", True, WHITE)
+            final_score_text = self.final_score_text.get(self.score)
             
-            self.screen.blit(game_over_text, (SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 - 50))
-            self.screen.blit(final_score_text, (SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2))
-            self.screen.blit(restart_text, (SCREEN_WIDTH // 2 - 80, SCREEN_HEIGHT // 2 + 50))
+            drawn.append(screen.blit(self.game_over_text, (SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 - 50)))
+            drawn.append(screen.blit(final_score_text, (SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2)))
+            drawn.append(screen.blit(self.restart_text, (SCREEN_WIDTH // 2 - 80, SCREEN_HEIGHT // 2 + 50)))
+        return drawn
     
     def handle_events(self):
         for event in pygame.event.get():
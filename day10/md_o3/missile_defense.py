@@ -1,6 +1,8 @@
 import pygame
 import math
+import functools
 import random
+import numpy as np
 from typing import List, Tuple, Optional
 
 # Initialize Pygame
@@ -10,6 +12,8 @@ pygame.init()
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
+MAX_MISSILES = 256  # slots in each missile buffer
+MAX_EXPLOSIONS = 64  # slots in the explosion buffer
 
 # Colors
 BLACK = (0, 0, 0)
@@ -30,140 +34,221 @@ class City:
         self.height = 30
         self.destroyed = False
         self.health = 100
+        self.rect = pygame.Rect(x, y, self.width, self.height)
+        self._surf_ok = self.build_sprite(False)
+        self._surf_dead = None
         
-    def draw(self, screen):
-        if not self.destroyed:
+    def build_sprite(self, destroyed: bool) -> pygame.Surface:
+        """Render the city, roof included, onto its own surface"""
+        surf = pygame.Surface((self.width + 1, self.height + 10), pygame.SRCALPHA)
+        if not destroyed:
             # City building
-            pygame.draw.rect(screen, GRAY, (self.x, self.y, self.width, self.height))
+            pygame.draw.rect(surf, GRAY, (0, 10, self.width, self.height))
             # Windows
             for i in range(3):
                 for j in range(2):
-                    window_x = self.x + 5 + i * 10
-                    window_y = self.y + 5 + j * 10
-                    pygame.draw.rect(screen, YELLOW, (window_x, window_y, 6, 6))
+                    window_x = 5 + i * 10
+                    window_y = 15 + j * 10
+                    pygame.draw.rect(surf, YELLOW, (window_x, window_y, 6, 6))
             # Roof
-            pygame.draw.polygon(screen, DARK_GREEN, [
-                (self.x, self.y),
-                (self.x + self.width // 2, self.y - 10),
-                (self.x + self.width, self.y)
+            pygame.draw.polygon(surf, DARK_GREEN, [
+                (0, 10),
+                (self.width // 2, 0),
+                (self.width, 10)
             ])
         else:
-            # Destroyed city (rubble)
-            pygame.draw.rect(screen, RED, (self.x, self.y, self.width, self.height))
+            # Destroyed city (rubble), scattered once when the city falls
+            pygame.draw.rect(surf, RED, (0, 10, self.width, self.height))
             for i in range(5):
-                rubble_x = self.x + random.randint(0, self.width - 5)
-                rubble_y = self.y + random.randint(0, self.height - 5)
-                pygame.draw.rect(screen, GRAY, (rubble_x, rubble_y, 3, 3))
-
-class Missile:
-    def __init__(self, x: int, y: int, target_x: int, target_y: int, speed: float = 2.0):
-        self.x = x
-        self.y = y
-        self.target_x = target_x
-        self.target_y = target_y
-        self.speed = speed
-        self.active = True
+                rubble_x = random.randint(0, self.width - 5)
+                rubble_y = 10 + random.randint(0, self.height - 5)
+                pygame.draw.rect(surf, GRAY, (rubble_x, rubble_y, 3, 3))
+        return surf
         
-        # Calculate direction
-        dx = target_x - x
-        dy = target_y - y
-        distance = math.sqrt(dx**2 + dy**2)
-        if distance > 0:
-            self.dx = (dx / distance) * speed
-            self.dy = (dy / distance) * speed
-        else:
-            self.dx = 0
-            self.dy = speed
-            
-    def update(self):
-        if self.active:
-            self.x += self.dx
-            self.y += self.dy
-            
-            # Check if missile has reached target
-            if self.y >= self.target_y:
-                self.active = False
-                
     def draw(self, screen):
-        if self.active:
-            # Missile body
-            pygame.draw.line(screen, RED, (self.x, self.y), (self.x, self.y - 10), 3)
-            # Missile tip
-            pygame.draw.polygon(screen, RED, [
-                (self.x, self.y - 10),
-                (self.x - 3, self.y - 15),
-                (self.x + 3, self.y - 15)
-            ])
-            # Trail
-            for i in range(3):
-                trail_y = self.y + 5 + i * 3
-                pygame.draw.circle(screen, ORANGE, (int(self.x), int(trail_y)), 1)
+        if not self.destroyed:
+            surf = self._surf_ok
+        else:
+            if self._surf_dead is None:
+                self._surf_dead = self.build_sprite(True)
+            surf = self._surf_dead
+        screen.blit(surf, (self.x, self.y - 10))
+
+# Spawn points, city targets and the launcher sit on fixed rows, so
+# repeated launches are served from the cache instead of a fresh hypot
+@functools.lru_cache(maxsize=4096)
+def aim(x: float, y: float, target_x: float, target_y: float, speed: float, default_dy: float) -> Tuple[float, float]:
+    """Velocity of the given speed from (x, y) towards the target"""
+    dx = target_x - x
+    dy = target_y - y
+    distance = math.hypot(dx, dy)
+    if distance > 0:
+        scale = speed / distance
+        return dx * scale, dy * scale
+    return 0, default_dy
+
+class MissileSystem:
+    # Every missile of one side, stored as one array per field; live
+    # missiles occupy slots [0, n) in launch order
+    def __init__(self, capacity: int = MAX_MISSILES):
+        self.x = np.empty(capacity, np.float32)
+        self.y = np.empty(capacity, np.float32)
+        self.dx = np.empty(capacity, np.float32)
+        self.dy = np.empty(capacity, np.float32)
+        self.target_y = np.empty(capacity, np.float32)
+        self.n = 0
+        
+    def spawn(self, x: float, y: float, dx: float, dy: float, target_y: float = 0.0) -> bool:
+        """Fill the next free slot, returning False when the buffer is full"""
+        n = self.n
+        if n == len(self.x):
+            return False
+        self.x[n] = x
+        self.y[n] = y
+        self.dx[n] = dx
+        self.dy[n] = dy
+        self.target_y[n] = target_y
+        self.n = n + 1
+        return True
+        
+    def keep(self, mask):
+        """Drop the missiles whose mask entry is False, preserving order"""
+        n = self.n
+        count = int(np.count_nonzero(mask))
+        if count < n:
+            for column in (self.x, self.y, self.dx, self.dy, self.target_y):
+                column[:count] = column[:n][mask]
+            self.n = count
+
+def step(enemy_x: np.ndarray, enemy_y: np.ndarray, enemy_dx: np.ndarray, enemy_dy: np.ndarray,
+         enemy_target_y: np.ndarray, player_x: np.ndarray, player_y: np.ndarray,
+         player_dx: np.ndarray, player_dy: np.ndarray,
+         hit_r2: float) -> Tuple[List[Tuple[float, float]], List[Tuple[float, float]], np.ndarray, np.ndarray]:
+    """Advance both missile systems one frame on their live slices, in place"""
+    # Returns where enemy missiles landed, where they were shot down, and
+    # the keep masks for the enemy and player systems
+    enemy_x += enemy_dx
+    enemy_y += enemy_dy
+    player_x += player_dx
+    player_y += player_dy
+    
+    # Enemy missiles land on reaching their target row; player missiles
+    # expire once they leave the top of the screen
+    landed = enemy_y >= enemy_target_y
+    enemy_alive = ~landed
+    player_alive = player_y >= 0
+    landings = list(zip(enemy_x[landed].tolist(), enemy_y[landed].tolist()))
+    
+    # Squared distances for every pair still flying; each player missile in
+    # turn takes the first enemy in range that is not already claimed
+    intercepts = []
+    dx = player_x[:, None] - enemy_x
+    dy = player_y[:, None] - enemy_y
+    in_range = (dx * dx + dy * dy < hit_r2) & enemy_alive & player_alive[:, None]
+    for i in np.flatnonzero(in_range.any(axis=1)).tolist():
+        targets = np.flatnonzero(in_range[i] & enemy_alive)
+        if targets.size:
+            j = targets[0]
+            enemy_alive[j] = False
+            player_alive[i] = False
+            intercepts.append((float(enemy_x[j]), float(enemy_y[j])))
+    return landings, intercepts, enemy_alive, player_alive
+
+class Missile:
+    # Enemy missiles live in a MissileSystem; this only draws one
+    @staticmethod
+    def draw(screen, x: float, y: float):
+        # Missile body
+        pygame.draw.line(screen, RED, (x, y), (x, y - 10), 3)
+        # Missile tip
+        pygame.draw.polygon(screen, RED, [
+            (x, y - 10),
+            (x - 3, y - 15),
+            (x + 3, y - 15)
+        ])
+        # Trail
+        for i in range(3):
+            trail_y = y + 5 + i * 3
+            pygame.draw.circle(screen, ORANGE, (int(x), int(trail_y)), 1)
 
 class PlayerMissile:
-    def __init__(self, x: int, y: int, target_x: int, target_y: int):
-        self.x = x
-        self.y = y
-        self.target_x = target_x
-        self.target_y = target_y
-        self.speed = 4.0
-        self.active = True
-        self.explosion_radius = 30
+    SPEED = 4.0
+    EXPLOSION_RADIUS = 30
+    HIT_R2 = EXPLOSION_RADIUS * EXPLOSION_RADIUS
+    
+    @staticmethod
+    def draw(screen, x: float, y: float):
+        # Missile body
+        pygame.draw.line(screen, GREEN, (x, y), (x, y + 10), 3)
+        # Missile tip
+        pygame.draw.polygon(screen, GREEN, [
+            (x, y + 10),
+            (x - 3, y + 15),
+            (x + 3, y + 15)
+        ])
+        # Trail
+        for i in range(3):
+            trail_y = y - 5 - i * 3
+            pygame.draw.circle(screen, YELLOW, (int(x), int(trail_y)), 1)
+
+class ExplosionSystem:
+    # Every explosion as one array per field; live explosions occupy slots
+    # [0, n) in spawn order
+    START_RADIUS = 5
+    MAX_RADIUS = 30
+    GROWTH_RATE = 2
+    
+    def __init__(self, capacity: int = MAX_EXPLOSIONS):
+        self.x = np.empty(capacity, np.float32)
+        self.y = np.empty(capacity, np.float32)
+        self.radius = np.empty(capacity, np.float32)
+        self.n = 0
+        
+    def spawn(self, x: float, y: float) -> bool:
+        """Start an explosion, returning False when the buffer is full"""
+        n = self.n
+        if n == len(self.x):
+            return False
+        self.x[n] = x
+        self.y[n] = y
+        self.radius[n] = self.START_RADIUS
+        self.n = n + 1
+        return True
         
-        # Calculate direction
-        dx = target_x - x
-        dy = target_y - y
-        distance = math.sqrt(dx**2 + dy**2)
-        if distance > 0:
-            self.dx = (dx / distance) * self.speed
-            self.dy = (dy / distance) * self.speed
-        else:
-            self.dx = 0
-            self.dy = -self.speed
-            
     def update(self):
-        if self.active:
-            self.x += self.dx
-            self.y += self.dy
+        """Grow every explosion, dropping those that reached full size"""
+        n = self.n
+        radius = self.radius[:n]
+        radius += self.GROWTH_RATE
+        alive = radius < self.MAX_RADIUS
+        count = int(np.count_nonzero(alive))
+        if count < n:
+            for column in (self.x, self.y, self.radius):
+                column[:count] = column[:n][alive]
+            self.n = count
             
-            # Check if missile has gone off screen
-            if self.y < 0:
-                self.active = False
-                
     def draw(self, screen):
-        if self.active:
-            # Missile body
-            pygame.draw.line(screen, GREEN, (self.x, self.y), (self.x, self.y + 10), 3)
-            # Missile tip
-            pygame.draw.polygon(screen, GREEN, [
-                (self.x, self.y + 10),
-                (self.x - 3, self.y + 15),
-                (self.x + 3, self.y + 15)
-            ])
-            # Trail
-            for i in range(3):
-                trail_y = self.y - 5 - i * 3
-                pygame.draw.circle(screen, YELLOW, (int(self.x), int(trail_y)), 1)
+        n = self.n
+        for x, y, radius in zip(self.x[:n].tolist(), self.y[:n].tolist(), self.radius[:n].tolist()):
+            pygame.draw.circle(screen, YELLOW, (int(x), int(y)), int(radius))
+            pygame.draw.circle(screen, ORANGE, (int(x), int(y)), int(radius * 0.7))
+            pygame.draw.circle(screen, RED, (int(x), int(y)), int(radius * 0.4))
 
-class Explosion:
-    def __init__(self, x: int, y: int):
-        self.x = x
-        self.y = y
-        self.radius = 5
-        self.max_radius = 30
-        self.active = True
-        self.growth_rate = 2
+class CachedText:
+    # A label whose surface is re-rendered only when its value changes
+    def __init__(self, font: pygame.font.Font, template: str, color: Tuple[int, int, int]):
+        self.font = font
+        self.template = template
+        self.color = color
+        self._last = None
+        self._surf = None
         
-    def update(self):
-        if self.active:
-            self.radius += self.growth_rate
-            if self.radius >= self.max_radius:
-                self.active = False
-                
-    def draw(self, screen):
-        if self.active:
-            pygame.draw.circle(screen, YELLOW, (int(self.x), int(self.y)), int(self.radius))
-            pygame.draw.circle(screen, ORANGE, (int(self.x), int(self.y)), int(self.radius * 0.7))
-            pygame.draw.circle(screen, RED, (int(self.x), int(self.y)), int(self.radius * 0.4))
+    def get(self, value) -> pygame.Surface:
+        """Return the label for value, rendering it only if value changed"""
+        if self._surf is None or value != self._last:
+            self._surf = self.font.render(self.template.format(value), True, self.color)
+            self._last = value
+        return self._surf
 
 class MissileDefense:
     def __init__(self):
@@ -187,14 +272,21 @@ class MissileDefense:
             self.cities.append(City(x, y))
             
         # Missiles
-        self.enemy_missiles = []
-        self.player_missiles = []
-        self.explosions = []
+        self.enemy_missiles = MissileSystem()
+        self.player_missiles = MissileSystem()
+        self.explosions = ExplosionSystem()
         
         # Player launcher
         self.launcher_x = SCREEN_WIDTH // 2
         self.launcher_y = SCREEN_HEIGHT - 20
         
+        # Static scenery: the night sky with the launcher on it, blitted
+        # whole each frame instead of a fill plus launcher draws
+        self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.background.fill(BLACK)
+        pygame.draw.rect(self.background, BLUE, (self.launcher_x - 15, self.launcher_y - 10, 30, 20))
+        pygame.draw.rect(self.background, WHITE, (self.launcher_x - 5, self.launcher_y - 15, 10, 10))
+        
         # Game timing
         self.missile_spawn_timer = 0
         self.missile_spawn_delay = 120  # frames between missile spawns
@@ -202,6 +294,15 @@ class MissileDefense:
         # Font
         self.font = pygame.font.Font(None, 36)
         
+        # UI text: numeric labels re-render only when their value changes,
+        # fixed strings are rendered once here
+        self.score_text = CachedText(self.font, "Score: {}", WHITE)
+        self.level_text = CachedText(self.font, "Level: {}", WHITE)
+        self.lives_text = CachedText(self.font, "Lives: {}", WHITE)
+        self.final_score_text = CachedText(self.font, "Final Score: {}", WHITE)
+        self.game_over_text = self.font.render("GAME OVER", True, RED)
+        self.restart_text = self.font.render("Press R to restart", True, WHITE)
+        
     def spawn_enemy_missile(self):
         """Spawn a new enemy missile targeting a random city"""
         if not self.cities:
@@ -221,7 +322,8 @@ class MissileDefense:
         target_y = target_city.y
         
         speed = 1.5 + (self.level * 0.2)  # Speed increases with level
-        self.enemy_missiles.append(Missile(start_x, start_y, target_x, target_y, speed))
+        dx, dy = aim(start_x, start_y, target_x, target_y, speed, speed)
+        self.enemy_missiles.spawn(start_x, start_y, dx, dy, target_y)
         
     def handle_input(self):
         """Handle player input"""
@@ -232,9 +334,9 @@ class MissileDefense:
                 if event.button == 1:  # Left click
                     # Launch missile at mouse position
                     mouse_x, mouse_y = pygame.mouse.get_pos()
-                    self.player_missiles.append(PlayerMissile(
-                        self.launcher_x, self.launcher_y, mouse_x, mouse_y
-                    ))
+                    dx, dy = aim(self.launcher_x, self.launcher_y, mouse_x, mouse_y,
+                                 PlayerMissile.SPEED, -PlayerMissile.SPEED)
+                    self.player_missiles.spawn(self.launcher_x, self.launcher_y, dx, dy)
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_r and self.game_over:
                     self.__init__()  # Restart game
@@ -252,55 +354,37 @@ class MissileDefense:
             # Decrease spawn delay as level increases
             self.missile_spawn_delay = max(30, 120 - (self.level * 10))
             
-        # Update enemy missiles
-        for missile in self.enemy_missiles[:]:
-            missile.update()
-            if not missile.active:
-                self.enemy_missiles.remove(missile)
-                # Check if missile hit a city
-                for city in self.cities:
-                    if (missile.x >= city.x and missile.x <= city.x + city.width and
-                        missile.y >= city.y and missile.y <= city.y + city.height and
-                        not city.destroyed):
-                        city.destroyed = True
-                        self.lives -= 1
-                        if self.lives <= 0:
-                            self.game_over = True
-                        break
-                        
-        # Update player missiles
-        for missile in self.player_missiles[:]:
-            missile.update()
-            if not missile.active:
-                self.player_missiles.remove(missile)
-                
         # Update explosions
-        for explosion in self.explosions[:]:
-            explosion.update()
-            if not explosion.active:
-                self.explosions.remove(explosion)
+        self.explosions.update()
                 
-        # Check collisions between player missiles and enemy missiles
-        for player_missile in self.player_missiles[:]:
-            if not player_missile.active:
-                continue
-            for enemy_missile in self.enemy_missiles[:]:
-                if not enemy_missile.active:
-                    continue
-                    
-                distance = math.sqrt((player_missile.x - enemy_missile.x)**2 + 
-                                   (player_missile.y - enemy_missile.y)**2)
-                                   
-                if distance < player_missile.explosion_radius:
-                    # Create explosion
-                    self.explosions.append(Explosion(enemy_missile.x, enemy_missile.y))
-                    # Destroy both missiles
-                    player_missile.active = False
-                    enemy_missile.active = False
-                    # Add score
-                    self.score += 100
+        # Move both sides and resolve interceptions in one pass
+        enemies = self.enemy_missiles
+        players = self.player_missiles
+        n_enemy, n_player = enemies.n, players.n
+        landings, intercepts, enemy_alive, player_alive = step(
+            enemies.x[:n_enemy], enemies.y[:n_enemy], enemies.dx[:n_enemy], enemies.dy[:n_enemy],
+            enemies.target_y[:n_enemy], players.x[:n_player], players.y[:n_player],
+            players.dx[:n_player], players.dy[:n_player],
+            PlayerMissile.HIT_R2)
+        enemies.keep(enemy_alive)
+        players.keep(player_alive)
+        
+        # Check if landed missiles hit a city
+        for x, y in landings:
+            for city in self.cities:
+                if not city.destroyed and city.rect.collidepoint(x, y):
+                    city.destroyed = True
+                    self.lives -= 1
+                    if self.lives <= 0:
+                        self.game_over = True
                     break
                     
+        for x, y in intercepts:
+            # Create explosion
+            self.explosions.spawn(x, y)
+            # Add score
+            self.score += 100
+            
         # Check if all cities are destroyed
         if all(city.destroyed for city in self.cities):
             self.game_over = True
@@ -311,32 +395,29 @@ class MissileDefense:
             
     def draw(self):
         """Draw the game"""
-        self.screen.fill(BLACK)
+        self.screen.blit(self.background, (0, 0))
         
         # Draw cities
         for city in self.cities:
             city.draw(self.screen)
             
         # Draw enemy missiles
-        for missile in self.enemy_missiles:
-            missile.draw(self.screen)
+        enemies = self.enemy_missiles
+        for x, y in zip(enemies.x[:enemies.n].tolist(), enemies.y[:enemies.n].tolist()):
+            Missile.draw(self.screen, x, y)
             
         # Draw player missiles
-        for missile in self.player_missiles:
-            missile.draw(self.screen)
+        players = self.player_missiles
+        for x, y in zip(players.x[:players.n].tolist(), players.y[:players.n].tolist()):
+            PlayerMissile.draw(self.screen, x, y)
             
         # Draw explosions
-        for explosion in self.explosions:
-            explosion.draw(self.screen)
+        self.explosions.draw(self.screen)
             
-        # Draw launcher
-        pygame.draw.rect(self.screen, BLUE, (self.launcher_x - 15, self.launcher_y - 10, 30, 20))
-        pygame.draw.rect(self.screen, WHITE, (self.launcher_x - 5, self.launcher_y - 15, 10, 10))
-        
         # Draw UI
-        score_text = self.font.render(f"Score: {self.score}", True, WHITE)
-        level_text = self.font.render(f"Level: {self.level}", True, WHITE)
-        lives_text = self.font.render(f"Lives: {self.lives}", True, WHITE)
+        score_text = self.score_text.get(self.score)
+        level_text = self.level_text.get(self.level)
+        lives_text = self.lives_text.get(self.lives)
         
         self.screen.blit(score_text, (10, 10))
         self.screen.blit(level_text, (10, 50))
@@ -344,12 +425,10 @@ class MissileDefense:
         
         # Draw game over screen
         if self.game_over:
-            game_over_text = self.font.render("GAME OVER", True, RED)
-            restart_text = self.font.render("Press R to restart", True, WHITE)
-            final_score_text = self.font.render(f"Final Score: {self.score}", True, WHITE)
+            final_score_text = self.final_score_text.get(self.score)
             
-            self.screen.blit(game_over_text, (SCREEN_WIDTH//2 - 100, SCREEN_HEIGHT//2 - 50))
-            self.screen.blit(restart_text, (SCREEN_WIDTH//2 - 100, SCREEN_HEIGHT//2))
+            self.screen.blit(self.game_over_text, (SCREEN_WIDTH//2 - 100, SCREEN_HEIGHT//2 - 50))
+            self.screen.blit(self.restart_text, (SCREEN_WIDTH//2 - 100, SCREEN_HEIGHT//2))
             self.screen.blit(final_score_text, (SCREEN_WIDTH//2 - 100, SCREEN_HEIGHT//2 + 50))
             
         pygame.display.flip()